@@ -0,0 +1,149 @@
+"""
+Aho-Corasick para buscar muchos patrones en una sola pasada.
+
+El trie se construye con Automata/AutomataState; luego se calculan los enlaces
+de falla y se compila a una tabla goto densa (CompiledDFA) más enlaces de salida.
+"""
+from array import array
+
+from algorithms.results import check_mode, collect
+from algorithms.symbols import byte_view, is_bytes_like
+from automata.automata import Automata
+from automata.compiled_dfa import CompiledDFA
+
+
+def build_trie(patterns: list) -> tuple['Automata', list[list[int]]]:
+    """
+    Construye el trie de los patrones. El estado "q_i" es el i-ésimo nodo creado.
+
+    :param patterns: List of non-empty patterns
+    :return: The trie and, for each state, the ids of the patterns that end there
+    """
+    children: list[dict] = [{}]
+    ends: list[list[int]] = [[]]
+    edges = []
+    for pattern_id, pattern in enumerate(patterns):
+        if len(pattern) == 0:
+            raise ValueError("Patterns must be non-empty.")
+        node = 0
+        for symbol in pattern:
+            nxt = children[node].get(symbol)
+            if nxt is None:
+                nxt = len(children)
+                children[node][symbol] = nxt
+                children.append({})
+                ends.append([])
+                edges.append((f"q_{node}", symbol, f"q_{nxt}"))
+            node = nxt
+        ends[node].append(pattern_id)
+
+    alphabet = sorted({symbol for pattern in patterns for symbol in pattern})
+    trie = Automata.from_edges(states=[f"q_{i}" for i in range(len(children))],
+                               edges=edges,
+                               initial="q_0",
+                               finals=[f"q_{i}" for i in range(len(children)) if ends[i]],
+                               alphabet=alphabet)
+    return trie, ends
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton over a list of patterns.
+
+    Example of usage:
+    ac = AhoCorasick(["ACG", "CGT", "G"])
+    ac.search("ACGT")  # [(0, 0), (2, 2), (1, 1)]
+    """
+
+    def __init__(self, patterns: list):
+        if not patterns:
+            raise ValueError("At least one pattern is required.")
+        self.patterns = list(patterns)
+        self.trie, ends = build_trie(self.patterns)
+
+        states = self.trie.states
+        ids = {s.name: i for i, s in enumerate(states)}
+        symbols = [sym for sym in self.trie.alphabet if sym != self.trie.epsilon]
+        k = len(symbols)
+        n = len(states)
+
+        # Tabla goto completa: las transiciones faltantes siguen el enlace de falla
+        goto = array("i", [0]) * (n * k)
+        fail = [0] * n
+        out_link = array("i", [-1]) * n
+        order = [0]
+        for c, symbol in enumerate(symbols):
+            child = states[0].transitions.get(symbol)
+            if child is not None:
+                goto[c] = ids[child.name]
+                order.append(ids[child.name])
+        head = 1
+        while head < len(order):
+            s = order[head]
+            head += 1
+            f = fail[s]
+            # enlace de salida: el estado más cercano por fallas que termina un patrón
+            out_link[s] = f if ends[f] else out_link[f]
+            for c, symbol in enumerate(symbols):
+                child = states[s].transitions.get(symbol)
+                if child is None:
+                    goto[s * k + c] = goto[f * k + c]
+                else:
+                    t = ids[child.name]
+                    goto[s * k + c] = t
+                    fail[t] = goto[f * k + c]
+                    order.append(t)
+
+        accepting = bytearray(n)
+        for s in range(n):
+            if ends[s] or out_link[s] >= 0:
+                accepting[s] = 1
+        self.goto = CompiledDFA([s.name for s in states], symbols, goto, accepting)
+        self.outputs = [tuple(e) for e in ends]
+        self.out_link = out_link
+        self._bytes_twin = None
+
+    def search(self, text, mode: str = "list", k: int = None):
+        """
+        Reports (pattern_id, position) for every occurrence, in one left-to-right pass.
+        Positions are 0-based start offsets, like kmp_search.
+        'mode' and 'k' select the result form (see algorithms.results; no "array").
+        """
+        check_mode(mode, k, pairs=True)
+        text = byte_view(text)
+        if is_bytes_like(text) and isinstance(self.patterns[0], str):
+            if self._bytes_twin is None:
+                self._bytes_twin = AhoCorasick([p.encode() for p in self.patterns])
+            return self._bytes_twin.search(text, mode, k)
+        return collect(self._positions(text), mode, k)
+
+    def _positions(self, text):
+        table = self.goto.table
+        symbol_index = self.goto.symbol_index
+        k = self.goto.num_symbols
+        accepting = self.goto.accepting
+        outputs = self.outputs
+        out_link = self.out_link
+        lengths = [len(p) for p in self.patterns]
+
+        state = 0
+        for i in range(len(text)):
+            c = symbol_index.get(text[i])
+            if c is None:
+                # símbolo fuera del alfabeto: ningún patrón puede cruzarlo
+                state = 0
+                continue
+            state = table[state * k + c]
+            if accepting[state]:
+                s = state
+                while s >= 0:
+                    for pattern_id in outputs[s]:
+                        yield pattern_id, i - lengths[pattern_id] + 1
+                    s = out_link[s]
+
+
+def aho_corasick(text, patterns: list, mode: str = "list", k: int = None):
+    """
+    Searches every pattern in 'text' at once. Returns (pattern_id, position) pairs.
+    """
+    return AhoCorasick(patterns).search(text, mode, k)
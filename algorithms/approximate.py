@@ -0,0 +1,242 @@
+"""
+Búsqueda aproximada bit-paralela.
+
+- hamming_search: ocurrencias con a lo más k sustituciones. Wu-Manber sobre Shift-Or:
+  un vector R_e por cantidad de errores e = 0..k.
+- levenshtein_search: ocurrencias con a lo más k ediciones. Vector de bits de Myers,
+  cuyo costo por carácter no depende de k.
+
+Ambos simulan el NFA de búsqueda aproximada (tests/helpers.py lo construye como
+oráculo): el estado (i, e), i símbolos del patrón leídos con e errores, es el bit i
+del vector e (en Myers, implícito en las diferencias verticales de la columna de
+programación dinámica).
+
+Con method="auto" se filtra primero por el principio del palomar: una ocurrencia con a
+lo más k errores contiene exacto alguno de los k+1 trozos del patrón. Los trozos se
+buscan juntos con Set-BDM y la verificación bit-paralela corre solo sobre las regiones
+candidatas. El resultado es idéntico al de method="scan", que recorre todo el texto.
+"""
+from algorithms.results import check_mode, collect
+from algorithms.set_backwards_dawg_matching import set_backwards_dawg_matching
+from algorithms.symbols import BYTE_ALPHABET_SIZE, as_symbols, symbol_codes, symbol_iter
+
+METHODS = ("auto", "filter", "scan")
+# Largo mínimo de los trozos para que el filtro convenga (más cortos: demasiados candidatos)
+FILTER_MIN_PIECE = 8
+
+
+def _match_masks(pattern_codes, size: int, shift_or: bool = False):
+    """
+    Bit i of mask[c] is set if p_i = c (cleared instead, with shift_or=True).
+    Returns a lookup function over a list indexed by code for bytes, or over a dict.
+    """
+    m = len(pattern_codes)
+    full = (1 << m) - 1
+    masks = {}
+    for i in range(m):
+        c = pattern_codes[i]
+        masks[c] = masks.get(c, 0) | (1 << i)
+    default = full if shift_or else 0
+    if shift_or:
+        masks = {c: full ^ mask for c, mask in masks.items()}
+    if size == BYTE_ALPHABET_SIZE:
+        table = [default] * size
+        for c, mask in masks.items():
+            table[c] = mask
+        return table.__getitem__
+    get = masks.get
+    return lambda c: get(c, default)
+
+
+def _prepare(text, pattern, max_errors: int, method: str):
+    if max_errors < 0:
+        raise ValueError("The number of errors must be non-negative.")
+    if method not in METHODS:
+        raise ValueError(f"Unknown method '{method}', expected one of {list(METHODS)}.")
+    text, pattern = as_symbols(text, pattern)
+    wide = isinstance(text, str) and not (text.isascii() and pattern.isascii())
+    pattern_codes, size = symbol_codes(pattern, wide=wide)
+    m = len(pattern)
+    pieces = max_errors + 1
+    use_filter = method == "filter" or (method == "auto" and m // pieces >= FILTER_MIN_PIECE)
+    if use_filter and m < pieces:
+        raise ValueError("method='filter' needs a pattern longer than the number of errors.")
+    return text, pattern, wide, pattern_codes, size, use_filter
+
+
+def _pieces(pattern, max_errors: int):
+    """Splits the pattern into max_errors + 1 pieces; returns (pieces, start offsets)."""
+    m = len(pattern)
+    bounds = [m * i // (max_errors + 1) for i in range(max_errors + 2)]
+    return [pattern[a:b] for a, b in zip(bounds, bounds[1:])], bounds
+
+
+# --- Hamming --- #
+
+def hamming_search(text, pattern, max_mismatches: int, method: str = "auto",
+                   mode: str = "list", k: int = None):
+    """
+    Finds the windows of 'text' at Hamming distance at most 'max_mismatches' from
+    'pattern'. Returns (position, distance) pairs with 0-based start positions, in order.
+    'mode' and 'k' select the result form (see algorithms.results; no "array").
+
+    :param method: "scan" (Wu-Manber over the whole text), "filter" (pigeonhole
+        filter plus bit-parallel verification) or "auto" (filter when the pieces are
+        long enough)
+
+    Example of usage:
+    result = hamming_search("ACGTTCGT", "ACGA", 1)  # [(0, 1)]
+    """
+    check_mode(mode, k, pairs=True)
+    text, pattern, wide, pattern_codes, size, use_filter = _prepare(text, pattern, max_mismatches, method)
+    m = len(pattern)
+    if m == 0 or m > len(text):
+        return collect(iter(()), mode, k)
+    if use_filter:
+        positions = _hamming_filter(text, pattern, wide, pattern_codes, max_mismatches)
+    else:
+        codes, _ = symbol_iter(text, wide=wide)
+        positions = _hamming_scan(codes, m, _match_masks(pattern_codes, size, shift_or=True), max_mismatches)
+    return collect(positions, mode, k)
+
+
+def _hamming_scan(codes, m: int, lookup, max_mismatches: int):
+    full = (1 << m) - 1
+    high = 1 << (m - 1)
+    # Convención de Shift-Or: un bit en 0 es un estado activo
+    rows = [full] * (max_mismatches + 1)
+    errors = range(1, max_mismatches + 1)
+    for i, c in enumerate(codes):
+        b = lookup(c)
+        previous = rows[0]
+        rows[0] = ((previous << 1) | b) & full
+        for e in errors:
+            current = rows[e]
+            # coincidencia desde (i, e) o sustitución desde (i, e-1)
+            rows[e] = ((current << 1) | b) & (previous << 1) & full
+            previous = current
+        if not rows[-1] & high:
+            e = 0
+            while rows[e] & high:
+                e += 1
+            yield i - m + 1, e
+
+
+def _hamming_filter(text, pattern, wide: bool, pattern_codes, max_mismatches: int):
+    m = len(pattern)
+    n = len(text)
+    pieces, bounds = _pieces(pattern, max_mismatches)
+    candidates = set()
+    for piece_id, pos in set_backwards_dawg_matching(pieces, text, mode="iter"):
+        s = pos - bounds[piece_id]
+        if 0 <= s <= n - m:
+            candidates.add(s)
+
+    # Verificación bit-paralela: XOR de la ventana con el patrón y se cuentan los
+    # símbolos distintos de cero plegando los bits de cada símbolo sobre su bit bajo.
+    if isinstance(text, str):
+        # Solo se codifica cada ventana candidata, con el mismo ancho que el patrón
+        window = lambda s: symbol_codes(text[s:s + m], wide=wide)[0]
+    else:
+        codes, _ = symbol_codes(text)  # vista sin copia
+        window = lambda s: codes[s:s + m]
+    width = getattr(pattern_codes, "itemsize", 1)
+    target = int.from_bytes(pattern_codes, "little")
+    low = int.from_bytes((b"\x01" + bytes(width - 1)) * m, "little")
+    folds = []
+    shift = 4 * width
+    while shift:
+        folds.append(shift)
+        shift //= 2
+    for s in sorted(candidates):
+        x = int.from_bytes(window(s), "little") ^ target
+        for shift in folds:
+            x |= x >> shift
+        distance = (x & low).bit_count()
+        if distance <= max_mismatches:
+            yield s, distance
+
+
+# --- Levenshtein --- #
+
+def levenshtein_search(text, pattern, max_edits: int, method: str = "auto",
+                       mode: str = "list", k: int = None):
+    """
+    Finds the substrings of 'text' at edit distance at most 'max_edits' from 'pattern'.
+    Returns (position, distance) pairs where position is the 0-based index of the last
+    symbol of the occurrence and distance is the minimum over all occurrences ending
+    there. Pairs come in increasing position order.
+    'mode' and 'k' select the result form (see algorithms.results; no "array").
+
+    :param method: "scan" (Myers over the whole text), "filter" (pigeonhole filter
+        plus Myers over the candidate regions) or "auto" (filter when the pieces are
+        long enough)
+
+    Example of usage:
+    result = levenshtein_search("ACGTTCGT", "ACGA", 1)  # [(2, 1), (3, 1)]
+    """
+    check_mode(mode, k, pairs=True)
+    text, pattern, wide, pattern_codes, size, use_filter = _prepare(text, pattern, max_edits, method)
+    m = len(pattern)
+    if m == 0:
+        return collect(iter(()), mode, k)
+    lookup = _match_masks(pattern_codes, size)
+    if use_filter:
+        positions = _levenshtein_filter(text, pattern, wide, lookup, max_edits)
+    else:
+        positions = _myers_scan(symbol_iter(text, wide=wide)[0], m, lookup, max_edits)
+    return collect(positions, mode, k)
+
+
+def _myers_scan(codes, m: int, lookup, max_edits: int, start: int = 0):
+    """
+    Myers' bit-vector over the iterable 'codes', whose first code is at text position
+    'start'. Pv/Mv are the +1/-1 vertical differences of the current column; score is
+    the distance at the last row.
+    """
+    full = (1 << m) - 1
+    high = 1 << (m - 1)
+    pv = full
+    mv = 0
+    score = m
+    for j, c in enumerate(codes, start):
+        eq = lookup(c)
+        xv = eq | mv
+        xh = ((((eq & pv) + pv) ^ pv) | eq) & full
+        ph = mv | (full ^ (xh | pv))
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        # Búsqueda: la fila 0 vale 0 en todas las columnas, así que no entra un 1 por abajo
+        ph = (ph << 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (full ^ (xv | ph))
+        mv = ph & xv
+        if score <= max_edits:
+            yield j, score
+
+
+def _levenshtein_filter(text, pattern, wide: bool, lookup, max_edits: int):
+    m = len(pattern)
+    n = len(text)
+    pieces, bounds = _pieces(pattern, max_edits)
+    # Toda ocurrencia que contiene el trozo exacto en pos cabe en
+    # [pos - offset - k, pos - offset + m + k)
+    windows = sorted({(max(0, pos - bounds[piece_id] - max_edits),
+                       min(n, pos - bounds[piece_id] + m + max_edits))
+                      for piece_id, pos in set_backwards_dawg_matching(pieces, text, mode="iter")})
+    # Las ventanas que se solapan se unen en una sola región, que se recorre una vez
+    region_start = region_end = None
+    for start, end in windows:
+        if region_end is not None and start <= region_end:
+            region_end = max(region_end, end)
+            continue
+        if region_end is not None:
+            yield from _myers_scan(symbol_iter(text, wide, region_start, region_end)[0],
+                                  m, lookup, max_edits, region_start)
+        region_start, region_end = start, end
+    if region_end is not None:
+        yield from _myers_scan(symbol_iter(text, wide, region_start, region_end)[0],
+                                  m, lookup, max_edits, region_start)
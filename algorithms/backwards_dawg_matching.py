@@ -1,23 +1,45 @@
 from algorithms.dawg import dawg
+from algorithms.results import check_mode, collect
+from algorithms.symbols import as_symbols
+from automata.compiled_dfa import CompiledDFA
 
-def backwards_dawg_matching(pattern: str, text: str) -> list[int]:
+
+def reversed_dawg(pattern: str) -> 'CompiledDFA':
+    """
+    Preprocesamiento de BDM: DAWG del patrón invertido, compilado a tabla plana.
+    """
+    return dawg(pattern[::-1]).compile()
+
+def backwards_dawg_matching(pattern: str, text: str, dawg_pr: CompiledDFA = None,
+                            mode: str = "list", k: int = None):
     """
     Implementación del algoritmo BDM para encontrar todas las ocurrencias
     de 'pattern' en 'text'.
     Las ocurrencias se reportan con índice base 1.
+    Si se entrega dawg_pr (de reversed_dawg), se omite el preprocesamiento.
+    'mode' y 'k' eligen la forma del resultado (ver algorithms.results).
     """
+    check_mode(mode, k)
+    text, pattern = as_symbols(text, pattern)
     m = len(pattern)
     n = len(text)
-    occurrences = []
 
     if m == 0: # El patrón es vacío
-        return list(range(1, n + 2))
+        return collect(iter(range(1, n + 2)), mode, k)
     if m > n: # El patrón es más largo que el texto
-        return []
+        return collect(iter(()), mode, k)
 
     # --- Preprocesamiento --- #
-    pr = pattern[::-1]
-    dawg_pr = dawg(pr) # Construcción del DAWG para el patrón invertido
+    if dawg_pr is None:
+        dawg_pr = reversed_dawg(pattern) # DAWG del patrón invertido
+    return collect(_bdm_positions(text, m, dawg_pr), mode, k)
+
+def _bdm_positions(text, m: int, dawg_pr: CompiledDFA):
+    n = len(text)
+    table = dawg_pr.table
+    symbol_index = dawg_pr.symbol_index
+    k = dawg_pr.num_symbols
+    accepting = dawg_pr.accepting
 
     # --- Búsqueda ---
     pos = 0 # indice base 0 para la posición de inicio de la ventana en el texto
@@ -25,34 +47,26 @@ def backwards_dawg_matching(pattern: str, text: str) -> list[int]:
         j = m
         last = m # Valor de desplazamiento por defecto
 
-        current_dawg_state_idx = dawg_pr.initial_state.name # estado <- D.q0
-        while True:
-            # Si current_dawg_state_idx es None, la transición anterior falló.
-            if current_dawg_state_idx is None:
+        state = 0 # estado <- D.q0
+        while j > 0:
+            # Un símbolo fuera del alfabeto del patrón no tiene transición.
+            c = symbol_index.get(text[pos + j - 1])
+            if c is None:
                 break
-
-            if j == 0:
-                break
-
-            char_from_text = text[pos + j - 1]
             # estado <- D.delta(estado, t_pos+j)
-            current_dawg_state_idx = dawg_pr.get_transition_idx(current_dawg_state_idx, char_from_text)
+            state = table[state * k + c]
 
             # j <- j-1
             j -= 1
 
-            if current_dawg_state_idx is None:
+            if state < 0:
                 break
 
-                # Si estado ∈ D.F entonces:
-            if dawg_pr.is_accepting_state(current_dawg_state_idx):
+            # Si estado ∈ D.F entonces:
+            if accepting[state]:
                 if j > 0: # Si j > 0 entonces last <- j
                     last = j
                 else:
-                    occurrences.append(pos + 1)
-            if j == 0 and current_dawg_state_idx is not None:
-                break
+                    yield pos + 1
 
         pos += last
-
-    return occurrences
\ No newline at end of file
@@ -0,0 +1,72 @@
+from algorithms.results import check_mode, collect
+from algorithms.symbols import BYTE_ALPHABET_SIZE, as_symbols, symbol_codes
+
+
+def bndm_masks(pattern, wide: bool = False):
+    """
+    Máscaras de BNDM: el bit m-1-i de B[c] está prendido si p_i = c.
+    Con enteros de Python las máscaras no tienen límite de largo (m > 64 usa big ints).
+    Para símbolos de un byte se entrega una lista indexada por código; si no, un dict.
+    """
+    pattern_codes, size = symbol_codes(pattern, wide=wide)
+    m = len(pattern_codes)
+    masks = {}
+    for i in range(m):
+        c = pattern_codes[i]
+        masks[c] = masks.get(c, 0) | (1 << (m - 1 - i))
+    if size == BYTE_ALPHABET_SIZE:
+        table = [0] * size
+        for c, mask in masks.items():
+            table[c] = mask
+        return table
+    return masks
+
+
+def bndm(text, pattern, masks=None, mode: str = "list", k: int = None):
+    """
+    Backward Nondeterministic DAWG Matching: simula el DAWG de BDM con un vector
+    de bits por ventana. Las ocurrencias se reportan con índice base 1, igual que
+    backwards_dawg_matching. Si se entrega masks (de bndm_masks), se omite el preprocesamiento.
+    'mode' y 'k' eligen la forma del resultado (ver algorithms.results).
+    """
+    check_mode(mode, k)
+    text, pattern = as_symbols(text, pattern)
+    m = len(pattern)
+    n = len(text)
+    if m == 0: # El patrón es vacío
+        return collect(iter(range(1, n + 2)), mode, k)
+    if m > n:
+        return collect(iter(()), mode, k)
+
+    wide = isinstance(text, str) and not (text.isascii() and pattern.isascii())
+    text, size = symbol_codes(text, wide=wide)
+    if masks is None or (size != BYTE_ALPHABET_SIZE and isinstance(masks, list)):
+        masks = bndm_masks(pattern, wide=wide)
+    if isinstance(masks, dict):
+        get = masks.get
+        lookup = lambda c: get(c, 0)
+    else:
+        lookup = masks.__getitem__
+    return collect(_bndm_positions(text, m, lookup), mode, k)
+
+def _bndm_positions(text, m: int, lookup):
+    n = len(text)
+    full = (1 << m) - 1
+    high = 1 << (m - 1)
+    pos = 0
+    while pos <= n - m:
+        j = m
+        last = m
+        d = full
+        while d:
+            d &= lookup(text[pos + j - 1])
+            j -= 1
+            if d & high:
+                if j > 0:
+                    # text[pos+j : pos+m] es prefijo del patrón
+                    last = j
+                else:
+                    yield pos + 1
+                    break
+            d = (d << 1) & full
+        pos += last
@@ -1,6 +1,22 @@
 """
+Boyer-Moore and its variants, selected with variant=:
 
+- "bad_character": bad-character rule only (the original implementation).
+- "full": bad-character rule plus the strong good-suffix rule and the Galil rule,
+  linear in the worst case.
+- "horspool": Horspool shift on the last character of the window.
+- "sunday": Sunday (quick search) shift on the character after the window.
+
+Every shift table is an array('i') indexed by symbol code (see symbol_codes); for
+code points (non-ASCII str) it is a ShiftMap that only stores the pattern's symbols.
 """
+import copy
+from array import array
+
+from algorithms.results import check_mode, collect
+from algorithms.symbols import BYTE_ALPHABET_SIZE, UNICODE_ALPHABET_SIZE, as_symbols, symbol_codes
+
+VARIANTS = ("bad_character", "full", "horspool", "sunday")
 
 
 def bad_character_table(pattern):
@@ -10,21 +26,159 @@ def bad_character_table(pattern):
         table[pattern[i]] = i
     return table
 
-def boyer_moore(text, pattern) -> list[int]:
+class ShiftMap(dict):
+    """
+    Shift table over code points: only the symbols of the pattern are stored and
+    any other symbol gets 'default', so it is indexed exactly like the arrays.
+    """
+    __slots__ = ("default",)
+
+    def __init__(self, entries, default: int):
+        super().__init__(entries)
+        self.default = default
+
+    def __missing__(self, c):
+        return self.default
+
+
+def _shift_table(entries: dict, default: int, size: int):
+    """An array('i') of 'size' filled with 'default' and 'entries', or a ShiftMap for code points."""
+    if size > BYTE_ALPHABET_SIZE:
+        return ShiftMap(entries, default)
+    table = array("i", [default]) * size
+    for c, shift in entries.items():
+        table[c] = shift
+    return table
+
+def _widen(table, default: int) -> ShiftMap:
+    """ShiftMap with the same shifts as a byte-indexed table."""
+    return ShiftMap({c: shift for c, shift in enumerate(table) if shift != default}, default)
+
+def bad_character_array(pattern_codes, size: int):
+    """Bad character table indexed by symbol code: last position of each symbol, or -1."""
+    return _shift_table({pattern_codes[i]: i for i in range(len(pattern_codes))}, -1, size)
+
+def good_suffix_table(pattern_codes) -> array:
+    """
+    Strong good-suffix shifts. shift[j+1] is the shift when pattern[j] mismatches
+    after pattern[j+1:] matched; shift[0] is the period of the pattern.
+    """
+    m = len(pattern_codes)
+    shift = array("i", [0]) * (m + 1)
+    border = array("i", [0]) * (m + 1)
+    i = m
+    j = m + 1
+    border[i] = j
+    while i > 0:
+        while j <= m and pattern_codes[i - 1] != pattern_codes[j - 1]:
+            if shift[j] == 0:
+                shift[j] = j - i
+            j = border[j]
+        i -= 1
+        j -= 1
+        border[i] = j
+    j = border[0]
+    for i in range(m + 1):
+        if shift[i] == 0:
+            shift[i] = j
+        if i == j:
+            j = border[j]
+    return shift
+
+def horspool_table(pattern_codes, size: int):
+    """Horspool shifts: distance from the last occurrence in pattern[:-1] to the end."""
+    m = len(pattern_codes)
+    return _shift_table({pattern_codes[i]: m - 1 - i for i in range(m - 1)}, m, size)
+
+def sunday_table(pattern_codes, size: int):
+    """Sunday shifts: m - last occurrence of the symbol, or m + 1 if absent."""
+    m = len(pattern_codes)
+    return _shift_table({pattern_codes[i]: m - i for i in range(m)}, m + 1, size)
+
+
+class BoyerMooreTables:
+    """
+    Preprocessed shift tables for one pattern and one variant. They only depend on
+    the pattern: a Unicode text uses widened(), built once and kept here.
+    """
+
+    def __init__(self, pattern, variant: str = "bad_character", wide: bool = False):
+        if variant not in VARIANTS:
+            raise ValueError(f"Unknown variant '{variant}', expected one of {list(VARIANTS)}.")
+        pattern_codes, size = symbol_codes(pattern, wide=wide)
+        self.variant = variant
+        self.size = size
+        self.length = len(pattern_codes)
+        self._widened = None
+        self.bad_char = None
+        self.good_suffix = None
+        self.shift = None
+        if variant in ("bad_character", "full"):
+            self.bad_char = bad_character_array(pattern_codes, size)
+        if variant == "full":
+            self.good_suffix = good_suffix_table(pattern_codes)
+        elif variant == "horspool":
+            self.shift = horspool_table(pattern_codes, size)
+        elif variant == "sunday":
+            self.shift = sunday_table(pattern_codes, size)
+
+    def widened(self) -> 'BoyerMooreTables':
+        """The same tables indexed by code point (self if they already are)."""
+        if self.size > BYTE_ALPHABET_SIZE:
+            return self
+        if self._widened is None:
+            m = self.length
+            wide = copy.copy(self)
+            wide.size = UNICODE_ALPHABET_SIZE
+            if self.bad_char is not None:
+                wide.bad_char = _widen(self.bad_char, -1)
+            if self.shift is not None:
+                wide.shift = _widen(self.shift, m if self.variant == "horspool" else m + 1)
+            self._widened = wide
+        return self._widened
+
+
+def boyer_moore(text, pattern, tables: BoyerMooreTables = None, variant: str = "bad_character",
+                mode: str = "list", k: int = None):
     """
     Searches for occurrences of 'pattern' in 'text' using the Boyer-Moore algorithm.
+    If 'tables' (a BoyerMooreTables) is given, preprocessing is skipped and its
+    variant is used. 'mode' and 'k' select the result form (see algorithms.results).
 
     Example of usage:
     text = "abacaabadcabacabaabb"
     pattern = "abacab"
-    result = boyer_moore(text, pattern)
+    result = boyer_moore(text, pattern, variant="full")
     print("Pattern found at positions:", result)
     """
+    check_mode(mode, k)
+    text, pattern = as_symbols(text, pattern)
     if len(pattern) == 0:
-        return []
+        return collect(iter(()), mode, k)
 
-    bad_char = bad_character_table(pattern)
-    matches = []
+    # Texto y patrón se comparan como códigos enteros del mismo tipo
+    wide = isinstance(text, str) and not (text.isascii() and pattern.isascii())
+    text, size = symbol_codes(text, wide=wide)
+    pattern_codes, _ = symbol_codes(pattern, wide=wide)
+    if tables is None:
+        tables = BoyerMooreTables(pattern, variant, wide=wide)
+    elif tables.size < size:
+        # Tablas de bytes con un texto Unicode: se usan las mismas, indexadas por código
+        tables = tables.widened()
+    pattern = pattern_codes
+
+    if tables.variant == "bad_character":
+        positions = _positions_bad_character(text, pattern, tables.bad_char)
+    elif tables.variant == "full":
+        positions = _positions_full(text, pattern, tables.bad_char, tables.good_suffix)
+    elif tables.variant == "horspool":
+        positions = _positions_horspool(text, pattern, tables.shift)
+    else:
+        positions = _positions_sunday(text, pattern, tables.shift)
+    return collect(positions, mode, k)
+
+
+def _positions_bad_character(text, pattern, bad_char):
     m = len(pattern)
     n = len(text)
     s = 0  # shift of the pattern with respect to text
@@ -37,9 +191,55 @@ def boyer_moore(text, pattern) -> list[int]:
             j -= 1
 
         if j < 0:
-            matches.append(s)
-            s += m - bad_char.get(text[s + m], -1) if s + m < n else 1
+            yield s
+            s += m - bad_char[text[s + m]] if s + m < n else 1
+        else:
+            s += max(1, j - bad_char[text[s + j]])
+
+
+def _positions_full(text, pattern, bad_char, good_suffix):
+    m = len(pattern)
+    n = len(text)
+    period = good_suffix[0]
+    s = 0
+    low = 0  # Galil: pattern[:low] is already known to match in this window
+
+    while s <= n - m:
+        j = m - 1
+        while j >= low and pattern[j] == text[s + j]:
+            j -= 1
+
+        if j < low:
+            yield s
+            # Tras una ocurrencia se salta un periodo y el prefijo m - periodo ya coincide
+            s += period
+            low = m - period
         else:
-            s += max(1, j - bad_char.get(text[s + j], -1))
+            s += max(good_suffix[j + 1], j - bad_char[text[s + j]])
+            low = 0
+
+
+def _positions_horspool(text, pattern, shift):
+    m = len(pattern)
+    n = len(text)
+    last = pattern[m - 1]
+    s = 0
+
+    while s <= n - m:
+        c = text[s + m - 1]
+        if c == last and text[s:s + m] == pattern:
+            yield s
+        s += shift[c]
+
+
+def _positions_sunday(text, pattern, shift):
+    m = len(pattern)
+    n = len(text)
+    s = 0
 
-    return matches
\ No newline at end of file
+    while s <= n - m:
+        if text[s:s + m] == pattern:
+            yield s
+        if s + m >= n:
+            break
+        s += shift[text[s + m]]
@@ -4,22 +4,162 @@ from automata.node import AutomataState
 
 
 def dawg(
-        pattern: str
+        pattern: str,
+        method: str = "online"
 ) -> 'Automata':
     """
     Constructs the DAWG (Deterministic Acyclic Word Graph) for a given pattern p.
-    The DAWG is defined as the DFA resulting from subset construction on the NFA S(p),
-    where S(p) recognizes all suffixes of p (including the empty suffix).
+    The DAWG is the minimal DFA recognizing all suffixes of p (including the empty suffix).
 
     Args:
         :param pattern: The pattern p for which the DAWG is constructed.
+        :param method: "online" builds the suffix automaton directly in O(m) using
+            suffix links; "subset" runs the subset construction on the NFA S(p).
     Returns:
         An instance of AutomataClass representing the DAWG(p).
     """
-    automata = automata_sufijos(pattern)
-    # Convert the automata to a deterministic automata
-    automata.to_deterministic()
-    return automata
+    if method == "online":
+        return dawg_online(pattern)
+    if method == "subset":
+        automata = automata_sufijos(pattern)
+        # Convert the automata to a deterministic automata
+        return automata.to_deterministic()
+    raise ValueError(f"Unknown method '{method}', expected 'online' or 'subset'.")
 
 
+def dawg_online(pattern: str) -> 'Automata':
+    """
+    Construcción en línea del autómata de sufijos (Blumer et al.) en tiempo O(m).
+    Cada estado guarda su largo máximo y su enlace de sufijo; al agregar p_i se
+    recorre la cadena de enlaces desde el último estado, clonando cuando hace falta.
+    """
+    # Estructuras planas indexadas por id de estado; el estado 0 es el inicial.
+    length = [0]
+    link = [-1]
+    nxt: list[dict[str, int]] = [{}]
+    last = 0
+
+    for char in pattern:
+        cur = len(length)
+        length.append(length[last] + 1)
+        link.append(-1)
+        nxt.append({})
+
+        p = last
+        while p != -1 and char not in nxt[p]:
+            nxt[p][char] = cur
+            p = link[p]
+
+        if p == -1:
+            link[cur] = 0
+        else:
+            q = nxt[p][char]
+            if length[p] + 1 == length[q]:
+                link[cur] = q
+            else:
+                # clonamos q para separar las clases de equivalencia
+                clone = len(length)
+                length.append(length[p] + 1)
+                link.append(link[q])
+                nxt.append(dict(nxt[q]))
+                while p != -1 and nxt[p].get(char) == q:
+                    nxt[p][char] = clone
+                    p = link[p]
+                link[q] = clone
+                link[cur] = clone
+        last = cur
+
+    # Los estados finales son los de la cadena de enlaces desde el último estado
+    # (incluye al inicial, que reconoce el sufijo vacío).
+    accepting = [False] * len(length)
+    p = last
+    while p != -1:
+        accepting[p] = True
+        p = link[p]
+
+    states = [AutomataState(name=f"q_{i}", is_accepting=accepting[i]) for i in range(len(length))]
+    transitions = {
+        states[i].name: {symbol: states[j] for symbol, j in nxt[i].items()}
+        for i in range(len(states))
+    }
+    return Automata(states=states,
+                    alphabet=sorted(set(pattern)),
+                    transitions=transitions,
+                    initial_state=states[0],
+                    final_states=[s for s in states if s.is_accepting])
+
+
+def dawg_set(patterns: list) -> 'Automata':
+    """
+    Autómata de sufijos generalizado de un conjunto de patrones, en tiempo O(Σ|p|).
+    Reconoce los sufijos de cualquiera de los patrones (incluido el sufijo vacío).
+    """
+    length = [0]
+    link = [-1]
+    nxt: list[dict] = [{}]
+
+    def new_state(state_len: int, state_link: int, state_next: dict) -> int:
+        length.append(state_len)
+        link.append(state_link)
+        nxt.append(state_next)
+        return len(length) - 1
+
+    lasts = []
+    for pattern in patterns:
+        last = 0
+        for char in pattern:
+            q = nxt[last].get(char)
+            if q is not None:
+                # La transición ya existe por otro patrón: a lo más hay que clonar q
+                if length[last] + 1 == length[q]:
+                    last = q
+                    continue
+                clone = new_state(length[last] + 1, link[q], dict(nxt[q]))
+                p = last
+                while p != -1 and nxt[p].get(char) == q:
+                    nxt[p][char] = clone
+                    p = link[p]
+                link[q] = clone
+                last = clone
+                continue
+
+            cur = new_state(length[last] + 1, -1, {})
+            p = last
+            while p != -1 and char not in nxt[p]:
+                nxt[p][char] = cur
+                p = link[p]
+            if p == -1:
+                link[cur] = 0
+            else:
+                q = nxt[p][char]
+                if length[p] + 1 == length[q]:
+                    link[cur] = q
+                else:
+                    clone = new_state(length[p] + 1, link[q], dict(nxt[q]))
+                    while p != -1 and nxt[p].get(char) == q:
+                        nxt[p][char] = clone
+                        p = link[p]
+                    link[q] = clone
+                    link[cur] = clone
+            last = cur
+        lasts.append(last)
+
+    # Los finales son las cadenas de enlaces desde el último estado de cada patrón
+    accepting = [False] * len(length)
+    accepting[0] = True
+    for last in lasts:
+        p = last
+        while p != -1 and not accepting[p]:
+            accepting[p] = True
+            p = link[p]
 
+    states = [AutomataState(name=f"q_{i}", is_accepting=accepting[i]) for i in range(len(length))]
+    transitions = {
+        states[i].name: {symbol: states[j] for symbol, j in nxt[i].items()}
+        for i in range(len(states))
+    }
+    return Automata(states=states,
+                    alphabet=sorted({symbol for pattern in patterns for symbol in pattern}),
+                    transitions=transitions,
+                    initial_state=states[0],
+                    final_states=[s for s in states if s.is_accepting])
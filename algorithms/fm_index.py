@@ -0,0 +1,142 @@
+"""
+FM-index: BWT del texto con tablas de ocurrencias muestreadas y arreglo de
+sufijos muestreado. count() cuesta O(m) pasos de búsqueda hacia atrás y locate()
+agrega a lo más sa_sample pasos LF por ocurrencia.
+"""
+from array import array
+
+from algorithms.suffix_array import suffix_array
+from algorithms.symbols import as_symbols, symbol_codes
+
+
+class FMIndex:
+    """
+    FM-index of a fixed text. Build it once and reuse it for many patterns.
+
+    Example of usage:
+    index = FMIndex(text)
+    index.count("ACGT")
+    index.locate("ACGT")  # sorted 0-based positions
+    """
+
+    def __init__(self, text, occ_sample: int = 64, sa_sample: int = 32, sa: array = None):
+        """
+        :param text: Text to index
+        :param occ_sample: Distance between occurrence-table checkpoints
+        :param sa_sample: Keep the suffix array entry of every text position multiple of this
+        :param sa: Precomputed suffix array of the text (see suffix_array)
+        """
+        if occ_sample <= 0 or sa_sample <= 0:
+            raise ValueError("occ_sample y sa_sample deben ser positivos")
+        self.text = text
+        codes, size = symbol_codes(text)
+        if size > 256:
+            raise ValueError("FMIndex needs an ASCII str or a bytes-like text.")
+        n = len(codes)
+        if sa is None:
+            sa = suffix_array(text)
+        self.n = n
+        self.occ_sample = occ_sample
+        self.sa_sample = sa_sample
+
+        # BWT de texto + '$'. La fila 0 es el sufijo "$" (posición n); el '$' se
+        # guarda como byte 0 y su fila se descuenta aparte.
+        bwt = bytearray(n + 1)
+        bwt[0] = codes[n - 1] if n else 0
+        dollar_row = 0 if n == 0 else -1
+        for row in range(n):
+            p = sa[row]
+            if p == 0:
+                dollar_row = row + 1
+            else:
+                bwt[row + 1] = codes[p - 1]
+        self.bwt = bytes(bwt)
+        self.dollar_row = dollar_row
+
+        # C[c]: cantidad de símbolos menores que c en texto + '$'
+        counts = [0] * 256
+        for c in range(256):
+            counts[c] = self.bwt.count(c)
+        counts[0] -= 1 # el '$'
+        self.symbols = [c for c in range(256) if counts[c]]
+        self.C = [0] * 257
+        total = 1 # el '$' es el menor
+        for c in range(256):
+            self.C[c] = total
+            total += counts[c]
+
+        # Checkpoints de ocurrencias cada occ_sample filas
+        rows = n + 1
+        self.checkpoints = {}
+        for c in self.symbols:
+            cp = array("i", [0]) * (rows // occ_sample + 1)
+            symbol = bytes([c])
+            acc = 0
+            for b in range(1, len(cp)):
+                acc += self.bwt.count(symbol, (b - 1) * occ_sample, b * occ_sample)
+                cp[b] = acc
+            if c == 0 and 0 <= dollar_row:
+                for b in range(len(cp)):
+                    if dollar_row < b * occ_sample:
+                        cp[b] -= 1
+            self.checkpoints[c] = cp
+
+        # Arreglo de sufijos muestreado: fila -> posición, solo posiciones múltiplo de sa_sample
+        self.sampled_sa = {}
+        for row in range(n):
+            if sa[row] % sa_sample == 0:
+                self.sampled_sa[row + 1] = sa[row]
+
+    def occ(self, c: int, row: int) -> int:
+        """Number of symbols c in bwt[0:row]."""
+        cp = self.checkpoints.get(c)
+        if cp is None:
+            return 0
+        b = row // self.occ_sample
+        start = b * self.occ_sample
+        result = cp[b] + self.bwt.count(bytes([c]), start, row)
+        if c == 0 and start <= self.dollar_row < row:
+            result -= 1
+        return result
+
+    def _range(self, pattern) -> tuple[int, int]:
+        """Rows [sp, ep) of the BWT matrix prefixed by 'pattern' (backward search)."""
+        _, pattern = as_symbols(self.text, pattern)
+        pattern, _ = symbol_codes(pattern)
+        sp, ep = 0, self.n + 1
+        for i in range(len(pattern) - 1, -1, -1):
+            c = pattern[i]
+            if c not in self.checkpoints:
+                return 0, 0
+            sp = self.C[c] + self.occ(c, sp)
+            ep = self.C[c] + self.occ(c, ep)
+            if sp >= ep:
+                return 0, 0
+        return sp, ep
+
+    def count(self, pattern) -> int:
+        """Number of occurrences of 'pattern' (n + 1 for the empty pattern, like str.count)."""
+        if len(pattern) == 0:
+            return self.n + 1
+        sp, ep = self._range(pattern)
+        return ep - sp
+
+    def locate(self, pattern) -> list[int]:
+        """
+        Sorted 0-based positions of 'pattern', like kmp_search. The empty pattern
+        occurs at every position 0..n, so locate and count always agree.
+        """
+        if len(pattern) == 0:
+            return list(range(self.n + 1))
+        sp, ep = self._range(pattern)
+        positions = []
+        for row in range(sp, ep):
+            steps = 0
+            # LF-mapping hasta una fila muestreada
+            while row not in self.sampled_sa:
+                c = self.bwt[row]
+                row = self.C[c] + self.occ(c, row)
+                steps += 1
+            positions.append(self.sampled_sa[row] + steps)
+        positions.sort()
+        return positions
@@ -0,0 +1,241 @@
+"""
+Variantes instrumentadas de los algoritmos, con contadores de operaciones.
+
+Son funciones separadas de las normales para que las búsquedas sin instrumentar
+no paguen nada: kmp_search, boyer_moore, backwards_dawg_matching y Automata.test
+no cambian. Cada variante entrega (resultado, OperationCounters).
+"""
+from collections import Counter
+
+from algorithms.backwards_dawg_matching import reversed_dawg
+from algorithms.boyer_moore import BoyerMooreTables
+from algorithms.knuth_morris_pratt import compute_lps
+from algorithms.symbols import as_symbols, symbol_codes
+from automata.automata import Automata
+
+
+class OperationCounters:
+    """
+    Operation counts of one search.
+
+    Attributes:
+        inspections (int): Text characters read or compared.
+        shifts (Counter): Histogram shift length -> number of window shifts.
+        transitions (int): Automaton transitions followed.
+        verifications (int): Windows compared against the pattern: every window in
+            BM bad_character/full, the windows whose last symbol matches in Horspool,
+            every window in Sunday, and in BDM the windows read completely.
+        matches (int): Occurrences reported.
+    """
+
+    def __init__(self):
+        self.inspections = 0
+        self.shifts: Counter = Counter()
+        self.transitions = 0
+        self.verifications = 0
+        self.matches = 0
+
+    @property
+    def total_shifts(self) -> int:
+        return sum(self.shifts.values())
+
+    def to_dict(self):
+        return {
+            "inspections": self.inspections,
+            "shifts": self.total_shifts,
+            "shift_histogram": {str(k): v for k, v in sorted(self.shifts.items())},
+            "transitions": self.transitions,
+            "verifications": self.verifications,
+            "matches": self.matches,
+        }
+
+    def __repr__(self):
+        return (f"OperationCounters(inspections={self.inspections}, shifts={self.total_shifts}, "
+                f"transitions={self.transitions}, verifications={self.verifications}, "
+                f"matches={self.matches})")
+
+
+def kmp_search_instrumented(text, pattern, counters: OperationCounters = None):
+    """kmp_search contando comparaciones y desplazamientos del patrón."""
+    if counters is None:
+        counters = OperationCounters()
+    text, pattern = as_symbols(text, pattern)
+    if not pattern:
+        return [], counters
+
+    lps = compute_lps(pattern)
+    matches = []
+    m = len(pattern)
+    n = len(text)
+    i = j = 0
+    while i < n:
+        counters.inspections += 1
+        if pattern[j] == text[i]:
+            i += 1
+            j += 1
+            if j == m:
+                matches.append(i - j)
+                counters.matches += 1
+                counters.shifts[j - lps[j - 1]] += 1
+                j = lps[j - 1]
+        elif j != 0:
+            counters.shifts[j - lps[j - 1]] += 1
+            j = lps[j - 1]
+        else:
+            counters.shifts[1] += 1
+            i += 1
+    return matches, counters
+
+
+def boyer_moore_instrumented(text, pattern, variant: str = "bad_character",
+                             counters: OperationCounters = None):
+    """boyer_moore (cualquier variante) comparando carácter a carácter para contarlos."""
+    if counters is None:
+        counters = OperationCounters()
+    text, pattern = as_symbols(text, pattern)
+    if len(pattern) == 0:
+        return [], counters
+
+    wide = isinstance(text, str) and not (text.isascii() and pattern.isascii())
+    tables = BoyerMooreTables(pattern, variant, wide=wide)
+    text, _ = symbol_codes(text, wide=wide)
+    pattern, _ = symbol_codes(pattern, wide=wide)
+    m = len(pattern)
+    n = len(text)
+    matches = []
+    s = 0
+    low = 0 # Galil (solo variante "full")
+
+    while s <= n - m:
+        if variant in ("bad_character", "full"):
+            counters.verifications += 1
+            j = m - 1
+            while j >= low:
+                counters.inspections += 1
+                if pattern[j] != text[s + j]:
+                    break
+                j -= 1
+            if j < low:
+                matches.append(s)
+                if variant == "full":
+                    shift = tables.good_suffix[0]
+                    low = m - shift
+                elif s + m < n:
+                    counters.inspections += 1
+                    shift = m - tables.bad_char[text[s + m]]
+                else:
+                    shift = 1
+            elif variant == "full":
+                shift = max(tables.good_suffix[j + 1], j - tables.bad_char[text[s + j]])
+                low = 0
+            else:
+                shift = max(1, j - tables.bad_char[text[s + j]])
+        else:
+            if variant == "horspool":
+                # Solo se verifica la ventana si coincide su último carácter
+                counters.inspections += 1
+                c = text[s + m - 1]
+                verify = c == pattern[m - 1]
+            else:
+                verify = True
+            if verify:
+                counters.verifications += 1
+                j = 0
+                while j < m:
+                    counters.inspections += 1
+                    if pattern[j] != text[s + j]:
+                        break
+                    j += 1
+                if j == m:
+                    matches.append(s)
+            if variant == "horspool":
+                shift = tables.shift[c]
+            elif s + m < n:
+                counters.inspections += 1
+                shift = tables.shift[text[s + m]]
+            else:
+                break
+        counters.shifts[shift] += 1
+        s += shift
+
+    counters.matches += len(matches)
+    return matches, counters
+
+
+def backwards_dawg_matching_instrumented(pattern, text, counters: OperationCounters = None):
+    """backwards_dawg_matching contando caracteres leídos, transiciones y saltos."""
+    if counters is None:
+        counters = OperationCounters()
+    text, pattern = as_symbols(text, pattern)
+    m = len(pattern)
+    n = len(text)
+    if m == 0:
+        return list(range(1, n + 2)), counters
+    if m > n:
+        return [], counters
+
+    dawg_pr = reversed_dawg(pattern)
+    table = dawg_pr.table
+    symbol_index = dawg_pr.symbol_index
+    k = dawg_pr.num_symbols
+    accepting = dawg_pr.accepting
+    occurrences = []
+    pos = 0
+    while pos <= n - m:
+        j = m
+        last = m
+        state = 0
+        while j > 0:
+            counters.inspections += 1
+            c = symbol_index.get(text[pos + j - 1])
+            if c is None:
+                break
+            state = table[state * k + c]
+            counters.transitions += 1
+            j -= 1
+            if state < 0:
+                break
+            if accepting[state]:
+                if j > 0:
+                    last = j
+                else:
+                    occurrences.append(pos + 1)
+                    counters.matches += 1
+        if j == 0 and state >= 0:
+            # La ventana se leyó completa
+            counters.verifications += 1
+        counters.shifts[last] += 1
+        pos += last
+    return occurrences, counters
+
+
+def automata_test_instrumented(automata: 'Automata', string, counters: OperationCounters = None):
+    """Automata.test contando símbolos leídos y transiciones seguidas."""
+    if counters is None:
+        counters = OperationCounters()
+    current_state = automata.initial_state
+    for symbol in string:
+        counters.inspections += 1
+        current_state = current_state.get_next_state(symbol)
+        if current_state is None:
+            return False, counters
+        counters.transitions += 1
+    accepted = current_state.is_accepting
+    if accepted:
+        counters.matches += 1
+    return accepted, counters
+
+
+# nombre -> función(text, pattern, counters=None) -> (resultado, OperationCounters)
+INSTRUMENTED = {
+    "KMP": kmp_search_instrumented,
+    "BM": boyer_moore_instrumented,
+    "BDM": lambda text, pattern, counters=None: backwards_dawg_matching_instrumented(pattern, text, counters),
+}
+
+
+def count_operations(algorithm: str, text, pattern) -> OperationCounters:
+    """Runs the instrumented variant of 'algorithm' and returns its counters."""
+    if algorithm not in INSTRUMENTED:
+        raise ValueError(f"No instrumented variant for '{algorithm}', expected one of {list(INSTRUMENTED)}.")
+    return INSTRUMENTED[algorithm](text, pattern)[1]
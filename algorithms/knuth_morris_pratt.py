@@ -1,3 +1,7 @@
+from algorithms.results import check_mode, collect
+from algorithms.symbols import as_symbols
+
+
 def compute_lps(pattern):
     """Construye la tabla de los prefijos más largos que también son sufijos (LPS)."""
     lps = [0] * len(pattern)
@@ -18,9 +22,11 @@ def compute_lps(pattern):
 
     return lps
 
-def kmp_search(text: str, pattern: str) -> list[int]:
+def kmp_search(text: str, pattern: str, lps: list[int] = None, mode: str = "list", k: int = None):
     """
     Busca todas las apariciones del patrón en el texto usando el algoritmo KMP.
+    Si se entrega lps (de compute_lps), se omite el preprocesamiento.
+    'mode' y 'k' eligen la forma del resultado (ver algorithms.results).
 
     Example of usage:
 
@@ -29,12 +35,16 @@ def kmp_search(text: str, pattern: str) -> list[int]:
     result = kmp_search(text, pattern)
     print("Patrón encontrado en las posiciones:", result)
     """
+    check_mode(mode, k)
+    text, pattern = as_symbols(text, pattern)
     if not pattern:
-        return []
+        return collect(iter(()), mode, k)
 
-    lps = compute_lps(pattern)
-    matches = []
+    if lps is None:
+        lps = compute_lps(pattern)
+    return collect(_kmp_positions(text, pattern, lps), mode, k)
 
+def _kmp_positions(text, pattern, lps):
     i = j = 0  # i para el texto, j para el patrón
 
     while i < len(text):
@@ -43,12 +53,10 @@ def kmp_search(text: str, pattern: str) -> list[int]:
             j += 1
 
         if j == len(pattern):
-            matches.append(i - j)
+            yield i - j
             j = lps[j - 1]
         elif i < len(text) and pattern[j] != text[i]:
             if j != 0:
                 j = lps[j - 1]
             else:
                 i += 1
-
-    return matches
\ No newline at end of file
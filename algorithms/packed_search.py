@@ -0,0 +1,74 @@
+"""
+Búsqueda sobre texto PackedDNA comparando k-meros empacados en vez de caracteres.
+
+Se usa Horspool sobre q-gramas (q <= 4 bases, un byte de códigos): el q-grama final
+de la ventana decide el salto y la verificación compara palabras de hasta 32 bases
+(64 bits) por operación.
+"""
+from array import array
+
+from algorithms.results import check_mode, collect
+from data.packed_dna import PackedDNA
+
+# Bases por palabra en la verificación (2 bits por base -> 64 bits)
+WORD_BASES = 32
+
+
+class PackedPattern:
+    """
+    Preprocessing of a pattern for packed_search.
+    """
+
+    def __init__(self, pattern):
+        packed = pattern if isinstance(pattern, PackedDNA) else PackedDNA.from_str(pattern)
+        m = len(packed)
+        self.packed = packed
+        self.length = m
+        self.q = min(m, 4)
+        # Horspool sobre q-gramas: q-gramas de p[0..m-2], la última aparición gana
+        self.shift = array("i", [m - self.q + 1]) * (1 << (2 * self.q))
+        for i in range(m - self.q):
+            self.shift[packed.kmer(i, self.q)] = m - self.q - i
+        self.last_gram = packed.kmer(m - self.q, self.q) if m else 0
+        self.words = [(w, min(WORD_BASES, m - w), packed.kmer(w, min(WORD_BASES, m - w)))
+                      for w in range(0, m, WORD_BASES)]
+
+
+def packed_search(text: PackedDNA, pattern, packed_pattern: PackedPattern = None,
+                  mode: str = "list", k: int = None):
+    """
+    Searches 'pattern' (str or PackedDNA) in a PackedDNA text. Positions are 0-based,
+    like kmp_search. A str text is packed first.
+    If 'packed_pattern' (a PackedPattern) is given, preprocessing is skipped.
+    'mode' and 'k' select the result form (see algorithms.results).
+    """
+    check_mode(mode, k)
+    if not isinstance(text, PackedDNA):
+        text = PackedDNA.from_str(text)
+    if packed_pattern is None:
+        packed_pattern = PackedPattern(pattern)
+    m = packed_pattern.length
+    n = len(text)
+    if m == 0 or m > n:
+        return collect(iter(()), mode, k)
+    return collect(_packed_positions(text, packed_pattern), mode, k)
+
+
+def _packed_positions(text: PackedDNA, packed_pattern: PackedPattern):
+    m = packed_pattern.length
+    n = len(text)
+    q = packed_pattern.q
+    shift = packed_pattern.shift
+    last_gram = packed_pattern.last_gram
+    words = packed_pattern.words
+    kmer = text.kmer
+    s = 0
+    while s <= n - m:
+        gram = kmer(s + m - q, q)
+        if gram == last_gram:
+            for w, k, value in words:
+                if kmer(s + w, k) != value:
+                    break
+            else:
+                yield s
+        s += shift[gram]
@@ -0,0 +1,105 @@
+"""
+Búsqueda paralela por fragmentos con el texto en memoria compartida.
+
+El texto se copia una sola vez a multiprocessing.shared_memory; cada proceso del
+pool se conecta por nombre y busca en una vista (memoryview) de su fragmento,
+sin copiarlo. Los fragmentos se solapan en m-1 caracteres.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from algorithms.pattern_cache import ALGORITHMS, compile_pattern
+from algorithms.results import check_mode, collect
+from algorithms.symbols import is_bytes_like
+
+
+def _search_shard(shm_name: str, start: int, end: int, pattern: bytes, algorithm: str,
+                  mode: str = "list", k: int = None):
+    """
+    Busca en text[start:end] dentro de la memoria compartida 'shm_name'.
+    Devuelve posiciones absolutas, o el resultado de mode "count"/"exists".
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        view = shm.buf[start:end]
+        try:
+            # El caché de patrones es por proceso: cada worker preprocesa una sola vez
+            result = compile_pattern(pattern, algorithm).search(view, mode, k)
+            if mode in ("count", "exists"):
+                return result
+            return [start + pos for pos in result]
+        finally:
+            view.release()
+    finally:
+        shm.close()
+
+
+def shard_bounds(n: int, m: int, shards: int) -> list[tuple[int, int]]:
+    """
+    Divide [0, n) en 'shards' fragmentos que se solapan en m-1 caracteres.
+    Cada ocurrencia comienza en exactamente un fragmento.
+    """
+    size = -(-n // shards)  # techo de n / shards
+    bounds = []
+    for start in range(0, n, size):
+        bounds.append((start, min(n, start + size + m - 1)))
+    return bounds
+
+
+def parallel_search(text, pattern, algorithm: str = "BM", workers: int = None,
+                    mode: str = "list", k: int = None):
+    """
+    Searches 'pattern' in 'text' with a process pool, one shard per worker.
+    Offsets are sorted, de-duplicated and use the same base as 'algorithm'
+    ("KMP", "BM" or "BDM").
+    'mode' and 'k' select the result form (see algorithms.results). With "count" and
+    "exists" the workers only send back a number; with "first_k" each worker sends at
+    most k positions.
+
+    Example of usage:
+    result = parallel_search(text, "ACGT", "BDM", workers=8)
+    """
+    check_mode(mode, k)
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm '{algorithm}', expected one of {list(ALGORITHMS)}.")
+    if isinstance(text, str):
+        # Las posiciones en bytes coinciden con las del str solo si es ASCII
+        if not text.isascii():
+            raise ValueError("parallel_search needs an ASCII str or a bytes-like text.")
+        text = text.encode()
+    elif not is_bytes_like(text):
+        raise TypeError("text must be str or bytes-like.")
+    elif isinstance(text, memoryview) and text.format != "B":
+        text = text.cast("B")
+    if isinstance(pattern, str):
+        pattern = pattern.encode()
+    pattern = bytes(pattern)
+
+    workers = workers or os.cpu_count() or 1
+    n = len(text)
+    m = len(pattern)
+    if workers == 1 or m == 0 or n <= m:
+        return compile_pattern(pattern, algorithm).search(text, mode, k)
+
+    # Cada ocurrencia comienza en un solo fragmento, así que los conteos se suman
+    shard_mode = mode if mode in ("count", "exists", "first_k") else "list"
+    shm = shared_memory.SharedMemory(create=True, size=n)
+    try:
+        shm.buf[:n] = text
+        bounds = shard_bounds(n, m, workers)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_search_shard, shm.name, start, end, pattern, algorithm, shard_mode, k)
+                       for start, end in bounds]
+            if mode == "count":
+                return sum(future.result() for future in futures)
+            if mode == "exists":
+                return any(future.result() for future in futures)
+            occurrences = set()
+            for future in futures:
+                occurrences.update(future.result())
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return collect(iter(sorted(occurrences)), mode, k)
@@ -0,0 +1,181 @@
+"""
+Patrones precompilados y un caché LRU global de preprocesamiento.
+
+compile_pattern(pattern, algorithm) entrega un CompiledPattern cuyo .search(text)
+reutiliza el preprocesamiento (LPS, tabla de mal carácter o DAWG invertido).
+El caché se limita por bytes estimados, no por cantidad de entradas.
+"""
+import sys
+from array import array
+from collections import OrderedDict
+
+from algorithms.backwards_dawg_matching import backwards_dawg_matching, reversed_dawg
+from algorithms.bndm import bndm, bndm_masks
+from algorithms.boyer_moore import BoyerMooreTables, boyer_moore
+from algorithms.knuth_morris_pratt import compute_lps, kmp_search
+from algorithms.packed_search import PackedPattern, packed_search
+from algorithms.shift_or import shift_or, shift_or_masks
+from algorithms.symbols import as_symbols
+from algorithms.vectorized import as_uint8_array, vectorized_search
+from automata.compiled_dfa import CompiledDFA
+
+# nombre -> (preprocesamiento(pattern), búsqueda(text, pattern, preprocesado, mode="list", k=None))
+ALGORITHMS = {
+    "KMP": (compute_lps,
+            lambda text, pattern, pre, mode="list", k=None: kmp_search(text, pattern, lps=pre, mode=mode, k=k)),
+    "BM": (BoyerMooreTables,
+           lambda text, pattern, pre, mode="list", k=None: boyer_moore(text, pattern, tables=pre, mode=mode, k=k)),
+    "BDM": (reversed_dawg,
+            lambda text, pattern, pre, mode="list", k=None: backwards_dawg_matching(pattern, text, dawg_pr=pre,
+                                                                                      mode=mode, k=k)),
+    "BNDM": (bndm_masks,
+             lambda text, pattern, pre, mode="list", k=None: bndm(text, pattern, masks=pre, mode=mode, k=k)),
+    "ShiftOr": (shift_or_masks,
+                lambda text, pattern, pre, mode="list", k=None: shift_or(text, pattern, masks=pre, mode=mode, k=k)),
+    # Texto PackedDNA (un str se empaqueta antes de buscar)
+    "Packed": (PackedPattern,
+               lambda text, pattern, pre, mode="list", k=None: packed_search(text, pattern, packed_pattern=pre,
+                                                                              mode=mode, k=k)),
+    # Requiere NumPy (dependencia opcional)
+    "Vectorized": (as_uint8_array,
+                   lambda text, pattern, pre, mode="list", k=None: vectorized_search(text, pattern, pattern_array=pre,
+                                                                                      mode=mode, k=k)),
+}
+
+
+def estimate_bytes(obj) -> int:
+    """
+    Estimates the memory used by a preprocessed pattern (containers plus contents).
+    """
+    if isinstance(obj, PackedPattern):
+        return (sys.getsizeof(obj) + obj.shift.buffer_info()[1] * obj.shift.itemsize
+                + obj.packed.nbytes + estimate_bytes(obj.words))
+    if isinstance(obj, BoyerMooreTables):
+        return sys.getsizeof(obj) + sum(estimate_bytes(table)
+                                        for table in (obj.bad_char, obj.good_suffix, obj.shift)
+                                        if table is not None)
+    if isinstance(obj, CompiledDFA):
+        return (sys.getsizeof(obj)
+                + obj.table.nbytes
+                + sys.getsizeof(obj.accepting)
+                + estimate_bytes(obj.symbol_index)
+                + sum(sys.getsizeof(name) for name in obj.state_names))
+    if isinstance(obj, array):
+        return obj.buffer_info()[1] * obj.itemsize
+    if hasattr(obj, "nbytes") and hasattr(obj, "dtype"):
+        # arreglo de NumPy
+        return sys.getsizeof(obj) + obj.nbytes
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in obj.items())
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(sys.getsizeof(x) for x in obj)
+    return sys.getsizeof(obj)
+
+
+class CompiledPattern:
+    """
+    A pattern together with the preprocessing of one algorithm.
+    """
+
+    def __init__(self, pattern: str, algorithm: str):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Unknown algorithm '{algorithm}', expected one of {list(ALGORITHMS)}.")
+        preprocess, _ = ALGORITHMS[algorithm]
+        self.pattern = pattern
+        self.algorithm = algorithm
+        self.preprocessed = preprocess(pattern)
+        self.nbytes = sys.getsizeof(pattern) + estimate_bytes(self.preprocessed)
+
+    def search(self, text: str, mode: str = "list", k: int = None):
+        """
+        Searches the pattern in 'text' without preprocessing it again.
+        'mode' and 'k' select the result form (see algorithms.results).
+        """
+        text, pattern = as_symbols(text, self.pattern)
+        if type(pattern) is not type(self.pattern):
+            # El texto usa otro tipo de símbolo: se usa el patrón convertido
+            return compile_pattern(pattern, self.algorithm).search(text, mode, k)
+        _, search = ALGORITHMS[self.algorithm]
+        return search(text, self.pattern, self.preprocessed, mode, k)
+
+    def __repr__(self):
+        return f"CompiledPattern(algorithm={self.algorithm}, len={len(self.pattern)}, nbytes={self.nbytes})"
+
+
+class PatternCache:
+    """
+    LRU cache of CompiledPattern keyed by (algorithm, pattern), bounded by estimated bytes.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20):
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be non-negative.")
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[tuple[str, str], CompiledPattern] = OrderedDict()
+
+    def get(self, pattern: str, algorithm: str) -> CompiledPattern:
+        """Returns the compiled pattern, compiling and caching it on a miss."""
+        key = (algorithm, pattern)
+        compiled = self._entries.get(key)
+        if compiled is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return compiled
+
+        self.misses += 1
+        compiled = CompiledPattern(pattern, algorithm)
+        # Un patrón más grande que todo el presupuesto no se guarda
+        if compiled.nbytes <= self.max_bytes:
+            self._entries[key] = compiled
+            self.current_bytes += compiled.nbytes
+            while self.current_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.current_bytes -= evicted.nbytes
+                self.evictions += 1
+        return compiled
+
+    def clear(self):
+        """Removes every entry and resets the statistics."""
+        self._entries.clear()
+        self.current_bytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key: tuple[str, str]):
+        return key in self._entries
+
+
+# Caché global del proceso
+pattern_cache = PatternCache()
+
+
+def compile_pattern(pattern: str, algorithm: str, use_cache: bool = True) -> CompiledPattern:
+    """
+    Returns the compiled pattern for 'algorithm' (a key of ALGORITHMS).
+
+    Example of usage:
+    compiled = compile_pattern("ACGT", "BDM")
+    compiled.search(text)
+    """
+    if not isinstance(pattern, (str, bytes)):
+        # bytearray y memoryview no sirven como llave del caché
+        pattern = bytes(pattern)
+    if not use_cache:
+        return CompiledPattern(pattern, algorithm)
+    return pattern_cache.get(pattern, algorithm)
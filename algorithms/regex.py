@@ -0,0 +1,426 @@
+"""
+Expresiones regulares simples y códigos IUPAC, compiladas a un ε-NFA de Thompson.
+
+Sintaxis: literales, '.', clases [ACG], [A-Z], [^T], agrupación (...), alternación |,
+y los operadores *, + y ?. '\\' escapa un carácter especial. Con iupac=True cada
+código de ambigüedad (N, R, Y, ...) es la clase de bases que representa.
+
+compile_regex() arma el Automata con add_transition/add_epsilon_transition y
+Regex.search() lo recorre con un LazyDFA en una sola pasada, reportando el final de
+cada ocurrencia. Antes se extrae un factor literal que toda ocurrencia contiene y se
+busca con BNDM: si el largo de las ocurrencias está acotado, el autómata solo
+recorre las regiones alrededor de cada aparición del factor.
+"""
+from os.path import commonprefix
+
+from algorithms.pattern_cache import compile_pattern
+from algorithms.results import check_mode, collect
+from automata.automata import Automata
+from automata.lazy_dfa import DEFAULT_MAX_STATES, LazyDFA
+from automata.node import AutomataState
+
+IUPAC_CODES = {
+    "A": "A", "C": "C", "G": "G", "T": "T", "U": "T",
+    "R": "AG", "Y": "CT", "S": "CG", "W": "AT", "K": "GT", "M": "AC",
+    "B": "CGT", "D": "AGT", "H": "ACT", "V": "ACG", "N": "ACGT",
+}
+SPECIAL = set("()[]|*+?.\\")
+INFINITE = float("inf")
+# Máximo de cadenas que se siguen por nodo al buscar el factor obligatorio
+FACTOR_SET_LIMIT = 16
+# Algoritmo con que se busca el factor obligatorio (el más rápido en las mediciones)
+FACTOR_ALGORITHM = "BNDM"
+
+
+# --- Parser --- #
+# Árbol: ("set", frozenset de símbolos), ("empty",), ("cat", [hijos]), ("alt", [hijos]),
+# ("star", hijo), ("plus", hijo), ("opt", hijo)
+
+class _Parser:
+
+    def __init__(self, pattern: str, alphabet, iupac: bool):
+        self.pattern = pattern
+        self.alphabet = alphabet
+        self.iupac = iupac
+        self.i = 0
+
+    def error(self, message: str):
+        raise ValueError(f"{message} at position {self.i} of regex {self.pattern!r}")
+
+    def peek(self):
+        return self.pattern[self.i] if self.i < len(self.pattern) else None
+
+    def parse(self):
+        node = self.alternation()
+        if self.i < len(self.pattern):
+            self.error("Unexpected ')'")
+        return node
+
+    def alternation(self):
+        options = [self.concatenation()]
+        while self.peek() == "|":
+            self.i += 1
+            options.append(self.concatenation())
+        return options[0] if len(options) == 1 else ("alt", options)
+
+    def concatenation(self):
+        items = []
+        while self.peek() is not None and self.peek() not in "|)":
+            items.append(self.repetition())
+        if not items:
+            return ("empty",)
+        return items[0] if len(items) == 1 else ("cat", items)
+
+    def repetition(self):
+        node = self.atom()
+        while self.peek() in ("*", "+", "?"):
+            node = ({"*": "star", "+": "plus", "?": "opt"}[self.peek()], node)
+            self.i += 1
+        return node
+
+    def atom(self):
+        c = self.peek()
+        if c == "(":
+            self.i += 1
+            node = self.alternation()
+            if self.peek() != ")":
+                self.error("Missing ')'")
+            self.i += 1
+            return node
+        if c == "[":
+            return self.char_class()
+        if c == ".":
+            self.i += 1
+            return ("set", frozenset(self.full_alphabet(".")))
+        if c in ("*", "+", "?"):
+            self.error(f"Nothing to repeat with '{c}'")
+        if c == "]":
+            self.error("Unexpected ']'")
+        return ("set", frozenset(self.symbol()))
+
+    def symbol(self) -> str:
+        """Reads one (possibly escaped) symbol and returns the symbols it stands for."""
+        c = self.peek()
+        if c is None:
+            self.error("Unexpected end")
+        self.i += 1
+        if c == "\\":
+            c = self.peek()
+            if c is None:
+                self.error("Dangling '\\'")
+            self.i += 1
+            return c
+        if self.iupac and c in IUPAC_CODES:
+            return IUPAC_CODES[c]
+        return c
+
+    def char_class(self):
+        self.i += 1  # '['
+        negate = self.peek() == "^"
+        if negate:
+            self.i += 1
+        symbols = set()
+        first = True
+        while self.peek() != "]" or first:
+            if self.peek() is None:
+                self.error("Missing ']'")
+            first = False
+            expanded = self.symbol()
+            if self.peek() == "-" and self.i + 1 < len(self.pattern) and self.pattern[self.i + 1] != "]":
+                self.i += 1
+                end = self.symbol()
+                if len(expanded) != 1 or len(end) != 1:
+                    self.error("Invalid range")
+                if ord(expanded) > ord(end):
+                    self.error("Reversed range")
+                symbols.update(chr(x) for x in range(ord(expanded), ord(end) + 1))
+            else:
+                symbols.update(expanded)
+        self.i += 1  # ']'
+        if negate:
+            symbols = set(self.full_alphabet("[^...]")) - symbols
+        if not symbols:
+            self.error("Empty class")
+        return ("set", frozenset(symbols))
+
+    def full_alphabet(self, construct: str):
+        if self.alphabet is None:
+            self.error(f"'{construct}' needs an explicit alphabet")
+        return self.alphabet
+
+
+def parse_regex(pattern: str, alphabet: list[str] = None, iupac: bool = False):
+    """Parses 'pattern' into the syntax tree used by compile_regex."""
+    return _Parser(pattern, alphabet, iupac).parse()
+
+
+def _tree_symbols(node, out: set):
+    kind = node[0]
+    if kind == "set":
+        out.update(node[1])
+    elif kind in ("cat", "alt"):
+        for child in node[1]:
+            _tree_symbols(child, out)
+    elif kind != "empty":
+        _tree_symbols(node[1], out)
+    return out
+
+
+# --- Construcción de Thompson --- #
+
+def compile_regex(pattern: str, alphabet: list[str] = None, iupac: bool = False) -> 'Automata':
+    """
+    Compiles a regex into a Thompson epsilon-NFA that accepts exactly the strings
+    matching it (anchored at both ends).
+
+    :param pattern: The regex (see the module docstring for the syntax)
+    :param alphabet: Symbols of the texts; required by '.' and negated classes.
+        Defaults to ACGT with iupac=True, and to the symbols of the regex otherwise
+    :param iupac: Read the IUPAC ambiguity codes as classes
+    """
+    return _thompson(_resolve(pattern, alphabet, iupac))
+
+
+def _resolve(pattern: str, alphabet, iupac: bool):
+    if alphabet is None and iupac:
+        alphabet = list("ACGT")
+    tree = parse_regex(pattern, alphabet, iupac)
+    symbols = _tree_symbols(tree, set())
+    if alphabet is None:
+        alphabet = sorted(symbols)
+    else:
+        alphabet = list(alphabet)
+        missing = symbols.difference(alphabet)
+        if missing:
+            raise ValueError(f"Symbol '{sorted(missing)[0]}' of the regex is not in the alphabet.")
+    return tree, alphabet
+
+
+def _thompson(resolved) -> 'Automata':
+    tree, alphabet = resolved
+    nfa = Automata(states=[], alphabet=alphabet)
+
+    def new_state(accepting: bool = False) -> str:
+        name = f"r_{len(nfa.states)}"
+        nfa.add_state(AutomataState(name=name, is_accepting=accepting))
+        return name
+
+    def build(node) -> tuple[str, str]:
+        kind = node[0]
+        if kind == "set":
+            start, end = new_state(), new_state()
+            for symbol in sorted(node[1]):
+                nfa.add_transition(start, symbol, end)
+            return start, end
+        if kind == "empty":
+            start, end = new_state(), new_state()
+            nfa.add_epsilon_transition(start, end)
+            return start, end
+        if kind == "cat":
+            start, end = build(node[1][0])
+            for child in node[1][1:]:
+                child_start, child_end = build(child)
+                nfa.add_epsilon_transition(end, child_start)
+                end = child_end
+            return start, end
+        if kind == "alt":
+            start, end = new_state(), new_state()
+            for child in node[1]:
+                child_start, child_end = build(child)
+                nfa.add_epsilon_transition(start, child_start)
+                nfa.add_epsilon_transition(child_end, end)
+            return start, end
+        child_start, child_end = build(node[1])
+        if kind == "plus":
+            end = new_state()
+            nfa.add_epsilon_transition(child_end, child_start)
+            nfa.add_epsilon_transition(child_end, end)
+            return child_start, end
+        start, end = new_state(), new_state()
+        nfa.add_epsilon_transition(start, child_start)
+        nfa.add_epsilon_transition(start, end)
+        nfa.add_epsilon_transition(child_end, end)
+        if kind == "star":
+            nfa.add_epsilon_transition(child_end, child_start)
+        return start, end
+
+    start, end = build(tree)
+    final = new_state(accepting=True)
+    nfa.add_epsilon_transition(end, final)
+    nfa.set_initial_state(start)
+    return nfa
+
+
+# --- Prefiltro --- #
+
+def match_length_bounds(tree) -> tuple[int, float]:
+    """Minimum and maximum length of a match (the maximum may be infinite)."""
+    kind = tree[0]
+    if kind == "set":
+        return 1, 1
+    if kind == "empty":
+        return 0, 0
+    if kind == "cat":
+        bounds = [match_length_bounds(child) for child in tree[1]]
+        return sum(b[0] for b in bounds), sum(b[1] for b in bounds)
+    if kind == "alt":
+        bounds = [match_length_bounds(child) for child in tree[1]]
+        return min(b[0] for b in bounds), max(b[1] for b in bounds)
+    low, high = match_length_bounds(tree[1])
+    if kind == "star":
+        return 0, (INFINITE if high else 0)
+    if kind == "plus":
+        return low, (INFINITE if high else 0)
+    return 0, high  # opt
+
+
+def _best(*candidates: str) -> str:
+    return max(candidates, key=len)
+
+def _set_factor(strings) -> str:
+    """Longest literal shared by every string of a finite set (common prefix or suffix)."""
+    strings = list(strings)
+    if len(strings) == 1:
+        return strings[0]
+    prefix = commonprefix(strings)
+    suffix = commonprefix([s[::-1] for s in strings])[::-1]
+    return _best(prefix, suffix)
+
+def _factors(tree) -> tuple[set | None, str]:
+    """
+    Returns (exact, required): the finite set of strings the node matches (None if
+    infinite or larger than FACTOR_SET_LIMIT) and a literal contained in every match.
+    """
+    kind = tree[0]
+    if kind == "set":
+        symbols = tree[1]
+        exact = set(symbols) if len(symbols) <= FACTOR_SET_LIMIT else None
+        return exact, (next(iter(symbols)) if len(symbols) == 1 else "")
+    if kind == "empty":
+        return {""}, ""
+    if kind == "cat":
+        best = ""
+        run = {""}
+        whole = True
+        for child in tree[1]:
+            exact, required = _factors(child)
+            best = _best(best, required)
+            if run is not None and exact is not None and len(run) * len(exact) <= FACTOR_SET_LIMIT:
+                run = {a + b for a in run for b in exact}
+            else:
+                # Se corta la corrida de cadenas exactas y empieza otra con este hijo
+                whole = False
+                run = exact
+            if run:
+                best = _best(best, _set_factor(run))
+        return (run if whole else None), best
+    if kind == "alt":
+        children = [_factors(child) for child in tree[1]]
+        exact = set()
+        for child_exact, _ in children:
+            if child_exact is None or exact is None:
+                exact = None
+            else:
+                exact |= child_exact
+        if exact is not None and len(exact) > FACTOR_SET_LIMIT:
+            exact = None
+        if exact is not None:
+            return exact, _set_factor(exact)
+        required = {r for _, r in children}
+        return None, (required.pop() if len(required) == 1 else "")
+    exact, required = _factors(tree[1])
+    if kind == "plus":
+        return None, (_set_factor(exact) if exact else required)
+    if kind == "opt" and exact is not None:
+        return exact | {""}, ""
+    return None, ""
+
+
+def required_factor(pattern: str, alphabet: list[str] = None, iupac: bool = False) -> str:
+    """Longest literal found that every match of the regex contains ("" if none)."""
+    tree, _ = _resolve(pattern, alphabet, iupac)
+    return _factors(tree)[1]
+
+
+class Regex:
+    """
+    A compiled regex: its Thompson NFA, a LazyDFA to run it and the prefilter data.
+    """
+
+    def __init__(self, pattern: str, alphabet: list[str] = None, iupac: bool = False,
+                 max_states: int = DEFAULT_MAX_STATES):
+        """
+        :param pattern: The regex
+        :param alphabet: Symbols of the texts (see compile_regex)
+        :param iupac: Read the IUPAC ambiguity codes as classes
+        :param max_states: Size of the LazyDFA state cache
+        """
+        resolved = _resolve(pattern, alphabet, iupac)
+        tree, self.alphabet = resolved
+        self.pattern = pattern
+        self.nfa = _thompson(resolved)
+        self.dfa = LazyDFA(self.nfa, max_states=max_states)
+        self.min_length, self.max_length = match_length_bounds(tree)
+        self.factor = _factors(tree)[1]
+
+    def matches(self, string) -> bool:
+        """Whether the whole 'string' matches the regex."""
+        return self.dfa.test(string)
+
+    def _factor_positions(self, text, mode: str = "iter"):
+        # BNDM reporta base 1: se pasa a base 0
+        compiled = compile_pattern(self.factor, FACTOR_ALGORITHM)
+        if mode != "iter":
+            return compiled.search(text, mode)
+        return (pos - 1 for pos in compiled.search(text, "iter"))
+
+    def _ends(self, text, prefilter: bool):
+        if not prefilter or not self.factor:
+            yield from self.dfa.search(text, "iter")
+            return
+        if self.max_length == INFINITE:
+            # Sin cota para las ocurrencias solo se puede descartar el texto completo
+            if self._factor_positions(text, "exists"):
+                yield from self.dfa.search(text, "iter")
+            return
+        n = len(text)
+        f = len(self.factor)
+        span = int(self.max_length)
+        # Una ocurrencia que contiene el factor en p cabe en [p + f - span, p + span)
+        region_start = region_end = None
+        for p in self._factor_positions(text):
+            start, end = max(0, p + f - span), min(n, p + span)
+            if region_end is not None and start <= region_end:
+                region_end = max(region_end, end)
+                continue
+            if region_end is not None:
+                yield from (region_start + e for e in self.dfa.search(text[region_start:region_end], "iter"))
+            region_start, region_end = start, end
+        if region_end is not None:
+            yield from (region_start + e for e in self.dfa.search(text[region_start:region_end], "iter"))
+
+    def search(self, text, prefilter: bool = True, mode: str = "list", k: int = None):
+        """
+        Reports the 0-based index of the last symbol of every match in 'text', in one
+        pass (empty matches are not reported).
+        'mode' and 'k' select the result form (see algorithms.results).
+
+        :param prefilter: Use the required literal factor to skip regions of the text
+        """
+        check_mode(mode, k)
+        return collect(self._ends(text, prefilter), mode, k)
+
+    def __repr__(self):
+        return (f"Regex({self.pattern!r}, nfa_states={len(self.nfa.states)}, "
+                f"factor={self.factor!r}, length=[{self.min_length}, {self.max_length}])")
+
+
+def regex_search(text, pattern: str, alphabet: list[str] = None, iupac: bool = False,
+                 mode: str = "list", k: int = None):
+    """
+    Searches a regex in 'text' and reports the 0-based end index of every match.
+
+    Example of usage:
+    result = regex_search("ACGTTGCA", "G[CT]+", iupac=True)  # [3, 4, 6]
+    """
+    return Regex(pattern, alphabet, iupac).search(text, mode=mode, k=k)
@@ -0,0 +1,73 @@
+"""
+Modos de resultado comunes a los algoritmos de búsqueda.
+
+Cada algoritmo genera sus posiciones con un generador y collect() las entrega según
+'mode', así que "count" y "exists" nunca arman la lista y "exists"/"first_k" dejan
+de buscar apenas tienen lo que necesitan:
+
+- "list": lista de posiciones (por defecto).
+- "array": array('q') de posiciones (8 bytes por posición en vez de un int de Python).
+- "iter": el generador mismo, que busca a medida que se consume.
+- "count": cantidad de ocurrencias.
+- "exists": True si hay al menos una ocurrencia.
+- "first_k": lista con las primeras k posiciones.
+"""
+from array import array
+from itertools import chain, islice
+
+RESULT_MODES = ("list", "array", "iter", "count", "exists", "first_k")
+
+
+def check_mode(mode: str, k: int = None, pairs: bool = False):
+    """
+    Validates 'mode' and 'k' before starting a search. Multi-pattern searches
+    report (pattern_id, position) pairs (pairs=True), which do not fit in an array('q').
+    """
+    if mode not in RESULT_MODES:
+        raise ValueError(f"Unknown mode '{mode}', expected one of {list(RESULT_MODES)}.")
+    if pairs and mode == "array":
+        raise ValueError("mode='array' is not available for (pattern_id, position) results.")
+    if mode == "first_k" and (k is None or k < 0):
+        raise ValueError("mode='first_k' needs a non-negative k.")
+
+
+def collect(positions, mode: str = "list", k: int = None):
+    """
+    Consumes an iterator of positions according to 'mode'.
+
+    :param positions: Iterator (normally a generator) of positions
+    :param mode: One of RESULT_MODES
+    :param k: Number of positions for mode="first_k"
+    """
+    check_mode(mode, k)
+    if mode == "list":
+        return list(positions)
+    if mode == "iter":
+        return iter(positions)
+    if mode == "count":
+        count = 0
+        for _ in positions:
+            count += 1
+        return count
+    if mode == "exists":
+        for _ in positions:
+            return True
+        return False
+    if mode == "first_k":
+        return list(islice(positions, k))
+    return array("q", positions)
+
+
+def collect_chunks(chunks, mode: str = "list", k: int = None):
+    """
+    Like collect(), for producers that find positions in batches (lists or NumPy
+    arrays). "count" only adds up the lengths of the batches.
+    """
+    check_mode(mode, k)
+    if mode == "count":
+        return sum(len(chunk) for chunk in chunks)
+    if mode == "exists":
+        return any(len(chunk) for chunk in chunks)
+    positions = chain.from_iterable(chunk.tolist() if hasattr(chunk, "tolist") else chunk
+                                    for chunk in chunks)
+    return collect(positions, mode, k)
@@ -0,0 +1,42 @@
+import mmap
+
+from algorithms.pattern_cache import compile_pattern
+from algorithms.results import check_mode
+
+
+def search_file(path: str, pattern, algorithm: str = "BM", mode: str = "list", k: int = None):
+    """
+    Searches 'pattern' in the file at 'path' by memory-mapping it (read only),
+    so the text is never copied into a Python string.
+    Offsets use the same base as the algorithm ("KMP", "BM" or "BDM").
+    'mode' and 'k' select the result form (see algorithms.results); with "iter"
+    the file stays mapped until the iterator is exhausted or discarded.
+
+    Example of usage:
+    result = search_file("genoma.txt", "ACGT", "BDM")
+    """
+    if isinstance(pattern, str):
+        pattern = pattern.encode()
+    check_mode(mode, k)
+    compiled = compile_pattern(bytes(pattern), algorithm)
+    if mode == "iter":
+        return _iter_file(path, compiled)
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap no acepta archivos vacíos
+            return compiled.search(b"", mode, k)
+        with mm:
+            return compiled.search(mm, mode, k)
+
+
+def _iter_file(path: str, compiled):
+    # El mmap se mantiene abierto mientras el generador esté vivo
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return
+        with mm:
+            yield from compiled.search(mm, "iter")
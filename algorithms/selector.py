@@ -0,0 +1,311 @@
+"""
+Selector adaptativo de algoritmo.
+
+search(text, pattern) elige el motor (KMP, BM, BDM o cualquier otro registrado en
+ALGORITHMS) con un modelo de costo ajustado a mediciones del benchmark. Por algoritmo
+se ajusta, por mínimos cuadrados,
+
+    log(tiempo de búsqueda / n) = a + b·log m + c·log σ
+    log(tiempo de preprocesamiento) = a + b·log m + c·log σ
+
+y se elige el menor costo estimado (el preprocesamiento no cuenta si el patrón ya
+está en el caché). El modelo se recalibra en cada máquina con
+python -m benchmark.calibrate, que lo guarda en DEFAULT_MODEL_PATH.
+"""
+import json
+import math
+import os
+from datetime import datetime, timezone
+
+from algorithms.pattern_cache import ALGORITHMS, compile_pattern, pattern_cache
+from algorithms.results import check_mode, collect
+from algorithms.symbols import is_bytes_like
+from data.packed_dna import PackedDNA
+
+MODEL_SCHEMA_NAME = "tarea-teoria-cost-model"
+MODEL_SCHEMA_VERSION = 1
+DEFAULT_MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cost_model.json")
+FEATURES = ("1", "log_m", "log_sigma")
+# Algoritmos que reportan posiciones base 1; search() siempre entrega base 0
+ONE_BASED = {"BDM", "BNDM"}
+# Algoritmos que solo sirven para algunos textos
+APPLICABLE = {
+    "Packed": lambda text: isinstance(text, PackedDNA),
+    # Igual que vectorized_search: texto binario o str ASCII
+    "Vectorized": lambda text: is_bytes_like(text) or (isinstance(text, str) and text.isascii()),
+}
+# Símbolos del principio del texto que se miran para estimar σ
+SIGMA_SAMPLE = 2**16
+# Algoritmo cuando no hay modelo
+FALLBACK_ALGORITHM = "BM"
+
+
+def _features(m: int, sigma: int) -> list[float]:
+    return [1.0, math.log(max(m, 1)), math.log(max(sigma, 1))]
+
+
+def _least_squares(rows: list[list[float]], targets: list[float]) -> list[float]:
+    """
+    Least squares coefficients for rows · x ≈ targets. Features that are constant in
+    the data (besides the intercept) cannot be fitted and get coefficient 0.
+    """
+    width = len(rows[0])
+    used = [0] + [j for j in range(1, width) if len({row[j] for row in rows}) > 1]
+    # Ecuaciones normales (XᵀX) x = Xᵀy, resueltas por eliminación gaussiana con pivoteo
+    a = [[sum(row[i] * row[j] for row in rows) for j in used] for i in used]
+    b = [sum(row[i] * y for row, y in zip(rows, targets)) for i in used]
+    size = len(used)
+    for col in range(size):
+        pivot = max(range(col, size), key=lambda r: abs(a[r][col]))
+        if abs(a[pivot][col]) < 1e-12:
+            raise ValueError("The benchmark data cannot determine the cost model.")
+        a[col], a[pivot] = a[pivot], a[col]
+        b[col], b[pivot] = b[pivot], b[col]
+        for r in range(col + 1, size):
+            factor = a[r][col] / a[col][col]
+            for c in range(col, size):
+                a[r][c] -= factor * a[col][c]
+            b[r] -= factor * b[col]
+    solution = [0.0] * size
+    for r in reversed(range(size)):
+        solution[r] = (b[r] - sum(a[r][c] * solution[c] for c in range(r + 1, size))) / a[r][r]
+    coefficients = [0.0] * width
+    for j, value in zip(used, solution):
+        coefficients[j] = value
+    return coefficients
+
+
+class CostModel:
+    """
+    Per-algorithm cost model: predicted preprocessing and search time as a function of
+    the text length n, the pattern length m and the alphabet size σ.
+    """
+
+    def __init__(self, algorithms: dict, metadata: dict = None):
+        """
+        :param algorithms: Mapping name -> {"search": coefficients, "preprocess":
+            coefficients, "ranges": {"n": [lo, hi], "m": [lo, hi], "sigma": [lo, hi]},
+            "samples": count}, coefficients in the order of FEATURES
+        :param metadata: Where and when the model was fitted
+        """
+        if not algorithms:
+            raise ValueError("The cost model needs at least one algorithm.")
+        self.algorithms = algorithms
+        self.metadata = metadata or {}
+
+    @classmethod
+    def fit(cls, report: dict, algorithms: list[str] = None) -> 'CostModel':
+        """
+        Fits the model to a benchmark report (see benchmark.runner). Uses the median
+        search and preprocessing times of each entry.
+
+        :param report: A report from run_benchmark or load_results
+        :param algorithms: Algorithms to fit (default: every one in the report)
+        """
+        config = report.get("config", {})
+        default_sigma = len(config.get("alphabet") or []) or None
+        samples: dict[str, list] = {}
+        for entry in report["results"]:
+            name = entry["algorithm"]
+            if algorithms is not None and name not in algorithms:
+                continue
+            # Los reportes anteriores a alphabet_size usan el alfabeto de la configuración
+            sigma = entry.get("alphabet_size") or default_sigma
+            search_time = entry["search"]["median"]
+            if sigma is None or search_time <= 0:
+                continue
+            samples.setdefault(name, []).append((entry["text_length"], entry["pattern_length"], sigma,
+                                                 search_time, entry["preprocess"]["median"]))
+        if not samples:
+            raise ValueError("The report has no usable measurements.")
+
+        fitted = {}
+        for name, points in samples.items():
+            rows = [_features(m, sigma) for _, m, sigma, _, _ in points]
+            search = _least_squares(rows, [math.log(t / n) for n, _, _, t, _ in points])
+            # Un preprocesamiento de 0 s (bajo la resolución del reloj) se toma como 1 ns
+            preprocess = _least_squares(rows, [math.log(max(p, 1e-9)) for _, _, _, _, p in points])
+            fitted[name] = {
+                "search": search,
+                "preprocess": preprocess,
+                "ranges": {key: [min(p[i] for p in points), max(p[i] for p in points)]
+                           for i, key in enumerate(("n", "m", "sigma"))},
+                "samples": len(points),
+            }
+        metadata = {
+            "fitted": datetime.now(timezone.utc).isoformat(),
+            "report_created": report.get("created"),
+            "environment": report.get("environment"),
+        }
+        return cls(fitted, metadata)
+
+    def predict(self, algorithm: str, n: int, m: int, sigma: int) -> tuple[float, float]:
+        """Predicted (preprocessing, search) seconds of 'algorithm'."""
+        coefficients = self.algorithms[algorithm]
+        x = _features(m, sigma)
+        preprocess = math.exp(sum(c * v for c, v in zip(coefficients["preprocess"], x)))
+        search = n * math.exp(sum(c * v for c, v in zip(coefficients["search"], x)))
+        return preprocess, search
+
+    def to_dict(self) -> dict:
+        return {
+            "schema": MODEL_SCHEMA_NAME,
+            "schema_version": MODEL_SCHEMA_VERSION,
+            "features": list(FEATURES),
+            "metadata": self.metadata,
+            "algorithms": self.algorithms,
+        }
+
+    def save(self, path: str = DEFAULT_MODEL_PATH):
+        """Writes the model as JSON."""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=4)
+
+    @classmethod
+    def load(cls, path: str = DEFAULT_MODEL_PATH) -> 'CostModel':
+        """Reads a model written by save(), checking its schema version."""
+        with open(path) as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or data.get("schema") != MODEL_SCHEMA_NAME:
+            raise ValueError(f"{path} is not a cost model (schema '{MODEL_SCHEMA_NAME}').")
+        if data.get("schema_version") != MODEL_SCHEMA_VERSION or data.get("features") != list(FEATURES):
+            raise ValueError(f"Unsupported cost model version {data.get('schema_version')}, "
+                             f"expected {MODEL_SCHEMA_VERSION}.")
+        return cls(data["algorithms"], data.get("metadata"))
+
+    def __repr__(self):
+        return f"CostModel(algorithms={list(self.algorithms)})"
+
+
+_default_model = None
+
+def default_model():
+    """The model in DEFAULT_MODEL_PATH, loaded once (None if there is no such file)."""
+    global _default_model
+    if _default_model is None and os.path.exists(DEFAULT_MODEL_PATH):
+        _default_model = CostModel.load(DEFAULT_MODEL_PATH)
+    return _default_model
+
+def set_default_model(model: CostModel = None):
+    """Replaces the model used by search() (None reloads DEFAULT_MODEL_PATH on next use)."""
+    global _default_model
+    _default_model = model
+
+
+def estimate_alphabet_size(text, pattern) -> int:
+    """
+    Alphabet size seen in the first SIGMA_SAMPLE symbols of the text plus the pattern.
+    """
+    if isinstance(text, PackedDNA):
+        return 4
+    sample = text[:SIGMA_SAMPLE]
+    if is_bytes_like(sample):
+        symbols = set(bytes(sample))
+        symbols.update(pattern.encode() if isinstance(pattern, str) else bytes(pattern))
+    else:
+        symbols = set(sample)
+        symbols.update(pattern)
+    return max(len(symbols), 1)
+
+
+class Selection:
+    """
+    The engine picked for a search and why: the predicted cost of every candidate
+    (seconds) and a one-line explanation.
+    """
+
+    def __init__(self, algorithm: str, n: int, m: int, sigma: int, estimates: dict, reason: str):
+        """
+        :param algorithm: The chosen algorithm
+        :param estimates: Mapping candidate -> {"preprocess", "search", "total"} seconds
+        :param reason: Human-readable explanation
+        """
+        self.algorithm = algorithm
+        self.n = n
+        self.m = m
+        self.sigma = sigma
+        self.estimates = estimates
+        self.reason = reason
+
+    def to_dict(self) -> dict:
+        return dict(vars(self))
+
+    def __str__(self):
+        return self.reason
+
+    def __repr__(self):
+        return f"Selection(algorithm={self.algorithm}, n={self.n}, m={self.m}, sigma={self.sigma})"
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds >= 1:
+        return f"{seconds:.2f} s"
+    if seconds >= 1e-3:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds * 1e6:.1f} µs"
+
+
+def select_algorithm(text, pattern, model: CostModel = None, candidates: list[str] = None) -> Selection:
+    """
+    Picks the algorithm with the lowest predicted cost for searching 'pattern' in 'text'.
+
+    :param model: Cost model (default: default_model())
+    :param candidates: Algorithms to choose from (default: those in the model)
+    """
+    model = model or default_model()
+    n, m = len(text), len(pattern)
+    sigma = estimate_alphabet_size(text, pattern)
+    if model is None:
+        return Selection(FALLBACK_ALGORITHM, n, m, sigma, {},
+                         f"{FALLBACK_ALGORITHM}: no cost model at {DEFAULT_MODEL_PATH} "
+                         f"(run python -m benchmark.calibrate)")
+
+    names = candidates if candidates is not None else list(model.algorithms)
+    names = [name for name in names
+             if name in model.algorithms and name in ALGORITHMS
+             and APPLICABLE.get(name, lambda _: True)(text)]
+    if not names:
+        raise ValueError("None of the candidate algorithms is in the cost model and applicable to the text.")
+    key = pattern if isinstance(pattern, (str, bytes)) else bytes(pattern)
+    estimates = {}
+    for name in names:
+        preprocess, search = model.predict(name, n, m, sigma)
+        if (name, key) in pattern_cache:
+            preprocess = 0.0
+        estimates[name] = {"preprocess": preprocess, "search": search, "total": preprocess + search}
+    ranking = sorted(names, key=lambda name: estimates[name]["total"])
+    best = ranking[0]
+    cost = estimates[best]
+    reason = (f"{best}: predicted {_format_seconds(cost['total'])} (search {_format_seconds(cost['search'])}"
+              + (f" + preprocess {_format_seconds(cost['preprocess'])}" if cost["preprocess"] else ", cached")
+              + f") for n={n}, m={m}, sigma≈{sigma}")
+    if len(ranking) > 1:
+        runner_up = ranking[1]
+        reason += (f"; next {runner_up} at {_format_seconds(estimates[runner_up]['total'])} "
+                   f"({estimates[runner_up]['total'] / cost['total']:.2f}x)")
+    ranges = model.algorithms[best]["ranges"]
+    outside = [f"{key}={value} not in [{ranges[key][0]}, {ranges[key][1]}]"
+               for key, value in (("n", n), ("m", m), ("sigma", sigma))
+               if not ranges[key][0] <= value <= ranges[key][1]]
+    if outside:
+        reason += "; extrapolated: " + ", ".join(outside)
+    return Selection(best, n, m, sigma, estimates, reason)
+
+
+def search(text, pattern, mode: str = "list", k: int = None, model: CostModel = None,
+           candidates: list[str] = None):
+    """
+    Searches 'pattern' in 'text' with the algorithm chosen by select_algorithm and
+    reports 0-based start positions, whichever engine runs.
+    'mode' and 'k' select the result form (see algorithms.results).
+
+    Example of usage:
+    positions = search(text, "GATTACA")
+    print(select_algorithm(text, "GATTACA"))  # engine picked and why
+    """
+    check_mode(mode, k)
+    algorithm = select_algorithm(text, pattern, model, candidates).algorithm
+    compiled = compile_pattern(pattern, algorithm)
+    if algorithm not in ONE_BASED:
+        return compiled.search(text, mode, k)
+    return collect((pos - 1 for pos in compiled.search(text, "iter")), mode, k)
@@ -0,0 +1,70 @@
+from algorithms.dawg import dawg_set
+from algorithms.results import check_mode, collect
+from algorithms.symbols import byte_view, is_bytes_like
+
+
+def set_backwards_dawg_matching(patterns: list, text, mode: str = "list", k: int = None):
+    """
+    Set-BDM: versión multipatrón de BDM. Se truncan todos los patrones al largo
+    mínimo lmin y se construye un solo DAWG sobre los prefijos truncados invertidos.
+    Cada ventana de largo lmin se lee de derecha a izquierda como en BDM; si se lee
+    completa, es candidata y se verifican los patrones con ese prefijo.
+
+    Las ocurrencias se reportan como (pattern_id, posición) con posición base 0,
+    igual que aho_corasick. El salto promedio es sublineal cuando lmin es grande.
+    'mode' y 'k' eligen la forma del resultado (ver algorithms.results; sin "array").
+    """
+    check_mode(mode, k, pairs=True)
+    if not patterns:
+        return collect(iter(()), mode, k)
+    if any(len(p) == 0 for p in patterns):
+        raise ValueError("Patterns must be non-empty.")
+    text = byte_view(text)
+    if is_bytes_like(text):
+        patterns = [p.encode() if isinstance(p, str) else bytes(p) for p in patterns]
+
+    lmin = min(len(p) for p in patterns)
+
+    # --- Preprocesamiento --- #
+    # prefijo truncado -> ids de los patrones que lo comparten
+    by_prefix: dict = {}
+    for pattern_id, pattern in enumerate(patterns):
+        by_prefix.setdefault(pattern[:lmin], []).append(pattern_id)
+    dawg_pr = dawg_set([prefix[::-1] for prefix in by_prefix]).compile()
+    return collect(_set_bdm_positions(patterns, text, lmin, by_prefix, dawg_pr), mode, k)
+
+def _set_bdm_positions(patterns: list, text, lmin: int, by_prefix: dict, dawg_pr):
+    n = len(text)
+    table = dawg_pr.table
+    symbol_index = dawg_pr.symbol_index
+    k = dawg_pr.num_symbols
+    accepting = dawg_pr.accepting
+
+    # --- Búsqueda ---
+    pos = 0
+    while pos <= n - lmin:
+        j = lmin
+        last = lmin
+        state = 0
+        while j > 0:
+            c = symbol_index.get(text[pos + j - 1])
+            if c is None:
+                break
+            state = table[state * k + c]
+            j -= 1
+            if state < 0:
+                break
+            if accepting[state]:
+                if j > 0:
+                    # text[pos+j : pos+lmin] es prefijo de algún patrón
+                    last = j
+                else:
+                    # Ventana candidata: verificamos los patrones completos
+                    window = text[pos:pos + lmin]
+                    if not isinstance(window, (str, bytes)):
+                        window = bytes(window) # memoryview no siempre es hashable
+                    for pattern_id in by_prefix.get(window, ()):
+                        pattern = patterns[pattern_id]
+                        if pos + len(pattern) <= n and text[pos:pos + len(pattern)] == pattern:
+                            yield pattern_id, pos
+        pos += last
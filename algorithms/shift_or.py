@@ -0,0 +1,58 @@
+from algorithms.results import check_mode, collect
+from algorithms.symbols import BYTE_ALPHABET_SIZE, as_symbols, symbol_codes, symbol_iter
+
+
+def shift_or_masks(pattern, wide: bool = False):
+    """
+    Máscaras de Shift-Or: el bit i de S[c] está apagado si p_i = c.
+    Con enteros de Python las máscaras no tienen límite de largo (m > 64 usa big ints).
+    Para símbolos de un byte se entrega una lista indexada por código; si no, un dict.
+    """
+    pattern_codes, size = symbol_codes(pattern, wide=wide)
+    m = len(pattern_codes)
+    full = (1 << m) - 1
+    masks = {}
+    for i in range(m):
+        c = pattern_codes[i]
+        masks[c] = masks.get(c, full) & ~(1 << i)
+    if size == BYTE_ALPHABET_SIZE:
+        table = [full] * size
+        for c, mask in masks.items():
+            table[c] = mask
+        return table
+    return masks
+
+
+def shift_or(text, pattern, masks=None, mode: str = "list", k: int = None):
+    """
+    Busca todas las apariciones del patrón con el algoritmo Shift-Or (bit-paralelo).
+    Las posiciones son base 0, igual que kmp_search.
+    Si se entrega masks (de shift_or_masks), se omite el preprocesamiento.
+    'mode' y 'k' eligen la forma del resultado (ver algorithms.results).
+    """
+    check_mode(mode, k)
+    text, pattern = as_symbols(text, pattern)
+    m = len(pattern)
+    if not pattern:
+        return collect(iter(()), mode, k)
+
+    wide = isinstance(text, str) and not (text.isascii() and pattern.isascii())
+    codes, size = symbol_iter(text, wide=wide)
+    if masks is None or (size != BYTE_ALPHABET_SIZE and isinstance(masks, list)):
+        masks = shift_or_masks(pattern, wide=wide)
+    full = (1 << m) - 1
+    if isinstance(masks, dict):
+        get = masks.get
+        lookup = lambda c: get(c, full)
+    else:
+        lookup = masks.__getitem__
+    return collect(_shift_or_positions(codes, m, lookup), mode, k)
+
+def _shift_or_positions(codes, m: int, lookup):
+    full = (1 << m) - 1
+    high = 1 << (m - 1)
+    d = full
+    for i, c in enumerate(codes):
+        d = ((d << 1) | lookup(c)) & full
+        if not d & high:
+            yield i - m + 1
@@ -0,0 +1,127 @@
+"""
+Búsqueda por trozos (streaming) sobre iterables de trozos o archivos binarios.
+
+Los generadores entregan posiciones absolutas a medida que se encuentran, usando
+memoria constante: KMP arrastra su estado entre trozos y BM/BDM arrastran los
+últimos m-1 caracteres, de modo que ninguna ocurrencia se reporta dos veces.
+"""
+from typing import Iterable, Iterator
+
+from algorithms.knuth_morris_pratt import compute_lps
+from algorithms.pattern_cache import compile_pattern
+from algorithms.results import check_mode, collect
+
+DEFAULT_CHUNK_SIZE = 2**20
+
+
+def iter_chunks(source, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator:
+    """
+    Yields chunks from a file-like object (anything with .read) or from an iterable of chunks.
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size debe ser positivo")
+    if hasattr(source, "read"):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        for chunk in source:
+            if chunk:
+                yield chunk
+
+
+def _same_type(pattern, chunk):
+    # Un archivo binario entrega bytes: el patrón se compara como bytes
+    if isinstance(chunk, (bytes, bytearray)) and isinstance(pattern, str):
+        return pattern.encode()
+    return pattern
+
+
+def kmp_search_stream(source: Iterable, pattern: str,
+                      chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[int]:
+    """
+    KMP sobre un flujo de trozos: el estado j se conserva entre trozos.
+    Entrega posiciones base 0, igual que kmp_search.
+    """
+    if not pattern:
+        return
+    lps = None
+    m = len(pattern)
+    j = 0
+    offset = 0  # posición absoluta del inicio del trozo actual
+    for chunk in iter_chunks(source, chunk_size):
+        if lps is None:
+            pattern = _same_type(pattern, chunk)
+            lps = compute_lps(pattern)
+        for i in range(len(chunk)):
+            c = chunk[i]
+            while j > 0 and pattern[j] != c:
+                j = lps[j - 1]
+            if pattern[j] == c:
+                j += 1
+                if j == m:
+                    yield offset + i - m + 1
+                    j = lps[j - 1]
+        offset += len(chunk)
+
+
+def _overlap_search_stream(source: Iterable, pattern: str, algorithm: str,
+                           chunk_size: int) -> Iterator[int]:
+    """
+    Ejecuta 'algorithm' sobre (cola de m-1 caracteres + trozo). Toda ocurrencia
+    encontrada termina dentro del trozo nuevo, así que no hay repeticiones.
+    """
+    if not pattern:
+        return
+    compiled = None
+    m = len(pattern)
+    tail = None
+    offset = 0  # posición absoluta del inicio de buffer
+    for chunk in iter_chunks(source, chunk_size):
+        if compiled is None:
+            compiled = compile_pattern(_same_type(pattern, chunk), algorithm)
+            tail = chunk[:0]
+        buffer = tail + chunk
+        yield from (offset + pos for pos in compiled.search(buffer, "iter"))
+        keep = min(m - 1, len(buffer))
+        tail = buffer[len(buffer) - keep:]
+        offset += len(buffer) - keep
+
+
+def boyer_moore_stream(source: Iterable, pattern: str,
+                       chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[int]:
+    """Boyer-Moore sobre un flujo de trozos. Entrega posiciones base 0."""
+    return _overlap_search_stream(source, pattern, "BM", chunk_size)
+
+
+def backwards_dawg_matching_stream(source: Iterable, pattern: str,
+                                   chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[int]:
+    """BDM sobre un flujo de trozos. Entrega posiciones base 1."""
+    return _overlap_search_stream(source, pattern, "BDM", chunk_size)
+
+
+STREAM_ALGORITHMS = {
+    "KMP": kmp_search_stream,
+    "BM": boyer_moore_stream,
+    "BDM": backwards_dawg_matching_stream,
+}
+
+
+def stream_search(source: Iterable, pattern: str, algorithm: str = "KMP",
+                  chunk_size: int = DEFAULT_CHUNK_SIZE, mode: str = "iter", k: int = None):
+    """
+    Searches 'pattern' in a file-like object or iterable of chunks, yielding absolute offsets.
+    'mode' and 'k' select the result form (see algorithms.results); the default
+    "iter" returns the generator. "exists" and "first_k" stop reading the source early.
+
+    Example of usage:
+    with open("genoma.txt", "rb") as f:
+        for pos in stream_search(f, "ACGT", "BM"):
+            print(pos)
+    """
+    check_mode(mode, k)
+    if algorithm not in STREAM_ALGORITHMS:
+        raise ValueError(f"Unknown algorithm '{algorithm}', expected one of {list(STREAM_ALGORITHMS)}.")
+    return collect(STREAM_ALGORITHMS[algorithm](source, pattern, chunk_size), mode, k)
@@ -0,0 +1,152 @@
+"""
+Arreglo de sufijos para consultas repetidas sobre un texto fijo.
+
+Se construye una vez por duplicación de prefijos (prefix doubling) y luego cada
+patrón se resuelve con búsqueda binaria en O(m log n).
+"""
+from array import array
+
+from algorithms.symbols import as_symbols, symbol_codes
+
+
+# Largo de los prefijos de la primera ronda
+INITIAL_LENGTH = 8
+
+
+def _sliceable(text, codes, size):
+    """Secuencia cuyas rebanadas son str o bytes (comparables con <)."""
+    if size > 256:
+        return text
+    if isinstance(codes, memoryview):
+        return _BytesSlices(codes)
+    return codes
+
+
+def suffix_array(text) -> array:
+    """
+    Builds the suffix array of 'text' by prefix doubling: the first round sorts by the
+    first INITIAL_LENGTH symbols; in each following round suffixes are sorted by the
+    pair (rank[i], rank[i+k]) encoded as a single int, then k doubles.
+    Stops as soon as every rank is distinct.
+
+    :return: array('q') with the starting positions of the sorted suffixes
+    """
+    codes, size = symbol_codes(text)
+    n = len(codes)
+    if n == 0:
+        return array("q")
+
+    # Ronda inicial: se ordena directamente por los primeros INITIAL_LENGTH símbolos
+    # (rebanadas str/bytes), lo que ahorra las primeras rondas de duplicación.
+    slices = _sliceable(text, codes, size)
+    key = [slices[i:i + INITIAL_LENGTH] for i in range(n)]
+    sa = sorted(range(n), key=key.__getitem__)
+    rank = [0] * n
+    r = 0
+    prev = key[sa[0]]
+    for i in sa:
+        if key[i] != prev:
+            r += 1
+            prev = key[i]
+        rank[i] = r
+    del key
+    if r == n - 1:
+        return array("q", sa)
+
+    k = INITIAL_LENGTH
+    while True:
+        base = max(rank) + 2
+        # rank[i+k] + 1, con 0 para los sufijos que terminan antes (son menores)
+        key = [rank[i] * base + (rank[i + k] + 1 if i + k < n else 0) for i in range(n)]
+        # sa ya está ordenado por rank: Timsort aprovecha las corridas
+        sa.sort(key=key.__getitem__)
+        new_rank = [0] * n
+        r = 0
+        prev = key[sa[0]]
+        for i in sa:
+            if key[i] != prev:
+                r += 1
+                prev = key[i]
+            new_rank[i] = r
+        rank = new_rank
+        if r == n - 1:
+            break
+        k *= 2
+    return array("q", sa)
+
+
+class _BytesSlices:
+    """Devuelve bytes al rebanar un memoryview, para poder compararlos con <."""
+
+    __slots__ = ("_view",)
+
+    def __init__(self, view: memoryview):
+        self._view = view
+
+    def __getitem__(self, index: slice) -> bytes:
+        return self._view[index].tobytes()
+
+
+class SuffixArray:
+    """
+    Suffix array index of a fixed text, answering count and locate in O(m log n).
+
+    Example of usage:
+    index = SuffixArray(text)
+    index.count("ACGT")
+    index.locate("ACGT")  # sorted 0-based positions
+    """
+
+    def __init__(self, text):
+        self.text = text
+        codes, size = symbol_codes(text)
+        # Las comparaciones por rebanadas necesitan str o bytes (memoryview no se ordena)
+        self.codes = _sliceable(text, codes, size)
+        self.sa = suffix_array(text)
+
+    def _range(self, pattern) -> tuple[int, int]:
+        """Rows [lo, hi) of the suffixes that start with 'pattern'."""
+        _, pattern = as_symbols(self.text, pattern)
+        codes = self.codes
+        if not isinstance(codes, str):
+            if isinstance(pattern, str) and not pattern.isascii():
+                # Texto codificado como ASCII: un patrón no ASCII no puede aparecer
+                return 0, 0
+            pattern, _ = symbol_codes(pattern)
+            pattern = bytes(pattern)
+        sa = self.sa
+        m = len(pattern)
+
+        lo, hi = 0, len(sa)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if codes[sa[mid]:sa[mid] + m] < pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        start = lo
+        hi = len(sa)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if codes[sa[mid]:sa[mid] + m] == pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        return start, lo
+
+    def count(self, pattern) -> int:
+        """Number of occurrences of 'pattern' (n + 1 for the empty pattern, like str.count)."""
+        if len(pattern) == 0:
+            return len(self.sa) + 1
+        start, end = self._range(pattern)
+        return end - start
+
+    def locate(self, pattern) -> list[int]:
+        """
+        Sorted 0-based positions of 'pattern', like kmp_search. The empty pattern
+        occurs at every position 0..n, so locate and count always agree.
+        """
+        if len(pattern) == 0:
+            return list(range(len(self.sa) + 1))
+        start, end = self._range(pattern)
+        return sorted(self.sa[start:end])
@@ -0,0 +1,104 @@
+"""
+Normalización de texto y patrón para los algoritmos de búsqueda.
+
+Los textos binarios (bytes, bytearray, memoryview, mmap) se indexan sin copiarlos
+y entregan símbolos enteros; en ese caso el patrón se convierte a bytes para que
+ambos usen el mismo tipo de símbolo.
+"""
+import mmap
+from itertools import chain
+
+from data.packed_dna import PackedDNA
+
+BYTES_LIKE = (bytes, bytearray, memoryview, mmap.mmap)
+
+
+def is_bytes_like(obj) -> bool:
+    """Returns whether indexing 'obj' yields integer symbols."""
+    return isinstance(obj, BYTES_LIKE)
+
+
+def byte_view(text):
+    """A memoryview of another format (e.g. 'H') is read byte by byte, like bytes."""
+    if isinstance(text, memoryview) and text.format != "B":
+        return text.cast("B")
+    return text
+
+
+def as_symbols(text, pattern):
+    """
+    Returns (text, pattern) using the same kind of symbols.
+
+    :param text: str, bytes, bytearray, memoryview or mmap.mmap
+    :param pattern: str or bytes-like
+    :return: The text (never copied) and the pattern converted to match it
+    """
+    if is_bytes_like(text):
+        text = byte_view(text)
+        if isinstance(pattern, str):
+            pattern = pattern.encode()
+        elif not isinstance(pattern, bytes):
+            pattern = bytes(pattern)
+    elif is_bytes_like(pattern):
+        pattern = bytes(pattern).decode()
+    return text, pattern
+
+
+# Tamaño de las tablas indexadas por código de símbolo
+BYTE_ALPHABET_SIZE = 256
+UNICODE_ALPHABET_SIZE = 0x110000
+# Símbolos de un str que symbol_iter codifica de una vez
+ITER_BLOCK = 1 << 16
+
+
+def symbol_codes(seq, wide: bool = False):
+    """
+    Returns (codes, alphabet_size) where indexing 'codes' yields ints below alphabet_size.
+    ASCII strings become bytes; other strings become a memoryview of code points;
+    a PackedDNA is read through its ASCII view without unpacking it.
+
+    A str is copied: an ASCII one into n bytes, any other into 4n bytes of UTF-32.
+    Matchers that read the text left to right should use symbol_iter instead; those
+    that jump around the text (Boyer-Moore, BNDM) pay for the copy.
+
+    :param seq: str or bytes-like sequence
+    :param wide: Force the code point representation for strings
+    """
+    if isinstance(seq, str):
+        if not wide and seq.isascii():
+            return seq.encode(), BYTE_ALPHABET_SIZE
+        return memoryview(seq.encode("utf-32-le")).cast("I"), UNICODE_ALPHABET_SIZE
+    if isinstance(seq, PackedDNA):
+        return seq.ascii_codes(), BYTE_ALPHABET_SIZE
+    if isinstance(seq, memoryview) and seq.format != "B":
+        seq = seq.cast("B")
+    return seq, BYTE_ALPHABET_SIZE
+
+
+def symbol_iter(seq, wide: bool = False, start: int = 0, end: int = None):
+    """
+    Returns (codes, alphabet_size) like symbol_codes, but 'codes' is an iterator over
+    the codes of seq[start:end] and a str is encoded ITER_BLOCK symbols at a time
+    instead of all at once.
+
+    :param seq: str or bytes-like sequence
+    :param wide: Force the code point representation for strings
+    :param start: First position to read
+    :param end: Position after the last one to read (by default, the end of seq)
+    """
+    if isinstance(seq, str):
+        end = len(seq) if end is None else min(end, len(seq))
+        # Se codifica por bloques: memoria acotada y se itera a la velocidad de bytes
+        starts = range(start, end, ITER_BLOCK)
+        wide = wide or not all(seq[i:min(i + ITER_BLOCK, end)].isascii() for i in starts)
+        blocks = (symbol_codes(seq[i:min(i + ITER_BLOCK, end)], wide=wide)[0] for i in starts)
+        return chain.from_iterable(blocks), UNICODE_ALPHABET_SIZE if wide else BYTE_ALPHABET_SIZE
+    if isinstance(seq, PackedDNA):
+        seq = seq.ascii_codes()
+    elif isinstance(seq, (bytes, bytearray, memoryview)):
+        # Un memoryview recorta sin copiar y se itera en enteros
+        seq = byte_view(memoryview(seq))
+        return iter(seq[start:end]), BYTE_ALPHABET_SIZE
+    # mmap itera en bytes de largo 1, no en enteros: se indexa
+    end = len(seq) if end is None else end
+    return map(seq.__getitem__, range(start, end)), BYTE_ALPHABET_SIZE
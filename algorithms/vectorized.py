@@ -0,0 +1,117 @@
+"""
+Búsqueda vectorizada con NumPy para textos de alfabeto pequeño (p. ej. ACGT).
+
+El texto se codifica como un arreglo uint8 (sin copia para bytes, memoryview y
+mmap). Por bloques se arma el q-grama de cada posición (q <= 8 símbolos empacados
+en un uint64; con q = 8 es solo una vista del mismo buffer) y se compara con el
+q-grama inicial del patrón; las posiciones que sobreviven se verifican contra el
+resto del patrón de a 8 bytes, por tandas de a lo más VERIFY_ROWS candidatas.
+
+NumPy es una dependencia opcional: solo se importa al usar este módulo.
+"""
+
+from algorithms.results import check_mode, collect_chunks
+from algorithms.symbols import as_symbols
+
+DEFAULT_BLOCK_SIZE = 2**22
+# Candidatas que se verifican a la vez: acota la memoria con textos periódicos,
+# donde casi todas las posiciones pasan el filtro
+VERIFY_ROWS = 2**16
+
+
+def numpy_available() -> bool:
+    """Returns whether NumPy can be imported."""
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def as_uint8_array(seq):
+    """
+    Returns 'seq' as a uint8 NumPy array. Bytes-like inputs are wrapped without copying.
+    """
+    import numpy as np
+
+    if isinstance(seq, np.ndarray):
+        if seq.dtype != np.uint8:
+            raise ValueError("The array must have dtype uint8.")
+        return seq
+    if isinstance(seq, str):
+        # Las posiciones en bytes coinciden con las del str solo si es ASCII
+        if not seq.isascii():
+            raise ValueError("vectorized_search needs an ASCII str or a bytes-like text.")
+        seq = seq.encode()
+    return np.frombuffer(seq, dtype=np.uint8)
+
+
+def vectorized_search(text, pattern, pattern_array=None, block_size: int = DEFAULT_BLOCK_SIZE,
+                      mode: str = "list", k: int = None):
+    """
+    Searches 'pattern' in 'text' with NumPy. Positions are 0-based, like kmp_search.
+    If 'pattern_array' (from as_uint8_array) is given, the pattern is not encoded again.
+    'mode' and 'k' select the result form (see algorithms.results); "count" never
+    converts the positions to Python ints and "exists" stops after the first block
+    with a match.
+
+    Example of usage:
+    result = vectorized_search(text, "ACGTACGT")
+    """
+    check_mode(mode, k)
+    if pattern_array is None:
+        # Texto binario y patrón str: el patrón se compara por sus bytes UTF-8
+        text, pattern = as_symbols(text, pattern)
+    t = as_uint8_array(text)
+    p = pattern_array if pattern_array is not None else as_uint8_array(pattern)
+    n = len(t)
+    m = len(p)
+    if m == 0 or m > n:
+        return collect_chunks(iter(()), mode, k)
+    return collect_chunks(_vectorized_blocks(t, p, block_size), mode, k)
+
+
+def _vectorized_blocks(t, p, block_size: int):
+    """Yields, block by block, the NumPy array of match positions."""
+    import numpy as np
+
+    n = len(t)
+    m = len(p)
+
+    # q-grama del patrón: los primeros q símbolos empacados en little-endian
+    q = min(m, 8)
+    key = 0
+    for k in range(q):
+        key |= int(p[k]) << (8 * k)
+
+    # Resto del patrón en palabras de 8 bytes; la última se solapa con la anterior
+    # para que todas queden dentro del patrón
+    offsets = list(range(8, m - 8, 8)) + [m - 8] if m > 8 else []
+    words = np.ndarray(shape=(n - 7,), dtype="<u8", buffer=t, strides=(1,)) if offsets else None
+    keys = [np.uint64(int.from_bytes(p[o:o + 8].tobytes(), "little")) for o in offsets]
+
+    last_start = n - m + 1  # cantidad de ventanas
+    for start in range(0, last_start, block_size):
+        size = min(block_size, last_start - start)
+
+        # Filtro: q-grama de cada ventana del bloque
+        if q == 8:
+            # Vista sin copia: cada posición se lee como un uint64 (no alineado) de 8 bytes
+            grams = np.ndarray(shape=(size,), dtype="<u8", buffer=t, offset=start, strides=(1,))
+        else:
+            grams = t[start:start + size].astype(np.uint64)
+            for k in range(1, q):
+                grams |= t[start + k:start + k + size].astype(np.uint64) << np.uint64(8 * k)
+        candidates = np.flatnonzero(grams == np.uint64(key)) + start
+        del grams
+        if not offsets:
+            yield candidates
+            continue
+
+        for first in range(0, candidates.size, VERIFY_ROWS):
+            rows = candidates[first:first + VERIFY_ROWS]
+            for offset, word in zip(offsets, keys):
+                if rows.size == 0:
+                    break
+                rows = rows[words[rows + offset] == word]
+            yield rows
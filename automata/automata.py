@@ -1,5 +1,8 @@
 # Automata is the class that represents an automata.
 # It is used to create and manipulate automata.
+from array import array
+
+from automata.compiled_dfa import CompiledDFA
 from automata.node import AutomataState
 
 
@@ -26,14 +29,24 @@ class Automata:
 
         states = states or []
         alphabet = alphabet or []
-        transitions = transitions or {}
+        # Copia de dos niveles: los estados comparten sus diccionarios con self.transitions
+        # y no deben modificar el del llamador
+        transitions = {name: dict(by_symbol) for name, by_symbol in (transitions or {}).items()}
         final_states = final_states or []
 
         # --- Validaciones (simplificadas para brevedad, las tuyas son más completas) ---
         if states and not all(isinstance(state, AutomataState) for state in states):
             raise ValueError("All states must be instances of AutomataState.")
-        if initial_state and initial_state not in states:
+        # Índice nombre -> estado; todos los mutadores lo mantienen sincronizado.
+        self._states_by_name: dict[str, AutomataState] = {}
+        for state_obj in states:
+            if state_obj.name in self._states_by_name:
+                raise ValueError(f"State '{state_obj.name}' is not unique.")
+            self._states_by_name[state_obj.name] = state_obj
+        if initial_state and initial_state.name not in self._states_by_name:
             raise ValueError("Initial state must be in the list of states.")
+        if any(state_obj.name not in self._states_by_name for state_obj in final_states):
+            raise ValueError("Final states must be in the list of states.")
         # ... (más validaciones de tu código original) ...
 
         # Esta línea es importante: configura state.transitions para cada estado.
@@ -41,7 +54,7 @@ class Automata:
         # Para un NFA, si los AutomataState ya tenían transiciones NFA en _nfa_transitions_store,
         # esta línea NO las afecta, lo cual es bueno.
         for state_obj in states: # Renombrado 'state' a 'state_obj' para claridad
-            state_obj.transitions = transitions.get(state_obj.name, {})
+            state_obj.transitions = transitions.setdefault(state_obj.name, {})
 
         self.epsilon = "ε" # Símbolo Epsilon estándar
         self.states = states
@@ -51,13 +64,76 @@ class Automata:
         self.initial_state = initial_state
         self.final_states = final_states
 
+    @classmethod
+    def from_edges(cls,
+                   states: list[str],
+                   edges: list[tuple[str, str, str]],
+                   initial: str,
+                   finals: list[str],
+                   alphabet: list[str] = None) -> 'Automata':
+        """
+        Build an automata in bulk from state names and (source, symbol, target) edges.
+        Edges whose symbol is epsilon become epsilon transitions. Everything is
+        validated in a single pass, so the construction is linear in the input size.
+
+        :param states: List of state names
+        :param edges: List of (source name, symbol, target name) tuples
+        :param initial: Name of the initial state
+        :param finals: Names of the final states
+        :param alphabet: List of symbols; inferred from the edges if not given
+        :return: The new automata
+        """
+        finals = set(finals)
+        state_objs = []
+        by_name: dict[str, AutomataState] = {}
+        for name in states:
+            if name in by_name:
+                raise ValueError(f"State '{name}' is not unique.")
+            state_obj = AutomataState(name=name, is_accepting=name in finals)
+            by_name[name] = state_obj
+            state_objs.append(state_obj)
+        if initial not in by_name:
+            raise ValueError(f"State '{initial}' not found.")
+        missing = finals.difference(by_name)
+        if missing:
+            raise ValueError(f"State '{sorted(missing)[0]}' not found.")
+
+        automata = cls(states=state_objs,
+                       alphabet=list(alphabet) if alphabet is not None else [],
+                       initial_state=by_name[initial],
+                       final_states=[s for s in state_objs if s.is_accepting])
+        epsilon = automata.epsilon
+        known_symbols = set(automata.alphabet)
+        infer_alphabet = alphabet is None
+
+        for state_name, symbol, next_state_name in edges:
+            state = by_name.get(state_name)
+            next_s = by_name.get(next_state_name)
+            if state is None: raise ValueError(f"State '{state_name}' not found.")
+            if next_s is None: raise ValueError(f"Next state '{next_state_name}' not found.")
+            state.add_nfa_transition(symbol, next_s)
+            if symbol == epsilon:
+                continue
+            if symbol not in known_symbols:
+                if not infer_alphabet:
+                    raise ValueError(f"Symbol '{symbol}' not in alphabet (and not epsilon).")
+                known_symbols.add(symbol)
+                automata.alphabet.append(symbol)
+            # Igual que add_transition: visión estilo DFA, la última transición gana
+            automata.transitions.setdefault(state_name, {})[symbol] = next_s
+        return automata
+
     def add_state(self, state: 'AutomataState'):
         if not isinstance(state, AutomataState):
             raise ValueError("State must be an instance of AutomataState.")
-        if any(state.name == s.name for s in self.states):
+        if state.name in self._states_by_name:
             raise ValueError(f"State '{state.name}' is not unique.")
         self.states.append(state)
-        if state.is_accepting and state not in self.final_states: # Evitar duplicados
+        self._states_by_name[state.name] = state
+        # Compartimos el diccionario para que self.transitions y state.transitions coincidan
+        state.transitions = self.transitions.setdefault(state.name, state.transitions)
+        # El nombre es nuevo, por lo que el estado no puede estar ya en final_states
+        if state.is_accepting:
             self.final_states.append(state)
 
     def add_transition(self, state_name: str, symbol: str, next_state_name: str):
@@ -66,8 +142,8 @@ class Automata:
         La actualización de self.transitions aquí es inherentemente DFA.
         Para esta tarea, nos enfocaremos en que los AutomataState tengan la info NFA.
         """
-        state = next((s for s in self.states if s.name == state_name), None)
-        next_s = next((s for s in self.states if s.name == next_state_name), None)
+        state = self._states_by_name.get(state_name)
+        next_s = self._states_by_name.get(next_state_name)
 
         if state is None: raise ValueError(f"State '{state_name}' not found.")
         if next_s is None: raise ValueError(f"Next state '{next_state_name}' not found.")
@@ -88,8 +164,8 @@ class Automata:
     def add_epsilon_transition(self, state_name: str, next_state_name: str):
         # Epsilon no necesita estar en self.alphabet para esta lógica,
         # pero sí para la conversión a DFA (se excluye explícitamente).
-        state = next((s for s in self.states if s.name == state_name), None)
-        next_s = next((s for s in self.states if s.name == next_state_name), None)
+        state = self._states_by_name.get(state_name)
+        next_s = self._states_by_name.get(next_state_name)
         if state is None: raise ValueError(f"State '{state_name}' not found.")
         if next_s is None: raise ValueError(f"Next state '{next_state_name}' not found.")
 
@@ -107,29 +183,23 @@ class Automata:
         initial_states_for_closure: set[AutomataState]
         if isinstance(state_or_states, AutomataState):
             # Validar que el estado existe en el autómata
-            if state_or_states not in self.states:
-                s_obj_by_name = next((s for s in self.states if s.name == state_or_states.name), None)
-                if not s_obj_by_name:
-                    raise ValueError(f"State {state_or_states.name} not part of this automaton.")
-                initial_states_for_closure = {s_obj_by_name}
-            else:
-                initial_states_for_closure = {state_or_states}
+            s_obj_by_name = self._states_by_name.get(state_or_states.name)
+            if s_obj_by_name is None:
+                raise ValueError(f"State {state_or_states.name} not part of this automaton.")
+            initial_states_for_closure = {s_obj_by_name}
         elif isinstance(state_or_states, set):
             initial_states_for_closure = set()
             for s_in_set in state_or_states:
                 if not isinstance(s_in_set, AutomataState):
                     raise ValueError("All elements in states_set must be AutomataState objects.")
                 # Validar que los estados del conjunto existen en el autómata
-                if s_in_set not in self.states:
-                    s_obj_by_name = next((s for s in self.states if s.name == s_in_set.name), None)
-                    if not s_obj_by_name:
-                        raise ValueError(f"State {s_in_set.name} from set not part of this automaton.")
-                    initial_states_for_closure.add(s_obj_by_name)
-                else:
-                    initial_states_for_closure.add(s_in_set)
+                s_obj_by_name = self._states_by_name.get(s_in_set.name)
+                if s_obj_by_name is None:
+                    raise ValueError(f"State {s_in_set.name} from set not part of this automaton.")
+                initial_states_for_closure.add(s_obj_by_name)
         else:
             # Si se pasó un nombre de estado (string) para el caso de un solo estado
-            s_obj = next((s for s in self.states if s.name == str(state_or_states)), None)
+            s_obj = self._states_by_name.get(str(state_or_states))
             if not s_obj:
                 raise ValueError(f"State '{state_or_states}' not found or invalid type.")
             initial_states_for_closure = {s_obj}
@@ -148,10 +218,19 @@ class Automata:
                     stack.append(next_s)
         return closure
 
-    def to_deterministic(self) -> 'Automata':
+    def to_deterministic(self, method: str = "subset") -> 'Automata':
         """
         Convierte este autómata (asumido NFA) a un DFA equivalente.
+
+        :param method: "subset" usa conjuntos de AutomataState y nombra cada estado DFA
+            con los nombres de sus estados NFA ("{q_1,q_2}"); "bitset" numera los estados
+            NFA, representa cada conjunto con una máscara de bits int y nombra los
+            estados DFA "d_0", "d_1", ... en orden de descubrimiento.
         """
+        if method == "bitset":
+            return self._to_deterministic_bitset()
+        if method != "subset":
+            raise ValueError(f"Unknown method '{method}', expected 'subset' or 'bitset'.")
         if self.initial_state is None:
             raise ValueError("El NFA debe tener un estado inicial para la conversión a DFA.")
 
@@ -267,6 +346,270 @@ class Automata:
                        final_states=dfa_final_states_list)
         return dfa
 
+    def _to_deterministic_bitset(self) -> 'Automata':
+        """
+        Construcción de subconjuntos con máscaras de bits: el estado NFA i es el bit i.
+        La clausura épsilon de cada estado se calcula una sola vez y move() une las
+        filas precalculadas de los bits de la máscara, ya cerradas bajo épsilon.
+        """
+        if self.initial_state is None:
+            raise ValueError("El NFA debe tener un estado inicial para la conversión a DFA.")
+
+        dfa_alphabet = [sym for sym in self.alphabet if sym != self.epsilon]
+        state_ids = {s.name: i for i, s in enumerate(self.states)}
+        n = len(self.states)
+
+        # 1. Clausura épsilon de cada estado NFA, como máscara
+        eps_targets = [[state_ids[t.name] for t in s.get_nfa_transitions(self.epsilon)]
+                       for s in self.states]
+        closure = [0] * n
+        for i in range(n):
+            mask = 1 << i
+            stack = [i]
+            while stack:
+                for t in eps_targets[stack.pop()]:
+                    if not (mask >> t) & 1:
+                        mask |= 1 << t
+                        stack.append(t)
+            closure[i] = mask
+
+        # 2. step[a][i] = clausura épsilon de move({i}, a); move distribuye sobre la unión
+        step: dict[str, list[int]] = {}
+        for symbol in dfa_alphabet:
+            row = [0] * n
+            for i, s in enumerate(self.states):
+                mask = 0
+                for t in s.get_nfa_transitions(symbol):
+                    mask |= closure[state_ids[t.name]]
+                row[i] = mask
+            step[symbol] = row
+
+        accepting_mask = 0
+        for i, s in enumerate(self.states):
+            if s.is_accepting:
+                accepting_mask |= 1 << i
+
+        def move(mask: int, symbol: str) -> int:
+            # Cada máscara se expande una sola vez en el BFS: no hace falta memorizar
+            row = step[symbol]
+            result = 0
+            while mask:
+                low = mask & -mask
+                result |= row[low.bit_length() - 1]
+                mask ^= low
+            return result
+
+        # 3. BFS sobre las máscaras alcanzables desde la clausura del estado inicial
+        initial_mask = closure[state_ids[self.initial_state.name]]
+        dfa_ids: dict[int, int] = {initial_mask: 0}
+        masks = [initial_mask]
+        dfa_edges: list[dict[str, int]] = []
+        head = 0
+        while head < len(masks):
+            mask = masks[head]
+            head += 1
+            edges = {}
+            for symbol in dfa_alphabet:
+                target = move(mask, symbol)
+                if not target:
+                    continue
+                target_id = dfa_ids.get(target)
+                if target_id is None:
+                    target_id = len(masks)
+                    dfa_ids[target] = target_id
+                    masks.append(target)
+                edges[symbol] = target_id
+            dfa_edges.append(edges)
+
+        # 4. Construir el DFA
+        dfa_states_list = [AutomataState(name=f"d_{i}", is_accepting=bool(mask & accepting_mask))
+                           for i, mask in enumerate(masks)]
+        dfa_transitions = {
+            dfa_states_list[i].name: {symbol: dfa_states_list[j] for symbol, j in edges.items()}
+            for i, edges in enumerate(dfa_edges)
+        }
+        return Automata(states=dfa_states_list,
+                        alphabet=dfa_alphabet,
+                        transitions=dfa_transitions,
+                        initial_state=dfa_states_list[0],
+                        final_states=[s for s in dfa_states_list if s.is_accepting])
+
+    def minimize(self, prune: bool = True, report: bool = False):
+        """
+        Minimiza este autómata (asumido DFA) con el algoritmo de Hopcroft,
+        en O(n·|Σ|·log n). Las transiciones faltantes van a un estado sumidero
+        implícito, que se descarta al final junto con los estados equivalentes a él.
+
+        :param prune: If True, drop unreachable and dead states first
+        :param report: If True, also return a dict with before/after state counts
+        :return: The minimal DFA, or (DFA, report) if report is True
+        """
+        if self.initial_state is None:
+            raise ValueError("The automata must have an initial state to be minimized.")
+
+        symbols = [sym for sym in self.alphabet if sym != self.epsilon]
+        states = list(self.states)
+        if prune:
+            # Estados alcanzables desde el inicial
+            seen = {self.initial_state.name}
+            stack = [self._states_by_name[self.initial_state.name]]
+            while stack:
+                for next_s in stack.pop().transitions.values():
+                    if next_s.name not in seen:
+                        seen.add(next_s.name)
+                        stack.append(self._states_by_name[next_s.name])
+            states = [s for s in states if s.name in seen]
+        unreachable = len(self.states) - len(states)
+
+        # Ids enteros; el id n es el sumidero implícito
+        ids = {s.name: i for i, s in enumerate(states)}
+        n = len(states)
+        sink = n
+        delta = [[sink] * len(symbols) for _ in range(n + 1)]
+        inverse = [[[] for _ in range(n + 1)] for _ in symbols]
+        for i, s in enumerate(states):
+            for c, symbol in enumerate(symbols):
+                next_s = s.transitions.get(symbol)
+                if next_s is not None and next_s.name in ids:
+                    delta[i][c] = ids[next_s.name]
+        for i in range(n + 1):
+            for c in range(len(symbols)):
+                inverse[c][delta[i][c]].append(i)
+
+        # Partición inicial: finales / no finales (el sumidero no es final)
+        finals = {i for i, s in enumerate(states) if s.is_accepting}
+        others = set(range(n + 1)) - finals
+        blocks = [b for b in (finals, others) if b]
+        block_of = [0] * (n + 1)
+        for b, members in enumerate(blocks):
+            for i in members:
+                block_of[i] = b
+
+        # Lista de trabajo con el bloque más pequeño para cada símbolo
+        work = set()
+        if len(blocks) == 2:
+            smaller = 0 if len(blocks[0]) <= len(blocks[1]) else 1
+            work = {(smaller, c) for c in range(len(symbols))}
+
+        while work:
+            b, c = work.pop()
+            splitter = set()
+            for t in blocks[b]:
+                splitter.update(inverse[c][t])
+            touched: dict[int, set[int]] = {}
+            for x in splitter:
+                touched.setdefault(block_of[x], set()).add(x)
+            for y, inter in touched.items():
+                if len(inter) == len(blocks[y]):
+                    continue
+                # Separamos Y en (Y \ X) y (Y ∩ X)
+                z = len(blocks)
+                blocks[y] -= inter
+                blocks.append(inter)
+                for x in inter:
+                    block_of[x] = z
+                for d in range(len(symbols)):
+                    if (y, d) in work:
+                        work.add((z, d))
+                    elif len(inter) <= len(blocks[y]):
+                        work.add((z, d))
+                    else:
+                        work.add((y, d))
+
+        # El bloque del sumidero contiene los estados muertos
+        dead_block = block_of[sink]
+        dead = len(blocks[dead_block]) - 1
+        keep_dead = not prune and dead > 0
+
+        # Numeramos los bloques en orden BFS desde el inicial
+        initial_block = block_of[ids[self.initial_state.name]]
+        representative = {}
+        for i in range(n):
+            representative.setdefault(block_of[i], i)
+        order = []
+        new_id = {}
+        queue = [initial_block] + [b for b in representative if b != initial_block]
+        head = 0
+        while head < len(queue):
+            b = queue[head]
+            head += 1
+            if b in new_id or (b == dead_block and not keep_dead and b != initial_block):
+                continue
+            new_id[b] = len(order)
+            order.append(b)
+            for c in range(len(symbols)):
+                t = delta[representative[b]][c]
+                if t != sink:
+                    queue.append(block_of[t])
+
+        min_states = [AutomataState(name=f"m_{i}", is_accepting=states[representative[b]].is_accepting)
+                      for i, b in enumerate(order)]
+        min_transitions = {}
+        for i, b in enumerate(order):
+            edges = {}
+            for c, symbol in enumerate(symbols):
+                t = delta[representative[b]][c]
+                if t != sink and block_of[t] in new_id:
+                    edges[symbol] = min_states[new_id[block_of[t]]]
+            min_transitions[min_states[i].name] = edges
+
+        dfa = Automata(states=min_states,
+                       alphabet=symbols,
+                       transitions=min_transitions,
+                       initial_state=min_states[0],
+                       final_states=[s for s in min_states if s.is_accepting])
+        if not report:
+            return dfa
+        return dfa, {
+            "states_before": len(self.states),
+            "states_after": len(min_states),
+            "unreachable_removed": unreachable,
+            "dead_removed": dead if prune else 0,
+        }
+
+    def compile(self) -> 'CompiledDFA':
+        """
+        Compila este autómata (asumido DFA) a un CompiledDFA inmutable:
+        estados con ids enteros (el inicial es 0), un mapa símbolo -> índice,
+        una tabla plana array('i') con -1 para transiciones inexistentes y un
+        byte por estado que indica si es de aceptación.
+
+        :return: The compiled DFA
+        """
+        if self.initial_state is None:
+            raise ValueError("The automata must have an initial state to be compiled.")
+
+        symbols = [sym for sym in self.alphabet if sym != self.epsilon]
+        symbol_index = {sym: i for i, sym in enumerate(symbols)}
+
+        # El estado inicial siempre recibe el id 0
+        ordered = [self.initial_state] + [s for s in self.states if s.name != self.initial_state.name]
+        state_ids = {s.name: i for i, s in enumerate(ordered)}
+
+        k = len(symbols)
+        table = array("i", [-1]) * (len(ordered) * k)
+        accepting = bytearray(len(ordered))
+        for i, state_obj in enumerate(ordered):
+            if state_obj.is_accepting:
+                accepting[i] = 1
+            for symbol, next_s in state_obj.transitions.items():
+                if symbol not in symbol_index:
+                    raise ValueError(f"Symbol '{symbol}' not in alphabet.")
+                if next_s.name not in state_ids:
+                    raise ValueError(f"State '{next_s.name}' is not in the list of states.")
+                table[i * k + symbol_index[symbol]] = state_ids[next_s.name]
+
+        return CompiledDFA([s.name for s in ordered], symbols, table, accepting)
+
+    def save(self, path: str):
+        """
+        Compila este autómata (asumido DFA) y lo guarda en formato binario.
+        Se recupera con CompiledDFA.load(path), que mapea el archivo en memoria.
+
+        :param path: The file to write
+        """
+        self.compile().save(path)
+
     def is_accepting_state(self, state_name: str) -> bool:
         """
         Check if a state is in the final states.
@@ -275,27 +618,28 @@ class Automata:
         :return: True if the state is in the final states, False otherwise
         """
         # Check if the state is in the list of states
-        state = next((s for s in self.states if s.name == state_name), None)
+        state = self._states_by_name.get(state_name)
         if state is None:
             raise ValueError(f"State '{state_name}' is not in the list of states.")
         return state.is_accepting
 
-    def get_transition_idx(self, state_name: str, symbol: str) -> str:
+    def get_transition_idx(self, state_name: str, symbol: str) -> str | None:
         """
         Get the transition for a given state and symbol.
 
         :param state_name: The name of the state
         :param symbol: The symbol to get the transition for
-        :return: The next state for the given state and symbol
+        :return: The next state for the given state and symbol, or None if there is no transition
         """
         # Check if the state is in the list of states
-        state = next((s for s in self.states if s.name == state_name), None)
+        state = self._states_by_name.get(state_name)
         if state is None:
             raise ValueError(f"State '{state_name}' is not in the list of states.")
         # Check if the symbol is in the alphabet
         if symbol not in self.alphabet:
             raise ValueError(f"Symbol '{symbol}' is not in the alphabet.")
-        return state.get_next_state(symbol).name
+        next_s = state.get_next_state(symbol)
+        return next_s.name if next_s is not None else None
 
     def set_initial_state(self, state_name: str):
         """
@@ -304,7 +648,7 @@ class Automata:
         :param state_name: The name of the state to set as initial
         """
         # Check if the state is in the list of states
-        state = next((s for s in self.states if s.name == state_name), None)
+        state = self._states_by_name.get(state_name)
         if state is None:
             raise ValueError(f"State '{state_name}' is not in the list of states.")
         self.initial_state = state
@@ -0,0 +1,253 @@
+# CompiledDFA es la representación compacta (solo lectura) de un DFA.
+# Se obtiene con Automata.compile() y es la que usan los algoritmos de búsqueda.
+# save()/load() la guardan en un archivo binario que se puede mapear en memoria.
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+
+# --- Formato binario (little-endian) --- #
+# Cabecera de HEADER_SIZE bytes, luego las secciones en este orden:
+#   tabla de transiciones  int32[num_states * num_symbols] (alineada a 8 bytes)
+#   estados de aceptación  uint8[num_states], 1 si el estado acepta
+#   símbolos               por símbolo: tipo (u8), largo (u32), contenido; relleno a 4 bytes
+#   nombres de estados     uint32[num_states + 1] offsets + nombres en UTF-8
+FORMAT_MAGIC = b"CDFA"
+FORMAT_VERSION = 2
+# magic, versión, reservado, num_states, num_symbols, bytes de símbolos, bytes de nombres
+_HEADER = struct.Struct("<4sHHIIQQ")
+HEADER_SIZE = 32
+_SYMBOL_STR = 0
+_SYMBOL_INT = 1
+_SYMBOL = struct.Struct("<BI")
+
+
+class _StoredNames(Sequence):
+    """State names read on demand from the names section of a saved CompiledDFA."""
+
+    def __init__(self, offsets, blob):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self):
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return tuple(self[j] for j in range(*i.indices(len(self))))
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("state id out of range")
+        return str(self._blob[self._offsets[i]:self._offsets[i + 1]], "utf-8")
+
+
+class CompiledDFA:
+    """
+    Immutable array-backed DFA.
+
+    States are numbered 0..num_states-1 (the initial state is always 0) and
+    symbols 0..num_symbols-1. The transition for (state, symbol) lives in
+    ``table[state * num_symbols + symbol]`` and is -1 when it does not exist.
+    ``accepting[state]`` is 1 for accepting states and 0 otherwise (one byte per
+    state, so the hot loops test acceptance with a single indexed load).
+    """
+
+    __slots__ = ("_state_names", "_symbols", "_symbol_index", "_table", "_accepting")
+
+    def __init__(self,
+                 state_names: list[str],
+                 symbols: list[str],
+                 table: array,
+                 accepting: bytes):
+        """
+        :param state_names: Names of the states, indexed by state id
+        :param symbols: Symbols of the alphabet, indexed by symbol id
+        :param table: Flat transition table of size len(state_names) * len(symbols)
+        :param accepting: Byte i is 1 if state i is accepting
+        """
+        if getattr(table, "typecode", None) != "i":
+            raise ValueError("The transition table must be an array('i').")
+        if len(table) != len(state_names) * len(symbols):
+            raise ValueError("The transition table size does not match states * symbols.")
+        if len(accepting) != len(state_names):
+            raise ValueError("The accepting flags size does not match the number of states.")
+
+        object.__setattr__(self, "_state_names", tuple(state_names))
+        object.__setattr__(self, "_symbols", tuple(symbols))
+        object.__setattr__(self, "_symbol_index", {s: i for i, s in enumerate(symbols)})
+        # memoryview de solo lectura: indexarlo cuesta lo mismo que indexar el array
+        object.__setattr__(self, "_table", memoryview(table).toreadonly())
+        object.__setattr__(self, "_accepting", bytes(accepting))
+
+    def __setattr__(self, key, value):
+        raise AttributeError("CompiledDFA is immutable.")
+
+    @property
+    def num_states(self) -> int:
+        return len(self._state_names)
+
+    @property
+    def num_symbols(self) -> int:
+        return len(self._symbols)
+
+    @property
+    def state_names(self) -> tuple[str, ...]:
+        return self._state_names
+
+    @property
+    def symbols(self) -> tuple[str, ...]:
+        return self._symbols
+
+    @property
+    def symbol_index(self) -> dict[str, int]:
+        """Mapping symbol -> symbol id. Do not modify it."""
+        return self._symbol_index
+
+    @property
+    def table(self) -> memoryview:
+        return self._table
+
+    @property
+    def accepting(self) -> bytes:
+        return self._accepting
+
+    @property
+    def initial_state(self) -> int:
+        return 0
+
+    def is_accepting(self, state: int) -> bool:
+        """Returns whether the state id is accepting."""
+        return state >= 0 and self._accepting[state] == 1
+
+    def delta(self, state: int, symbol: str) -> int:
+        """
+        Returns the next state id for (state, symbol), or -1 if there is no transition.
+        """
+        c = self._symbol_index.get(symbol)
+        if c is None or state < 0:
+            return -1
+        return self._table[state * len(self._symbols) + c]
+
+    def test(self, string) -> bool:
+        """
+        Test if the compiled automata accepts a given string.
+
+        :param string: The string to test
+        :return: True if the string is accepted, False otherwise
+        """
+        table = self._table
+        sym = self._symbol_index
+        k = len(self._symbols)
+        state = 0
+        for symbol in string:
+            c = sym.get(symbol)
+            if c is None:
+                return False
+            state = table[state * k + c]
+            if state < 0:
+                return False
+        return self._accepting[state] == 1
+
+    def save(self, path: str):
+        """
+        Writes the DFA to 'path' in the versioned binary format described at the top
+        of this module. Symbols must be str or int (bytes-mode DAWGs use byte codes).
+
+        :param path: The file to write
+        """
+        symbols = bytearray()
+        for symbol in self._symbols:
+            if isinstance(symbol, str):
+                data = symbol.encode("utf-8")
+                symbols += _SYMBOL.pack(_SYMBOL_STR, len(data)) + data
+            elif isinstance(symbol, int):
+                symbols += _SYMBOL.pack(_SYMBOL_INT, 8) + symbol.to_bytes(8, "little", signed=True)
+            else:
+                raise ValueError(f"Symbol {symbol!r} cannot be saved: only str and int symbols are supported.")
+        # Relleno para que los offsets de los nombres queden alineados a 4 bytes
+        accepting_end = HEADER_SIZE + 4 * self.num_states * self.num_symbols + self.num_states
+        symbols += bytes(-(accepting_end + len(symbols)) % 4)
+        encoded = [str(name).encode("utf-8") for name in self._state_names]
+        offsets = array("I", [0])
+        for data in encoded:
+            offsets.append(offsets[-1] + len(data))
+        table = array("i", self._table)
+        if sys.byteorder != "little":
+            table.byteswap()
+            offsets.byteswap()
+        names = offsets.tobytes() + b"".join(encoded)
+
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(FORMAT_MAGIC, FORMAT_VERSION, 0, self.num_states, self.num_symbols,
+                                 len(symbols), len(names)).ljust(HEADER_SIZE, b"\0"))
+            f.write(table.tobytes())
+            f.write(self._accepting)
+            f.write(symbols)
+            f.write(names)
+
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = True) -> 'CompiledDFA':
+        """
+        Reads a DFA written by save(). With use_mmap=True the file is memory-mapped
+        read-only and the transition table and state names are used in place, so
+        loading does not depend on the number of states and processes that load the
+        same file share its pages.
+
+        :param path: The file to read
+        :param use_mmap: Map the file instead of reading it into memory
+        """
+        with open(path, "rb") as f:
+            if use_mmap:
+                try:
+                    data = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+                except ValueError:
+                    # mmap no acepta archivos vacíos
+                    data = memoryview(b"")
+            else:
+                data = memoryview(f.read())
+        if len(data) < HEADER_SIZE:
+            raise ValueError(f"'{path}' is not a saved CompiledDFA (file too short).")
+        magic, version, _, num_states, num_symbols, symbols_size, names_size = _HEADER.unpack_from(data)
+        if magic != FORMAT_MAGIC:
+            raise ValueError(f"'{path}' is not a saved CompiledDFA.")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported CompiledDFA format version {version} (expected {FORMAT_VERSION}).")
+        table_end = HEADER_SIZE + 4 * num_states * num_symbols
+        accepting_end = table_end + num_states
+        symbols_end = accepting_end + symbols_size
+        if len(data) != symbols_end + names_size:
+            raise ValueError(f"'{path}' is truncated or corrupt.")
+
+        table = data[HEADER_SIZE:table_end].cast("i")
+        offsets_end = symbols_end + 4 * (num_states + 1)
+        offsets = data[symbols_end:offsets_end].cast("I")
+        if sys.byteorder != "little":
+            # Sin copia solo en máquinas little-endian
+            table = array("i", table)
+            table.byteswap()
+            offsets = array("I", offsets)
+            offsets.byteswap()
+
+        symbols = []
+        pos = accepting_end
+        for _ in range(num_symbols):
+            kind, size = _SYMBOL.unpack_from(data, pos)
+            pos += _SYMBOL.size
+            raw = data[pos:pos + size]
+            pos += size
+            symbols.append(str(raw, "utf-8") if kind == _SYMBOL_STR else int.from_bytes(raw, "little", signed=True))
+
+        dfa = cls.__new__(cls)
+        object.__setattr__(dfa, "_state_names", _StoredNames(offsets, data[offsets_end:]))
+        object.__setattr__(dfa, "_symbols", tuple(symbols))
+        object.__setattr__(dfa, "_symbol_index", {s: i for i, s in enumerate(symbols)})
+        object.__setattr__(dfa, "_table", memoryview(table).toreadonly())
+        object.__setattr__(dfa, "_accepting", data[table_end:accepting_end].toreadonly())
+        return dfa
+
+    def __repr__(self):
+        return (f"CompiledDFA(states={self.num_states}, "
+                f"symbols={list(self._symbols)}, "
+                f"accepting={[i for i in range(self.num_states) if self.is_accepting(i)]})")
@@ -0,0 +1,240 @@
+# LazyDFA ejecuta un NFA determinizándolo bajo demanda (al estilo de RE2).
+# Los estados DFA (clausuras épsilon como máscaras de bits) se crean al leer el texto y
+# se guardan en un caché acotado; si el caché se llena se vacía, y si se vacía demasiado
+# seguido se sigue con la simulación directa del NFA.
+from algorithms.results import check_mode, collect
+from automata.automata import Automata
+
+DEFAULT_MAX_STATES = 4096
+# Símbolos leídos por estado creado por debajo de los cuales el caché "se azota" (RE2 usa 10)
+DEFAULT_MIN_SYMBOLS_PER_STATE = 10
+# Transición aún no calculada en la tabla del caché
+UNKNOWN = -1
+
+
+class LazyDFA:
+    """
+    On-demand determinization of an Automata (NFA with epsilon transitions allowed).
+
+    DFA states are epsilon-closed sets of NFA states, stored as int bitsets, and are
+    built only when the input reaches them. At most 'max_states' are kept: when the
+    cache is full it is flushed and rebuilt from the current state. If a flush comes
+    after fewer than min_symbols_per_state * max_states symbols, the run continues
+    with plain NFA simulation, so memory stays bounded whatever the size of the full DFA.
+    """
+
+    def __init__(self,
+                 automata: 'Automata',
+                 max_states: int = DEFAULT_MAX_STATES,
+                 min_symbols_per_state: int = DEFAULT_MIN_SYMBOLS_PER_STATE):
+        """
+        :param automata: The NFA (or DFA) to run
+        :param max_states: Maximum number of cached DFA states
+        :param min_symbols_per_state: Thrashing threshold (see the class docstring)
+        """
+        if automata.initial_state is None:
+            raise ValueError("The automata must have an initial state.")
+        if max_states < 2:
+            raise ValueError("max_states must be at least 2.")
+        self.max_states = max_states
+        self.min_symbols_per_state = min_symbols_per_state
+
+        epsilon = automata.epsilon
+        states = automata.states
+        state_ids = {s.name: i for i, s in enumerate(states)}
+        n = len(states)
+        self.num_nfa_states = n
+        self.symbols = [sym for sym in automata.alphabet if sym != epsilon]
+        # Símbolo -> id; un símbolo ASCII también se indexa por su código, para recorrer
+        # textos binarios (bytes, mmap) sin decodificarlos. Como en as_symbols, los bytes
+        # se leen como ASCII/UTF-8: 0xF1 no es "ñ".
+        self.symbol_index = {}
+        for i, sym in enumerate(self.symbols):
+            self.symbol_index[sym] = i
+            if isinstance(sym, str) and len(sym) == 1 and ord(sym) < 128:
+                self.symbol_index.setdefault(ord(sym), i)
+
+        # Clausura épsilon de cada estado NFA, como máscara
+        eps_targets = [[state_ids[t.name] for t in s.get_nfa_transitions(epsilon)] for s in states]
+        closure = [0] * n
+        for i in range(n):
+            mask = 1 << i
+            stack = [i]
+            while stack:
+                for t in eps_targets[stack.pop()]:
+                    if not (mask >> t) & 1:
+                        mask |= 1 << t
+                        stack.append(t)
+            closure[i] = mask
+        # step[a][i] = clausura de move({i}, a)
+        self._step = []
+        for sym in self.symbols:
+            row = [0] * n
+            for i, s in enumerate(states):
+                mask = 0
+                for t in s.get_nfa_transitions(sym):
+                    mask |= closure[state_ids[t.name]]
+                # Un DFA construido con transitions (sin transiciones NFA) también sirve
+                t = s.transitions.get(sym)
+                if t is not None and t.name in state_ids:
+                    mask |= closure[state_ids[t.name]]
+                row[i] = mask
+            self._step.append(row)
+        self.initial_mask = closure[state_ids[automata.initial_state.name]]
+        # Pseudo-estado n: marca las búsquedas no ancladas. Se mantiene a sí mismo y
+        # agrega los pasos del estado inicial, como un lazo Σ* sobre él; así los estados
+        # anclados y no anclados nunca comparten entradas del caché.
+        self.unanchored_bit = 1 << n
+        for row in self._step:
+            mask = self.unanchored_bit
+            for i in range(n):
+                if (self.initial_mask >> i) & 1:
+                    mask |= row[i]
+            row.append(mask)
+        self.accepting_mask = 0
+        for i, s in enumerate(states):
+            if s.is_accepting:
+                self.accepting_mask |= 1 << i
+
+        # Caché: id -> máscara, máscara -> id, tabla plana id * k + símbolo -> id
+        self._masks: list[int] = []
+        self._ids: dict[int, int] = {}
+        self._next: list[int] = []
+        self._accepting: list[bool] = []
+        self.states_built = 0
+        self.flushes = 0
+        self.fallbacks = 0
+
+    def move(self, mask: int, symbol_id: int) -> int:
+        """NFA step: epsilon closure of the states reachable from 'mask' with the symbol."""
+        row = self._step[symbol_id]
+        result = 0
+        while mask:
+            low = mask & -mask
+            result |= row[low.bit_length() - 1]
+            mask ^= low
+        return result
+
+    def _add_state(self, mask: int) -> int:
+        """Returns the cached id of 'mask', flushing the cache first if it is full."""
+        state = self._ids.get(mask)
+        if state is not None:
+            return state
+        if len(self._masks) >= self.max_states:
+            self.flush()
+            self.flushes += 1
+        state = len(self._masks)
+        self._ids[mask] = state
+        self._masks.append(mask)
+        self._next.extend([UNKNOWN] * len(self.symbols))
+        self._accepting.append(bool(mask & self.accepting_mask))
+        self.states_built += 1
+        return state
+
+    def flush(self):
+        """Empties the state cache (the lists are cleared in place)."""
+        self._masks.clear()
+        self._ids.clear()
+        self._next.clear()
+        self._accepting.clear()
+
+    def _run(self, text, anchored: bool):
+        """
+        Yields the 0-based index i of every prefix text[:i+1] that leaves the automaton
+        in an accepting state. Unanchored runs carry the unanchored bit, so matches may
+        start anywhere (only non-empty ones are reported).
+        """
+        k = len(self.symbols)
+        symbol_index = self.symbol_index
+        masks = self._masks
+        next_ = self._next
+        accepting = self._accepting
+        restart = 0 if anchored else self.unanchored_bit
+        threshold = self.min_symbols_per_state * self.max_states
+        last_flush = 0
+
+        state = self._add_state(self.initial_mask | restart)
+        n = len(text)
+        i = 0
+        while i < n:
+            s = symbol_index.get(text[i])
+            if s is None:
+                # Símbolo fuera del alfabeto: ningún estado NFA tiene transición
+                target = UNKNOWN
+                mask = restart
+            else:
+                target = next_[state * k + s]
+                mask = None
+            if target < 0:
+                if mask is None:
+                    mask = self.move(masks[state], s)
+                if anchored and not mask:
+                    return
+                flushes = self.flushes
+                target = self._add_state(mask)
+                if self.flushes != flushes:
+                    # El estado de origen ya no existe en el caché: no se guarda el arco
+                    if i - last_flush < threshold:
+                        self.fallbacks += 1
+                        yield from self._run_nfa(text, i, mask, anchored)
+                        return
+                    last_flush = i
+                elif s is not None:
+                    next_[state * k + s] = target
+            state = target
+            if accepting[state]:
+                yield i
+            i += 1
+
+    def _run_nfa(self, text, i: int, mask: int, anchored: bool):
+        """Plain NFA simulation from position i, where 'mask' is the state after text[i]."""
+        symbol_index = self.symbol_index
+        accepting_mask = self.accepting_mask
+        restart = 0 if anchored else self.unanchored_bit
+        move = self.move
+        n = len(text)
+        while True:
+            if mask & accepting_mask:
+                yield i
+            i += 1
+            if i >= n:
+                return
+            s = symbol_index.get(text[i])
+            mask = move(mask, s) if s is not None else restart
+            if anchored and not mask:
+                return
+
+    def test(self, string) -> bool:
+        """
+        Tests whether the automata accepts the whole 'string', like Automata.test
+        but for NFAs.
+        """
+        if not len(string):
+            return bool(self.initial_mask & self.accepting_mask)
+        last = len(string) - 1
+        for i in self._run(string, anchored=True):
+            if i == last:
+                return True
+        return False
+
+    def search(self, text, mode: str = "list", k: int = None):
+        """
+        Scans 'text' once and reports the 0-based index of the last symbol of every
+        match (a match may start anywhere; empty matches are not reported).
+        'mode' and 'k' select the result form (see algorithms.results).
+        """
+        check_mode(mode, k)
+        return collect(self._run(text, anchored=False), mode, k)
+
+    def stats(self) -> dict:
+        return {
+            "states": len(self._masks),
+            "max_states": self.max_states,
+            "states_built": self.states_built,
+            "flushes": self.flushes,
+            "fallbacks": self.fallbacks,
+        }
+
+    def __repr__(self):
+        return (f"LazyDFA(nfa_states={self.num_nfa_states}, symbols={len(self.symbols)}, "
+                f"cached={len(self._masks)}/{self.max_states})")
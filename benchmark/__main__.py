@@ -0,0 +1,50 @@
+"""
+Uso:
+    python -m benchmark --text-lengths 1048576 --pattern-lengths 64 128 256 \
+        --algorithms KMP BM BDM --repetitions 10 --warmup 2 --output results.json
+"""
+import argparse
+
+from benchmark.registry import available_algorithms
+from benchmark.runner import BenchmarkConfig, run_benchmark, write_results
+from data.generators import GENERATORS
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmark",
+                                     description="Benchmark de los algoritmos de búsqueda.")
+    parser.add_argument("--algorithms", nargs="+", default=None,
+                        help=f"Algoritmos a medir (disponibles: {' '.join(available_algorithms())})")
+    parser.add_argument("--alphabet", default="ACGT", help="Alfabeto del texto generado")
+    parser.add_argument("--generator", default="uniform", choices=list(GENERATORS),
+                        help="Generador del texto (el alfabeto solo se usa con uniform)")
+    parser.add_argument("--text-lengths", nargs="+", type=int, default=[2**20])
+    parser.add_argument("--pattern-lengths", nargs="+", type=int, default=[2**j for j in range(6, 11)])
+    parser.add_argument("--patterns", type=int, default=5, help="Patrones por largo")
+    parser.add_argument("--repetitions", type=int, default=5)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="No medir memoria con tracemalloc")
+    parser.add_argument("--count-operations", action="store_true",
+                        help="Registrar también los contadores de operaciones (KMP, BM, BDM)")
+    parser.add_argument("--output", default="results.json")
+    args = parser.parse_args(argv)
+
+    config = BenchmarkConfig(algorithms=args.algorithms,
+                             alphabet=list(args.alphabet),
+                             text_lengths=args.text_lengths,
+                             pattern_lengths=args.pattern_lengths,
+                             patterns_per_length=args.patterns,
+                             repetitions=args.repetitions,
+                             warmup=args.warmup,
+                             seed=args.seed,
+                             measure_memory=not args.no_memory,
+                             count_operations=args.count_operations,
+                             generator=args.generator)
+    report = run_benchmark(config)
+    write_results(report, args.output)
+    print(f"Resultados guardados en {args.output}")
+
+
+if __name__ == "__main__":
+    main()
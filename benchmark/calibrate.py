@@ -0,0 +1,111 @@
+"""
+Calibración del selector adaptativo (algorithms.selector).
+
+Mide los algoritmos sobre textos uniformes de varios tamaños de alfabeto, ajusta el
+modelo de costo y lo guarda donde search() lo busca.
+
+Uso:
+    python -m benchmark.calibrate
+    python -m benchmark.calibrate --alphabet-sizes 2 4 20 --report calibration.json
+    python -m benchmark.calibrate --from-report results.json   # sin volver a medir
+"""
+import argparse
+import string
+
+from algorithms.selector import DEFAULT_MODEL_PATH, CostModel, select_algorithm
+from benchmark.registry import available_algorithms
+from benchmark.runner import BenchmarkConfig, load_results, run_benchmark, write_results
+
+SYMBOLS = "ACGT" + "".join(c for c in string.ascii_uppercase + string.ascii_lowercase + string.digits
+                           if c not in "ACGT")
+DEFAULT_ALPHABET_SIZES = [2, 4, 20, 62]
+DEFAULT_TEXT_LENGTHS = [2**16, 2**18]
+DEFAULT_PATTERN_LENGTHS = [4, 8, 16, 64, 256, 1024]
+# Algoritmos que solo se miden sobre ADN
+DNA_ONLY = {"Packed"}
+
+
+def calibrate(algorithms: list[str] = None,
+              alphabet_sizes: list[int] = None,
+              text_lengths: list[int] = None,
+              pattern_lengths: list[int] = None,
+              patterns_per_length: int = 3,
+              repetitions: int = 3,
+              seed: int = 0,
+              log=print) -> tuple[dict, CostModel]:
+    """
+    Runs one benchmark per alphabet size and fits a CostModel to all of them.
+    Returns (merged report, model).
+
+    :param algorithms: Algorithms to calibrate (default: every available one)
+    :param alphabet_sizes: Sizes of the uniform alphabets (at most len(SYMBOLS))
+    :param log: Function used to report progress (None to disable)
+    """
+    algorithms = algorithms or available_algorithms()
+    alphabet_sizes = alphabet_sizes or DEFAULT_ALPHABET_SIZES
+    if any(not 1 <= size <= len(SYMBOLS) for size in alphabet_sizes):
+        raise ValueError(f"Alphabet sizes must be between 1 and {len(SYMBOLS)}.")
+
+    report = None
+    for size in alphabet_sizes:
+        alphabet = list(SYMBOLS[:size])
+        config = BenchmarkConfig(algorithms=[a for a in algorithms if a not in DNA_ONLY or size <= 4],
+                                 alphabet=alphabet,
+                                 text_lengths=text_lengths or DEFAULT_TEXT_LENGTHS,
+                                 pattern_lengths=pattern_lengths or DEFAULT_PATTERN_LENGTHS,
+                                 patterns_per_length=patterns_per_length,
+                                 repetitions=repetitions,
+                                 seed=seed,
+                                 measure_memory=False)
+        partial = run_benchmark(config, log=log)
+        if report is None:
+            report = partial
+            report["config"]["alphabet_sizes"] = alphabet_sizes
+        else:
+            report["results"].extend(partial["results"])
+    return report, CostModel.fit(report)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmark.calibrate",
+                                     description="Calibra el modelo de costo del selector de algoritmos.")
+    parser.add_argument("--algorithms", nargs="+", default=None,
+                        help=f"Algoritmos a calibrar (disponibles: {' '.join(available_algorithms())})")
+    parser.add_argument("--alphabet-sizes", nargs="+", type=int, default=DEFAULT_ALPHABET_SIZES)
+    parser.add_argument("--text-lengths", nargs="+", type=int, default=DEFAULT_TEXT_LENGTHS)
+    parser.add_argument("--pattern-lengths", nargs="+", type=int, default=DEFAULT_PATTERN_LENGTHS)
+    parser.add_argument("--patterns", type=int, default=3, help="Patrones por largo")
+    parser.add_argument("--repetitions", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--from-report", default=None,
+                        help="Ajustar el modelo a un reporte existente en vez de medir")
+    parser.add_argument("--report", default=None, help="Guardar también el reporte de las mediciones")
+    parser.add_argument("--output", default=DEFAULT_MODEL_PATH, help="Archivo del modelo")
+    args = parser.parse_args(argv)
+
+    if args.from_report:
+        report = load_results(args.from_report)
+        model = CostModel.fit(report, args.algorithms)
+    else:
+        report, model = calibrate(algorithms=args.algorithms,
+                                  alphabet_sizes=args.alphabet_sizes,
+                                  text_lengths=args.text_lengths,
+                                  pattern_lengths=args.pattern_lengths,
+                                  patterns_per_length=args.patterns,
+                                  repetitions=args.repetitions,
+                                  seed=args.seed)
+        if args.report:
+            write_results(report, args.report)
+            print(f"Reporte guardado en {args.report}")
+    model.save(args.output)
+    print(f"Modelo guardado en {args.output}")
+
+    # Resumen: el algoritmo elegido en algunos casos típicos
+    for sigma in (4, 20):
+        for m in (8, 64, 1024):
+            text = SYMBOLS[:sigma] * (2**20 // sigma)
+            print(f"  {select_algorithm(text, text[:m], model=model)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Registro de algoritmos para el benchmark.
+
+Cada algoritmo es un par (preprocesamiento(pattern), búsqueda(text, pattern, preprocesado)),
+el mismo formato que usa el caché de patrones, para medir ambas fases por separado.
+"""
+from algorithms.pattern_cache import ALGORITHMS
+from algorithms.vectorized import numpy_available
+
+# Algoritmos que dependen de paquetes opcionales
+OPTIONAL_REQUIREMENTS = {
+    "Vectorized": numpy_available,
+}
+
+
+def register_algorithm(name: str, preprocess, search):
+    """
+    Registers an algorithm for the benchmark (and for compile_pattern).
+
+    :param name: Name used in the results
+    :param preprocess: Function pattern -> preprocessed data
+    :param search: Function (text, pattern, preprocessed) -> list of matches
+    """
+    if name in ALGORITHMS:
+        raise ValueError(f"Algorithm '{name}' is already registered.")
+    ALGORITHMS[name] = (preprocess, search)
+
+
+def available_algorithms() -> list[str]:
+    """Names of the registered algorithms whose optional requirements are installed."""
+    return [name for name in ALGORITHMS
+            if name not in OPTIONAL_REQUIREMENTS or OPTIONAL_REQUIREMENTS[name]()]
+
+
+def get_algorithm(name: str):
+    """Returns the (preprocess, search) pair of an algorithm."""
+    if name not in ALGORITHMS:
+        raise ValueError(f"Unknown algorithm '{name}', expected one of {list(ALGORITHMS)}.")
+    return ALGORITHMS[name]
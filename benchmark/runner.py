@@ -0,0 +1,239 @@
+"""
+Runner del benchmark: mide por separado el preprocesamiento y la búsqueda de cada
+algoritmo registrado, con calentamiento y repeticiones, y escribe un JSON versionado.
+"""
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from algorithms.instrumented import INSTRUMENTED, OperationCounters
+from benchmark.registry import available_algorithms, get_algorithm
+from data.crear_texto import crear_texto
+from data.generators import generate
+from data.obtener_patron import obtener_patrones
+from data.packed_dna import PackedDNA
+
+# Algoritmos que buscan sobre otra representación del texto (la misma con que los ofrece
+# algorithms.selector): el texto se convierte una vez, fuera de la región medida
+TEXT_CONVERSIONS = {
+    "Packed": PackedDNA.from_str,
+}
+
+SCHEMA_NAME = "tarea-teoria-benchmark"
+SCHEMA_VERSION = 1
+
+
+class BenchmarkConfig:
+    """
+    Parameters of a benchmark run.
+    """
+
+    def __init__(self,
+                 algorithms: list[str] = None,
+                 alphabet: list[str] = None,
+                 text_lengths: list[int] = None,
+                 pattern_lengths: list[int] = None,
+                 patterns_per_length: int = 5,
+                 repetitions: int = 5,
+                 warmup: int = 1,
+                 seed: int = 0,
+                 measure_memory: bool = True,
+                 count_operations: bool = False,
+                 generator: str = "uniform"):
+        """
+        :param algorithms: Names of the algorithms to run (default: every available one)
+        :param alphabet: Alphabet of the generated texts
+        :param text_lengths: Lengths of the generated texts
+        :param pattern_lengths: Lengths of the patterns, sampled from each text
+        :param patterns_per_length: Number of patterns sampled for each length
+        :param repetitions: Measured runs per pattern
+        :param warmup: Unmeasured runs per pattern before the measured ones
+        :param seed: Seed for the pattern sampling
+        :param measure_memory: Record the peak memory with tracemalloc
+        :param count_operations: Also run the instrumented variants (see
+            algorithms.instrumented) and record their operation counts
+        :param generator: Text generator (see data.generators.GENERATORS); only
+            "uniform" uses 'alphabet'
+        """
+        self.algorithms = algorithms or available_algorithms()
+        self.alphabet = alphabet or ["A", "C", "G", "T"]
+        self.text_lengths = text_lengths or [2**20]
+        self.pattern_lengths = pattern_lengths or [2**j for j in range(6, 11)]
+        self.patterns_per_length = patterns_per_length
+        self.repetitions = repetitions
+        self.warmup = warmup
+        self.seed = seed
+        self.measure_memory = measure_memory
+        self.count_operations = count_operations
+        self.generator = generator
+        if repetitions <= 0:
+            raise ValueError("repetitions debe ser positivo")
+        if warmup < 0 or patterns_per_length <= 0:
+            raise ValueError("warmup no puede ser negativo y patterns_per_length debe ser positivo")
+
+    def to_dict(self):
+        return dict(vars(self))
+
+
+def summarize(samples: list[float]) -> dict:
+    """
+    Median, quartiles and IQR of a list of timings (seconds).
+    """
+    if len(samples) >= 2:
+        q1, median, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+    else:
+        q1 = median = q3 = samples[0]
+    return {
+        "median": median,
+        "q1": q1,
+        "q3": q3,
+        "iqr": q3 - q1,
+        "min": min(samples),
+        "mean": statistics.fmean(samples),
+        "samples": samples,
+    }
+
+
+def measure(algorithm: str, text, patterns: list, repetitions: int, warmup: int,
+            measure_memory: bool = True, count_operations: bool = False) -> dict:
+    """
+    Runs one algorithm over a list of patterns and returns the timing summaries.
+    """
+    preprocess, search = get_algorithm(algorithm)
+    preprocess_times = []
+    search_times = []
+    matches = 0
+    for pattern in patterns:
+        for _ in range(warmup):
+            search(text, pattern, preprocess(pattern))
+        for _ in range(repetitions):
+            start = time.perf_counter()
+            pre = preprocess(pattern)
+            middle = time.perf_counter()
+            result = search(text, pattern, pre)
+            end = time.perf_counter()
+            preprocess_times.append(middle - start)
+            search_times.append(end - middle)
+        matches += len(result)
+
+    search_summary = summarize(search_times)
+    text_bytes = len(text.encode()) if isinstance(text, str) else len(text)
+    entry = {
+        "algorithm": algorithm,
+        "text_length": len(text),
+        "pattern_length": len(patterns[0]),
+        "patterns": len(patterns),
+        "repetitions": repetitions,
+        "warmup": warmup,
+        "preprocess": summarize(preprocess_times),
+        "search": search_summary,
+        "throughput_mb_s": (text_bytes / search_summary["median"] / 1e6
+                            if search_summary["median"] > 0 else None),
+        "matches": matches,
+        "peak_memory_bytes": None,
+    }
+
+    if measure_memory:
+        # tracemalloc hace más lenta la ejecución: se mide en una corrida aparte
+        tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            search(text, patterns[0], preprocess(patterns[0]))
+            entry["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    if count_operations and algorithm in INSTRUMENTED:
+        # Corrida aparte con la variante instrumentada; los tiempos no se ven afectados
+        total = OperationCounters()
+        for pattern in patterns:
+            INSTRUMENTED[algorithm](text, pattern, counters=total)
+        entry["operations"] = total.to_dict()
+    return entry
+
+
+def sample_patterns(text, length: int, count: int, rng: random.Random) -> list:
+    """Samples 'count' substrings of the given length from the text."""
+    return obtener_patrones(text, length, count, rng)
+
+
+def generate_texts(config: BenchmarkConfig) -> dict:
+    """Generates one text per config.text_lengths with config.generator and config.seed."""
+    texts = {}
+    for n in config.text_lengths:
+        if config.generator == "uniform":
+            text = crear_texto(config.alphabet, n, seed=config.seed)
+        else:
+            text = generate(config.generator, n, seed=config.seed).decode()
+        texts[f"{config.generator}_{n}"] = text
+    return texts
+
+
+def run_benchmark(config: BenchmarkConfig, texts: dict = None, log=print) -> dict:
+    """
+    Runs the benchmark described by 'config' and returns the report.
+
+    :param config: Benchmark parameters
+    :param texts: Optional mapping name -> text; by default texts are generated
+        with generate_texts
+    :param log: Function used to report progress (None to disable)
+    """
+    if texts is None:
+        texts = generate_texts(config)
+    rng = random.Random(config.seed)
+
+    results = []
+    for text_name, text in texts.items():
+        # σ de cada texto, para ajustar modelos de costo (ver algorithms.selector)
+        alphabet_size = len(set(text))
+        converted = {algorithm: TEXT_CONVERSIONS[algorithm](text)
+                     for algorithm in config.algorithms if algorithm in TEXT_CONVERSIONS}
+        for length in config.pattern_lengths:
+            if length > len(text):
+                continue
+            patterns = sample_patterns(text, length, config.patterns_per_length, rng)
+            for algorithm in config.algorithms:
+                if log:
+                    log(f"{algorithm}: texto {text_name} (n={len(text)}), m={length}")
+                entry = measure(algorithm, converted.get(algorithm, text), patterns, config.repetitions,
+                                config.warmup, config.measure_memory, config.count_operations)
+                entry["text"] = text_name
+                entry["alphabet_size"] = alphabet_size
+                results.append(entry)
+
+    return {
+        "schema": SCHEMA_NAME,
+        "schema_version": SCHEMA_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "environment": {
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "config": config.to_dict(),
+        "results": results,
+    }
+
+
+def write_results(report: dict, path: str = "results.json"):
+    """Writes a benchmark report as JSON."""
+    with open(path, "w") as f:
+        json.dump(report, f, indent=4)
+
+
+def load_results(path: str = "results.json") -> dict:
+    """Reads a benchmark report, checking its schema version."""
+    with open(path) as f:
+        report = json.load(f)
+    if not isinstance(report, dict) or report.get("schema") != SCHEMA_NAME:
+        raise ValueError(f"{path} is not a benchmark report (schema '{SCHEMA_NAME}').")
+    if report.get("schema_version") != SCHEMA_VERSION:
+        raise ValueError(f"Unsupported schema version {report.get('schema_version')}, "
+                         f"expected {SCHEMA_VERSION}.")
+    return report
@@ -1,17 +1,17 @@
-def crear_texto(alphabet: list[str], n: int = 2**20) -> str:
+from data.generators import generate
+
+
+def crear_texto(alphabet: list[str], n: int = 2**20, seed=None) -> str:
     """
     Crea un texto aleatorio de longitud n utilizando el alfabeto dado.
+    Cada símbolo se elige de forma uniforme e independiente (ver data.generators).
     :param alphabet: Alfabeto a utilizar.
     :param n: Longitud del texto a crear.
+    :param seed: Semilla (o random.Random) para reproducir el texto.
     :return: Texto aleatorio.
     """
     # verificamos que n sea positivo
     if n <= 0:
         raise ValueError("n debe ser positivo")
-    # creamos el texto
-    texto = ""
-    for i in range(n):
-        # elegimos un character aleatorio del alfabeto
-        texto += alphabet[i % len(alphabet)]
-    # retornamos el texto
-    return texto
+    # generamos el texto por bloques de bytes y lo decodificamos una sola vez
+    return generate("uniform", n, seed, alphabet=alphabet).decode()
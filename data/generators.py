@@ -0,0 +1,275 @@
+"""
+Generadores de textos de prueba, reproducibles a partir de una semilla.
+
+Cada generador iter_* entrega el texto en bloques de bytes de BLOCK_SIZE símbolos
+(el último puede ser más corto). La aleatoriedad se pide siempre por bloques completos,
+así que el texto depende solo de la semilla y los parámetros: generate() y write_corpus()
+producen lo mismo, y el texto de largo n es prefijo del de largo N > n.
+
+- "uniform": símbolos independientes y uniformes sobre el alfabeto.
+- "markov_dna": cadena de Markov de orden 1 sobre ACGT.
+- "fibonacci": palabra de Fibonacci (peor caso clásico, muy repetitiva).
+- "periodic": repetición de un periodo fijo (por ejemplo ACGTACGT... o AAAA...).
+- "natural": palabras con frecuencias de Zipf separadas por espacios.
+"""
+import random
+from itertools import accumulate
+
+BLOCK_SIZE = 2**20
+# markov_dna con NumPy: largo mínimo del texto y ancho de las filas del recorrido
+MARKOV_SCAN_MIN = 2**12
+MARKOV_SCAN_WIDTH = 256
+
+DNA = "ACGT"
+# Transiciones por defecto de markov_dna (fila = base anterior, en orden ACGT):
+# genoma rico en AT y con pocos dinucleótidos CG, como en vertebrados.
+DEFAULT_DNA_TRANSITIONS = (
+    (0.32, 0.17, 0.24, 0.27),
+    (0.35, 0.27, 0.06, 0.32),
+    (0.29, 0.21, 0.27, 0.23),
+    (0.21, 0.20, 0.26, 0.33),
+)
+
+
+def _rng(seed) -> random.Random:
+    """Accepts a seed or an existing random.Random."""
+    return seed if isinstance(seed, random.Random) else random.Random(seed)
+
+def _alphabet_bytes(alphabet) -> bytes:
+    symbols = "".join(alphabet)
+    if len(symbols) != len(alphabet) or not symbols.isascii() or not 0 < len(set(symbols)) == len(symbols) <= 128:
+        raise ValueError("alphabet debe tener símbolos ASCII distintos de un carácter")
+    return symbols.encode()
+
+def _check_length(n: int):
+    if n < 0:
+        raise ValueError("n no puede ser negativo")
+
+
+def iter_uniform(n: int, seed=None, alphabet=DNA):
+    """
+    Uniform i.i.d. symbols.
+
+    :param n: Length of the text
+    :param seed: Seed (or random.Random)
+    :param alphabet: Symbols to draw from (str or list of one-character str)
+    """
+    _check_length(n)
+    rng = _rng(seed)
+    symbols = _alphabet_bytes(alphabet)
+    k = len(symbols)
+    # Cada byte aleatorio se mapea a byte % k; los bytes >= limit se descartan para
+    # no sesgar la distribución cuando k no divide a 256.
+    limit = 256 - 256 % k
+    table = bytes(symbols[b % k] for b in range(256))
+    reject = bytes(range(limit, 256))
+    pending = b""
+    while n > 0:
+        size = min(n, BLOCK_SIZE)
+        while len(pending) < size:
+            pending += rng.randbytes(BLOCK_SIZE).translate(table, reject)
+        block, pending = pending[:size], pending[size:]
+        n -= size
+        yield block
+
+
+def iter_markov_dna(n: int, seed=None, transitions=DEFAULT_DNA_TRANSITIONS):
+    """
+    DNA from a first-order Markov chain. Probabilities are quantized to 1/256.
+
+    :param n: Length of the text
+    :param seed: Seed (or random.Random)
+    :param transitions: 4x4 matrix, row = previous base, column = next base (ACGT order)
+    """
+    _check_length(n)
+    if len(transitions) != 4 or any(len(row) != 4 or min(row) < 0 or sum(row) <= 0 for row in transitions):
+        raise ValueError("transitions debe ser una matriz 4x4 de probabilidades")
+    rng = _rng(seed)
+    # rows[s][b]: base siguiente (0..3) dada la base anterior s y un byte aleatorio b
+    rows = []
+    for row in transitions:
+        total = sum(row)
+        bounds = [round(256 * c / total) for c in accumulate(row)]
+        rows.append(bytes(next(i for i, bound in enumerate(bounds) if b < bound) for b in range(256)))
+    decode = bytes.maketrans(b"\x00\x01\x02\x03", DNA.encode())
+    walk = _markov_walker_numpy(rows) if n > MARKOV_SCAN_MIN else None
+    state = rng.randrange(4)
+    while n > 0:
+        size = min(n, BLOCK_SIZE)
+        randoms = rng.randbytes(BLOCK_SIZE)[:size]
+        states, state = walk(randoms, state) if walk else _markov_walk(rows, randoms, state)
+        n -= size
+        yield states.translate(decode)
+
+
+def _markov_walk(rows, randoms: bytes, state: int):
+    """Follows the chain one symbol at a time. Returns (states, last state)."""
+    out = bytearray(len(randoms))
+    i = 0
+    for b in randoms:
+        state = rows[state][b]
+        out[i] = state
+        i += 1
+    return bytes(out), state
+
+
+def _markov_walker_numpy(rows):
+    """
+    Same walk as _markov_walk, vectorized with NumPy (None if it is not installed).
+
+    Each random byte b is the function s -> rows[s][b], coded in one byte with 2 bits
+    per state. A prefix scan of compositions over rows of MARKOV_SCAN_WIDTH symbols
+    gives, for each position, the state as a function of the state at the start of
+    its row; only the row starts are then followed one by one.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    functions = bytes(sum(rows[s][b] << (2 * s) for s in range(4)) for b in range(256))
+    identity = sum(s << (2 * s) for s in range(4))
+    # compose[256 * g + f]: código de g ∘ f (primero f, luego g)
+    g = np.arange(256)[:, None]
+    f = np.arange(256)[None, :]
+    compose = np.zeros((256, 256), dtype=np.uint8)
+    for s in range(4):
+        compose |= (((g >> (2 * ((f >> (2 * s)) & 3))) & 3) << (2 * s)).astype(np.uint8)
+    compose = compose.ravel()
+
+    def walk(randoms: bytes, state: int):
+        size = len(randoms)
+        count = -(-size // MARKOV_SCAN_WIDTH)
+        # Relleno con la identidad para no cambiar el último estado
+        scan = np.full(count * MARKOV_SCAN_WIDTH, identity, dtype=np.uint8)
+        scan[:size] = np.frombuffer(randoms.translate(functions), dtype=np.uint8)
+        scan = scan.reshape(count, MARKOV_SCAN_WIDTH)
+        d = 1
+        while d < MARKOV_SCAN_WIDTH:
+            pairs = scan[:, d:].astype(np.uint16)
+            pairs <<= 8
+            pairs |= scan[:, :-d]
+            scan[:, d:] = compose.take(pairs)
+            d *= 2
+        starts = bytearray(count)
+        for r, total in enumerate(scan[:, -1].tolist()):
+            starts[r] = state
+            state = (total >> (2 * state)) & 3
+        shifts = 2 * np.frombuffer(bytes(starts), dtype=np.uint8)[:, None]
+        return ((scan >> shifts) & 3).ravel()[:size].tobytes(), state
+
+    return walk
+
+
+def iter_fibonacci(n: int, seed=None, letters: str = "ab"):
+    """
+    Prefix of length n of the infinite Fibonacci word over two letters
+    (S_1 = a, S_2 = ab, S_k = S_{k-1} S_{k-2}). The seed is ignored.
+    Blocks are cut from S_k by following its Zeckendorf-like split into S_{k-1} S_{k-2},
+    so only a prefix of about BLOCK_SIZE symbols is ever kept in memory.
+    """
+    _check_length(n)
+    a, b = _alphabet_bytes(letters)[:2]
+    # lengths[k] = |S_k|; cada S_k es prefijo de S_{k+1}, así que base = S_j sirve para todos
+    lengths = [0, 1, 2]
+    previous, base = bytes([a]), bytes([a, b])
+    while len(base) < min(n, BLOCK_SIZE):
+        previous, base = base, base + previous
+    while lengths[-1] < n:
+        lengths.append(lengths[-1] + lengths[-2])
+    k = len(lengths) - 1
+    for i in range(0, n, BLOCK_SIZE):
+        yield _fibonacci_slice(base, lengths, k, i, min(i + BLOCK_SIZE, n))
+
+
+def _fibonacci_slice(base: bytes, lengths: list[int], k: int, lo: int, hi: int) -> bytes:
+    """S_k[lo:hi], splitting S_k = S_{k-1} S_{k-2} until the slice falls inside 'base'."""
+    if hi <= len(base):
+        return base[lo:hi]
+    split = lengths[k - 1]
+    if hi <= split:
+        return _fibonacci_slice(base, lengths, k - 1, lo, hi)
+    if lo >= split:
+        return _fibonacci_slice(base, lengths, k - 2, lo - split, hi - split)
+    return (_fibonacci_slice(base, lengths, k - 1, lo, split)
+            + _fibonacci_slice(base, lengths, k - 2, 0, hi - split))
+
+
+def iter_periodic(n: int, seed=None, period: str = DNA):
+    """Repetition of 'period' cut to length n (period "A" gives A^n). The seed is ignored."""
+    _check_length(n)
+    if not period or not period.isascii():
+        raise ValueError("period debe ser un str ASCII no vacío")
+    period = period.encode()
+    # Bloque múltiplo del periodo para que los bloques se concatenen sin desfase
+    repeats = max(1, BLOCK_SIZE // len(period))
+    chunk = period * repeats
+    for i in range(0, n, len(chunk)):
+        yield chunk[:min(len(chunk), n - i)]
+
+
+def iter_natural(n: int, seed=None, vocabulary_size: int = 5000, zipf_exponent: float = 1.1,
+                 letters: str = "etaoinshrdlcumwfgypbvkjxqz"):
+    """
+    Natural-language-like text: words drawn with Zipf frequencies from a random
+    vocabulary, separated by spaces. Word lengths and letters follow English-like
+    skewed distributions (frequent words are short).
+    """
+    _check_length(n)
+    rng = _rng(seed)
+    letter_weights = [1 / (i + 2) for i in range(len(letters))]
+    # El rango de Zipf es el orden de creación: el largo esperado crece con el rango.
+    # (dict y no set: el orden de un set de bytes cambia con PYTHONHASHSEED)
+    words = {}
+    while len(words) < vocabulary_size:
+        length = min(1 + int(rng.expovariate(1 / (1 + 6 * len(words) / vocabulary_size))), 20)
+        words.setdefault("".join(rng.choices(letters, letter_weights, k=length)).encode() + b" ")
+    vocabulary = list(words)
+    cum_weights = list(accumulate(1 / (r + 1) ** zipf_exponent for r in range(vocabulary_size)))
+    # Largo medio esperado, para pedir las palabras en lotes de tamaño parecido al bloque
+    mean = sum(len(w) * (c - p) for w, c, p in zip(vocabulary, cum_weights, [0] + cum_weights)) / cum_weights[-1]
+    pending = b""
+    while n > 0:
+        size = min(n, BLOCK_SIZE)
+        while len(pending) < size:
+            pending += b"".join(rng.choices(vocabulary, cum_weights=cum_weights, k=int(BLOCK_SIZE / mean) + 16))
+        block, pending = pending[:size], pending[size:]
+        n -= size
+        yield block
+
+
+GENERATORS = {
+    "uniform": iter_uniform,
+    "markov_dna": iter_markov_dna,
+    "fibonacci": iter_fibonacci,
+    "periodic": iter_periodic,
+    "natural": iter_natural,
+}
+
+
+def _generator(name: str):
+    if name not in GENERATORS:
+        raise ValueError(f"Unknown generator '{name}', expected one of {list(GENERATORS)}.")
+    return GENERATORS[name]
+
+def generate(name: str, n: int, seed=None, **params) -> bytes:
+    """
+    Generates a whole text in memory as ASCII bytes.
+
+    :param name: Generator name (see GENERATORS)
+    :param n: Length of the text
+    :param seed: Seed (or random.Random)
+    :param params: Extra parameters of the generator
+    """
+    return b"".join(_generator(name)(n, seed, **params))
+
+def write_corpus(path: str, name: str, n: int, seed=None, **params) -> int:
+    """
+    Streams a generated text to disk block by block, without holding it in memory.
+    Returns the number of bytes written.
+    """
+    written = 0
+    with open(path, "wb") as f:
+        for block in _generator(name)(n, seed, **params):
+            f.write(block)
+            written += len(block)
+    return written
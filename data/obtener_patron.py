@@ -1,22 +1,100 @@
-from random import randint
+import random
 
+MODES = ("present", "absent", "random")
+# Intentos por patrón antes de rendirse en modo "absent"
+MAX_ATTEMPTS = 1000
 
-def obtener_patron(text: str, j: int) -> str:
+
+def obtener_patron(text: str, j: int, seed=None) -> str:
     """
-    Obtiene un patrón de texto con j caracteres repetidos.
+    Obtiene un patrón de largo 2**j que aparece en el texto.
     :param text: Texto de entrada.
-    :param j: Número de caracteres a repetir.
+    :param j: Exponente del largo del patrón.
+    :param seed: Semilla (o random.Random).
     :return: Patrón de texto.
     """
     # verificamos que este en {6, 7, 8, 9, 10}
     if j not in {6, 7, 8, 9, 10}:
         raise ValueError("j debe estar en {6, 7, 8, 9, 10}")
-    # calculamos i max
+    return obtener_patrones(text, 2 ** j, 1, seed)[0]
+
+
+def obtener_patrones(text, m: int, count: int, seed=None, mode: str = "present",
+                     alphabet=None) -> list:
+    """
+    Obtiene 'count' patrones de largo m, del mismo tipo que el texto (str o bytes).
+
+    :param text: Texto de entrada.
+    :param m: Largo de los patrones.
+    :param count: Cantidad de patrones.
+    :param seed: Semilla (o random.Random).
+    :param mode: "present": substrings del texto, con ocurrencia garantizada;
+        "absent": patrones aleatorios que se verifica que no aparecen en el texto;
+        "random": patrones aleatorios sin verificar.
+    :param alphabet: Símbolos de los patrones aleatorios (por defecto, los del texto).
+    :return: Lista de patrones.
+    """
+    if mode not in MODES:
+        raise ValueError(f"mode debe ser uno de {list(MODES)}")
+    if m <= 0 or count < 0:
+        raise ValueError("m debe ser positivo y count no negativo")
+    rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+    n = len(text)
+
+    if mode == "present":
+        if m > n:
+            raise ValueError("El patrón no puede ser más largo que el texto")
+        return [text[i:i + m] for i in (rng.randint(0, n - m) for _ in range(count))]
+
+    symbols = sorted(set(alphabet if alphabet is not None else text))
+    if not symbols:
+        raise ValueError("No hay símbolos para construir patrones aleatorios")
+    as_bytes = not isinstance(text, str)
+
+    def random_pattern():
+        chosen = rng.choices(symbols, k=m)
+        return bytes(chosen) if as_bytes else "".join(chosen)
+
+    patterns = []
+    for _ in range(count):
+        pattern = random_pattern()
+        if mode == "absent":
+            attempts = 1
+            while pattern in text:
+                if attempts == MAX_ATTEMPTS:
+                    raise ValueError(f"No se encontró un patrón de largo {m} ausente del texto")
+                pattern = random_pattern()
+                attempts += 1
+        patterns.append(pattern)
+    return patterns
+
+
+def plantar_patron(text, pattern, count: int, seed=None):
+    """
+    Inserta 'count' copias de 'pattern' en posiciones aleatorias que no se solapan,
+    sobrescribiendo el texto, para garantizar ocurrencias.
+
+    :param text: Texto de entrada (str o bytes).
+    :param pattern: Patrón a plantar, del mismo tipo que el texto.
+    :param count: Cantidad de copias.
+    :param seed: Semilla (o random.Random).
+    :return: (texto nuevo, posiciones base 0 de las copias en orden creciente).
+    """
+    m = len(pattern)
     n = len(text)
-    i_max = n - 2 ** j - 1
-    # obtenemos un numero aleatorio entre 0 y i_max
-    i = randint(0, i_max)
-    # obtenemos el patron
-    patron = text[i:i + 2 ** j]
-    # retornamos el patron
-    return patron
+    if m == 0 or count * m > n:
+        raise ValueError("No caben count copias del patrón en el texto")
+    rng = seed if isinstance(seed, random.Random) else random.Random(seed)
+    # Se eligen count inicios sobre el texto "comprimido" (n - count*m huecos libres)
+    # y se separan m posiciones entre sí: así las copias nunca se solapan.
+    gaps = sorted(rng.sample(range(n - count * m + count), count))
+    positions = [g + k * (m - 1) for k, g in enumerate(gaps)]
+    pieces = []
+    previous = 0
+    for pos in positions:
+        pieces.append(text[previous:pos])
+        pieces.append(pattern)
+        previous = pos + m
+    pieces.append(text[previous:])
+    joined = "".join(pieces) if isinstance(text, str) else b"".join(pieces)
+    return joined, positions
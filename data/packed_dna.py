@@ -0,0 +1,153 @@
+BASES = "ACGT"
+# Tabla bytes -> código de 2 bits; los símbolos inválidos quedan en 255
+_ENCODE = bytes.maketrans(b"ACGT", b"\x00\x01\x02\x03")
+_DECODE = bytes.maketrans(b"\x00\x01\x02\x03", b"ACGT")
+_VALID = b"\x00\x01\x02\x03"
+# Máscara con los 2 bits bajos de cada byte prendidos
+_LOW_BITS = 0x03
+
+
+class PackedDNA:
+    """
+    DNA text over {A, C, G, T} packed at 2 bits per base, 4 bases per byte.
+    Base i is stored in byte i // 4, at bits 2 * (i % 4).
+
+    Supports len(), indexing (returns the base as a one-character str), slicing
+    (returns a PackedDNA), iteration and k-mer extraction as integers.
+    """
+
+    __slots__ = ("data", "length")
+
+    def __init__(self, data: bytearray = None, length: int = 0):
+        """
+        :param data: Packed bases; the unused high bits of the last byte must be zero
+        :param length: Number of bases
+        """
+        data = data if data is not None else bytearray()
+        if len(data) != (length + 3) // 4:
+            raise ValueError("data does not have (length + 3) // 4 bytes.")
+        self.data = data
+        self.length = length
+
+    @classmethod
+    def from_str(cls, text) -> 'PackedDNA':
+        """
+        Packs a str or bytes over ACGT.
+        """
+        if isinstance(text, str):
+            text = text.encode()
+        codes = bytes(text).translate(_ENCODE)
+        if codes.translate(None, _VALID):
+            raise ValueError("PackedDNA only supports the bases A, C, G and T.")
+        n = len(codes)
+        codes += bytes(-n % 4)
+        # Cada grupo de 4 bases se combina con aritmética de enteros grandes: como cada
+        # código ocupa 2 bits, los desplazamientos nunca cruzan de un byte a otro.
+        packed = 0
+        for k in range(4):
+            packed |= int.from_bytes(codes[k::4], "little") << (2 * k)
+        return cls(bytearray(packed.to_bytes(len(codes) // 4, "little")), n)
+
+    def to_str(self) -> str:
+        """Unpacks the bases into a str."""
+        packed = int.from_bytes(self.data, "little")
+        nbytes = len(self.data)
+        low = int.from_bytes(bytes([_LOW_BITS]) * nbytes, "little")
+        out = bytearray(nbytes * 4)
+        for k in range(4):
+            out[k::4] = ((packed >> (2 * k)) & low).to_bytes(nbytes, "little")
+        return bytes(out[:self.length]).translate(_DECODE).decode()
+
+    def kmer(self, i: int, k: int) -> int:
+        """
+        Returns bases i..i+k-1 as an integer, 2 bits per base, base i in the lowest bits.
+        """
+        if i < 0 or k < 0 or i + k > self.length:
+            raise IndexError("k-mer out of range")
+        first = i >> 2
+        last = (i + k + 3) >> 2
+        value = int.from_bytes(self.data[first:last], "little") >> ((i & 3) << 1)
+        return value & ((1 << (2 * k)) - 1)
+
+    @staticmethod
+    def encode_kmer(kmer: str) -> int:
+        """Encodes a str k-mer with the same layout as kmer()."""
+        value = 0
+        for i, base in enumerate(kmer):
+            value |= BASES.index(base) << (2 * i)
+        return value
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.data)
+
+    def ascii_codes(self) -> '_AsciiView':
+        """Read-only view whose items are the ASCII codes of the bases."""
+        return _AsciiView(self)
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.length)
+            if step != 1:
+                return PackedDNA.from_str(self.to_str()[index])
+            k = max(0, stop - start)
+            if k == 0:
+                return PackedDNA()
+            return PackedDNA(bytearray(self.kmer(start, k).to_bytes((k + 3) // 4, "little")), k)
+        if index < 0:
+            index += self.length
+        if not 0 <= index < self.length:
+            raise IndexError("PackedDNA index out of range")
+        return BASES[(self.data[index >> 2] >> ((index & 3) << 1)) & 3]
+
+    def __iter__(self):
+        data = self.data
+        for i in range(self.length):
+            yield BASES[(data[i >> 2] >> ((i & 3) << 1)) & 3]
+
+    def __eq__(self, other):
+        if isinstance(other, PackedDNA):
+            return self.length == other.length and self.data == other.data
+        if isinstance(other, str):
+            return self.length == len(other) and self.to_str() == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.length, bytes(self.data)))
+
+    def __str__(self):
+        return self.to_str()
+
+    def __repr__(self):
+        preview = self[:32].to_str() + ("..." if self.length > 32 else "")
+        return f"PackedDNA(len={self.length}, bases={preview!r})"
+
+
+class _AsciiView:
+    """
+    Indexing view of a PackedDNA that yields ASCII codes, so the matchers that work on
+    integer symbols (see algorithms.symbols.symbol_codes) can scan it without unpacking.
+    """
+
+    __slots__ = ("_packed",)
+
+    _CODES = b"ACGT"
+
+    def __init__(self, packed: PackedDNA):
+        self._packed = packed
+
+    def __len__(self):
+        return self._packed.length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._packed[index].to_str().encode()
+        packed = self._packed
+        if index < 0:
+            index += packed.length
+        if not 0 <= index < packed.length:
+            raise IndexError("PackedDNA index out of range")
+        return self._CODES[(packed.data[index >> 2] >> ((index & 3) << 1)) & 3]
@@ -0,0 +1,126 @@
+"""
+Oráculos ingenuos y textos de prueba compartidos por los tests.
+"""
+import mmap
+import random
+
+from automata.automata import Automata
+
+DNA = "ACGT"
+
+
+def find_all(text, pattern) -> list[int]:
+    """Every 0-based start of 'pattern' in 'text' (overlapping), using str/bytes.find."""
+    if isinstance(text, (bytearray, memoryview)):
+        text = bytes(text)
+    if isinstance(pattern, (bytearray, memoryview)):
+        pattern = bytes(pattern)
+    if len(pattern) == 0:
+        # Igual que str.find: el patrón vacío aparece en todas las posiciones
+        return list(range(len(text) + 1))
+    positions = []
+    i = text.find(pattern)
+    while i >= 0:
+        positions.append(i)
+        i = text.find(pattern, i + 1)
+    return positions
+
+
+def random_text(rng: random.Random, n: int, alphabet: str = DNA) -> str:
+    return "".join(rng.choice(alphabet) for _ in range(n))
+
+
+def periodic_text(n: int, period: str = "AAC") -> str:
+    return (period * (n // len(period) + 1))[:n]
+
+
+def cases(seed: int = 0, count: int = 60, alphabets=("AB", DNA, "ACGTNXYZ")):
+    """
+    Yields (text, pattern) pairs over random and periodic texts: patterns taken from
+    the text, random ones (mostly absent) and ones longer than the text.
+    """
+    rng = random.Random(seed)
+    for i in range(count):
+        alphabet = alphabets[i % len(alphabets)]
+        n = rng.randint(0, 300)
+        text = random_text(rng, n, alphabet) if i % 3 else periodic_text(n, alphabet[:2] + alphabet[0])
+        m = rng.randint(1, 12)
+        if n >= m and i % 2:
+            start = rng.randint(0, n - m)
+            pattern = text[start:start + m]
+        else:
+            pattern = random_text(rng, m, alphabet)
+        yield text, pattern
+    yield "", "A"
+    yield "AC", "ACGT"
+    yield "A" * 50, "AAA"
+
+
+def multi_oracle(text, patterns) -> list[tuple[int, int]]:
+    """Sorted (pattern_id, 0-based start) pairs of every pattern, using find_all."""
+    return sorted((pattern_id, pos) for pattern_id, pattern in enumerate(patterns)
+                  for pos in find_all(text, pattern))
+
+
+def pattern_sets(seed: int = 0, count: int = 60):
+    """Yields (text, patterns) with 1-6 patterns, mostly taken from the text."""
+    rng = random.Random(seed)
+    for i in range(count):
+        alphabet = "AB" if i % 2 else "ACGT"
+        n = rng.randint(0, 200)
+        text = random_text(rng, n, alphabet) if i % 3 else periodic_text(n, alphabet[:2] + alphabet[0])
+        patterns = []
+        for _ in range(rng.randint(1, 6)):
+            m = rng.randint(1, 8)
+            if n >= m and rng.random() < 0.7:
+                start = rng.randint(0, n - m)
+                patterns.append(text[start:start + m])
+            else:
+                patterns.append(random_text(rng, m, alphabet))
+        yield text, patterns
+
+
+def mmap_of(path, data: bytes) -> mmap.mmap:
+    """Writes 'data' to 'path' and maps it read-only (the caller closes it)."""
+    with open(path, "wb") as f:
+        f.write(data)
+    with open(path, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def approximate_nfa(pattern: str, k: int, edits: bool = True, alphabet: list[str] = None) -> 'Automata':
+    """
+    NFA (with epsilon transitions) that accepts the strings ending with an occurrence
+    of 'pattern' with at most k errors: the automaton that algorithms.approximate
+    simulates with bit vectors, used here as its oracle. State q_i_e means i pattern symbols read with
+    e errors; q_0_0 loops on every symbol so an occurrence may start anywhere.
+
+    :param pattern: The pattern
+    :param k: Maximum number of errors
+    :param edits: True for Levenshtein (substitutions, insertions, deletions),
+        False for Hamming (substitutions only)
+    :param alphabet: Symbols of the text (default: those of the pattern)
+    """
+    if k < 0:
+        raise ValueError("k must be non-negative.")
+    alphabet = sorted(set(alphabet if alphabet is not None else pattern))
+    m = len(pattern)
+    names = [[f"q_{i}_{e}" for e in range(k + 1)] for i in range(m + 1)]
+    edges = [(names[0][0], c, names[0][0]) for c in alphabet]
+    for e in range(k + 1):
+        for i in range(m + 1):
+            if i < m:
+                edges.append((names[i][e], pattern[i], names[i + 1][e]))
+            if e == k:
+                continue
+            if i < m:
+                # sustitución
+                edges.extend((names[i][e], c, names[i + 1][e + 1]) for c in alphabet)
+            if edits:
+                # inserción (símbolo de más en el texto)
+                edges.extend((names[i][e], c, names[i][e + 1]) for c in alphabet)
+                if i < m:
+                    # borrado (símbolo del patrón que falta en el texto)
+                    edges.append((names[i][e], "ε", names[i + 1][e + 1]))
+    states = [name for row in names for name in row]
+    return Automata.from_edges(states, edges, names[0][0], names[m], alphabet=alphabet)
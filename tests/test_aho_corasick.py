@@ -0,0 +1,42 @@
+import pytest
+
+from algorithms.aho_corasick import AhoCorasick, aho_corasick
+from tests.helpers import mmap_of, multi_oracle, pattern_sets
+
+
+def test_matches_oracle_in_end_order():
+    for text, patterns in pattern_sets(9):
+        result = aho_corasick(text, patterns)
+        assert sorted(result) == multi_oracle(text, patterns)
+        ends = [pos + len(patterns[pattern_id]) for pattern_id, pos in result]
+        assert ends == sorted(ends)
+        assert aho_corasick(text.encode(), patterns) == result
+
+
+def test_nested_duplicate_and_non_ascii_patterns():
+    assert aho_corasick("ushers", ["he", "she", "his", "hers"]) == [(1, 1), (0, 2), (3, 2)]
+    assert sorted(aho_corasick("aaa", ["a", "a", "aa"])) == multi_oracle("aaa", ["a", "a", "aa"])
+    assert sorted(aho_corasick("ñañaña", ["ña", "aña"])) == multi_oracle("ñañaña", ["ña", "aña"])
+
+
+def test_bytes_mmap_and_modes(tmp_path):
+    data = b"ACGTACGTAC"
+    ac = AhoCorasick(["AC", "GTA"])
+    mm = mmap_of(tmp_path / "text", data)
+    try:
+        assert sorted(ac.search(mm)) == multi_oracle(data, [b"AC", b"GTA"])
+    finally:
+        mm.close()
+    assert ac.search(data, mode="count") == 5
+    assert ac.search("TTTT", mode="exists") is False
+    assert ac.search(data, mode="first_k", k=2) == [(0, 0), (1, 2)]
+    with pytest.raises(ValueError):
+        ac.search(data, mode="array")
+
+
+def test_invalid_patterns():
+    with pytest.raises(ValueError):
+        AhoCorasick([])
+    with pytest.raises(ValueError):
+        AhoCorasick(["", "A"])
+    assert aho_corasick("", ["A"]) == []
@@ -0,0 +1,122 @@
+import random
+
+import pytest
+
+from algorithms.approximate import METHODS, hamming_search, levenshtein_search
+from automata.lazy_dfa import LazyDFA
+from tests.helpers import approximate_nfa, mmap_of, periodic_text, random_text
+
+
+def naive_hamming(text, pattern, k: int) -> list[tuple[int, int]]:
+    m = len(pattern)
+    result = []
+    for s in range(len(text) - m + 1) if m else ():
+        distance = sum(a != b for a, b in zip(text[s:s + m], pattern))
+        if distance <= k:
+            result.append((s, distance))
+    return result
+
+
+def naive_levenshtein(text, pattern, k: int) -> list[tuple[int, int]]:
+    # Sellers: programación dinámica con la fila 0 en cero (la ocurrencia empieza en cualquier parte)
+    m = len(pattern)
+    column = list(range(m + 1))
+    result = []
+    for j, c in enumerate(text):
+        previous = column
+        column = [0]
+        for i in range(1, m + 1):
+            column.append(min(previous[i] + 1, column[i - 1] + 1, previous[i - 1] + (pattern[i - 1] != c)))
+        if m and column[m] <= k:
+            result.append((j, column[m]))
+    return result
+
+
+def approximate_cases(seed: int):
+    rng = random.Random(seed)
+    for i in range(40):
+        alphabet = "AB" if i % 2 else "ACGT"
+        n = rng.randint(0, 150)
+        text = random_text(rng, n, alphabet) if i % 3 else periodic_text(n, alphabet[:2] + alphabet[0])
+        m = rng.randint(1, 24)
+        if n >= m and i % 2:
+            start = rng.randint(0, n - m)
+            pattern = list(text[start:start + m])
+            for _ in range(rng.randint(0, 3)):
+                pattern[rng.randrange(m)] = rng.choice(alphabet)
+            pattern = "".join(pattern)
+        else:
+            pattern = random_text(rng, m, alphabet)
+        yield text, pattern, rng.randint(0, 3)
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_hamming_matches_oracle(method):
+    for text, pattern, k in approximate_cases(21):
+        if method == "filter" and len(pattern) <= k:
+            continue
+        expected = naive_hamming(text, pattern, k)
+        assert hamming_search(text, pattern, k, method=method) == expected
+        assert hamming_search(text.encode(), pattern, k, method=method) == expected
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_levenshtein_matches_oracle(method):
+    for text, pattern, k in approximate_cases(21):
+        if method == "filter" and len(pattern) <= k:
+            continue
+        expected = naive_levenshtein(text, pattern, k)
+        assert levenshtein_search(text, pattern, k, method=method) == expected
+        assert levenshtein_search(text.encode(), pattern, k, method=method) == expected
+
+
+def test_bit_vectors_simulate_the_nfa():
+    for text, pattern, k in approximate_cases(22):
+        if len(pattern) <= k:
+            continue
+        alphabet = set(text) | set(pattern)
+        hamming = LazyDFA(approximate_nfa(pattern, k, edits=False, alphabet=alphabet))
+        assert hamming.search(text) == [s + len(pattern) - 1 for s, _ in hamming_search(text, pattern, k)]
+        edits = LazyDFA(approximate_nfa(pattern, k, alphabet=alphabet))
+        assert edits.search(text) == [j for j, _ in levenshtein_search(text, pattern, k)]
+
+
+def test_non_ascii_long_patterns_and_mmap(tmp_path):
+    text = "ñandú ñandu ñandúes ñamdú"
+    assert hamming_search(text, "ñandú", 1) == naive_hamming(text, "ñandú", 1)
+    assert levenshtein_search(text, "ñandú", 1) == naive_levenshtein(text, "ñandú", 1)
+    # Filtro y recorrido completo sobre un str no ASCII, también con un patrón ASCII
+    wide_text = random_text(random.Random(29), 600, "ACGTñ")
+    for wide_pattern in (wide_text[200:240], "ACGT" * 10):
+        for method in ("filter", "scan"):
+            expected = naive_hamming(wide_text, wide_pattern, 2)
+            assert hamming_search(wide_text, wide_pattern, 2, method=method) == expected
+            expected = naive_levenshtein(wide_text, wide_pattern, 2)
+            assert levenshtein_search(wide_text, wide_pattern, 2, method=method) == expected
+    rng = random.Random(23)
+    long_text = random_text(rng, 2000, "ACGT")
+    pattern = long_text[700:790]
+    assert hamming_search(long_text, pattern, 2) == naive_hamming(long_text, pattern, 2)
+    data = long_text.encode()
+    mm = mmap_of(tmp_path / "text", data)
+    try:
+        assert levenshtein_search(mm, pattern, 2) == naive_levenshtein(data, pattern.encode(), 2)
+        assert hamming_search(mm, pattern, 2, method="filter") == naive_hamming(data, pattern.encode(), 2)
+    finally:
+        mm.close()
+
+
+def test_empty_and_errors():
+    assert hamming_search("", "A", 1) == [] and levenshtein_search("ACGT", "", 1) == []
+    assert hamming_search("AC", "ACGT", 1) == []
+    assert hamming_search("ACGTACGA", "ACGA", 1, mode="count") == 2
+    with pytest.raises(ValueError):
+        hamming_search("ACGT", "AC", -1)
+    with pytest.raises(ValueError):
+        levenshtein_search("ACGT", "AC", 1, method="nope")
+    with pytest.raises(ValueError):
+        levenshtein_search("ACGT", "AC", 2, method="filter")
+    with pytest.raises(ValueError):
+        hamming_search("ACGT", "AC", 1, mode="array")
+    with pytest.raises(ValueError):
+        approximate_nfa("AC", -1)
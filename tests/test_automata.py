@@ -0,0 +1,60 @@
+import pytest
+
+from automata.automata import Automata
+from automata.node import AutomataState
+
+
+def test_constructor_does_not_mutate_the_callers_transitions():
+    p, q = AutomataState("p"), AutomataState("q", is_accepting=True)
+    transitions = {"p": {"a": q}}
+    automata = Automata(states=[p, q], alphabet=["a"], transitions=transitions,
+                        initial_state=p, final_states=[q])
+    automata.add_transition("q", "a", "p")
+    assert transitions == {"p": {"a": q}}
+    # Los estados siguen compartiendo sus diccionarios con automata.transitions
+    assert p.transitions is automata.transitions["p"]
+    assert automata.test("a") and not automata.test("aa") and automata.test("aaa")
+
+
+def test_from_edges_builds_the_same_automaton_as_add_transition():
+    edges = [("p", "a", "q"), ("q", "b", "p"), ("q", "a", "q")]
+    bulk = Automata.from_edges(["p", "q"], edges, "p", ["q"])
+    one_by_one = Automata(states=[], alphabet=["a", "b"])
+    one_by_one.add_state(AutomataState("p"))
+    one_by_one.add_state(AutomataState("q", is_accepting=True))
+    for source, symbol, target in edges:
+        one_by_one.add_transition(source, symbol, target)
+    one_by_one.set_initial_state("p")
+    assert bulk.alphabet == ["a", "b"]
+    for word in ["", "a", "ab", "aa", "aba", "abaa", "b"]:
+        assert bulk.test(word) == one_by_one.test(word)
+
+
+def test_name_index_lookups():
+    automata = Automata.from_edges(["p", "q"], [("p", "a", "q"), ("q", "b", "q")], "p", ["q"])
+    assert automata.get_transition_idx("p", "a") == "q"
+    assert automata.get_transition_idx("p", "b") is None
+    assert automata.is_accepting_state("q") and not automata.is_accepting_state("p")
+    with pytest.raises(ValueError):
+        automata.is_accepting_state("r")
+    with pytest.raises(ValueError):
+        automata.add_state(AutomataState("p"))
+
+
+@pytest.mark.parametrize("states, edges, initial, finals", [
+    (["p", "p"], [], "p", []),
+    (["p"], [], "r", []),
+    (["p"], [], "p", ["r"]),
+    (["p"], [("p", "a", "r")], "p", []),
+])
+def test_from_edges_rejects_invalid_input(states, edges, initial, finals):
+    with pytest.raises(ValueError):
+        Automata.from_edges(states, edges, initial, finals)
+
+
+def test_from_edges_checks_the_given_alphabet():
+    with pytest.raises(ValueError):
+        Automata.from_edges(["p"], [("p", "b", "p")], "p", [], alphabet=["a"])
+    # Las transiciones épsilon no necesitan estar en el alfabeto
+    nfa = Automata.from_edges(["p", "q"], [("p", "ε", "q")], "p", ["q"], alphabet=["a"])
+    assert nfa.epsilon_closure(nfa.initial_state) == set(nfa.states)
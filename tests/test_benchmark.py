@@ -0,0 +1,110 @@
+import json
+
+import pytest
+
+from algorithms.pattern_cache import ALGORITHMS
+from benchmark import runner
+from benchmark.__main__ import main
+from benchmark.registry import available_algorithms, get_algorithm, register_algorithm
+from benchmark.runner import (BenchmarkConfig, load_results, measure, run_benchmark, summarize,
+                              write_results)
+from data.packed_dna import PackedDNA
+from tests.helpers import find_all
+
+
+def small_config(**params) -> BenchmarkConfig:
+    params = {"algorithms": ["KMP", "BM", "BDM"], "text_lengths": [2000], "pattern_lengths": [4, 16],
+              "patterns_per_length": 2, "repetitions": 2, "warmup": 0, "seed": 17, **params}
+    return BenchmarkConfig(**params)
+
+
+def test_summarize():
+    summary = summarize([4.0, 1.0, 3.0, 2.0, 5.0])
+    assert summary["median"] == 3.0 and summary["q1"] == 2.0 and summary["q3"] == 4.0
+    assert summary["iqr"] == 2.0 and summary["min"] == 1.0 and summary["mean"] == 3.0
+    assert summarize([0.5])["iqr"] == 0
+
+
+def test_measure_counts_every_match():
+    text = "ACGTACGTAAC" * 20
+    patterns = ["ACG", "AAC"]
+    for algorithm in ["KMP", "BM", "BDM", "ShiftOr"]:
+        entry = measure(algorithm, text, patterns, repetitions=3, warmup=1, count_operations=True)
+        assert entry["matches"] == sum(len(find_all(text, p)) for p in patterns)
+        assert len(entry["search"]["samples"]) == len(entry["preprocess"]["samples"]) == 6
+        assert entry["peak_memory_bytes"] is not None and entry["pattern_length"] == 3
+
+
+def test_run_benchmark_report(tmp_path):
+    report = run_benchmark(small_config(count_operations=True), log=None)
+    results = report["results"]
+    assert len(results) == 3 * 2
+    assert {r["algorithm"] for r in results} == {"KMP", "BM", "BDM"}
+    # Todos los algoritmos ven los mismos patrones: las ocurrencias coinciden
+    for m in (4, 16):
+        assert len({r["matches"] for r in results if r["pattern_length"] == m}) == 1
+    assert all(r["alphabet_size"] == 4 and "operations" in r for r in results)
+    path = tmp_path / "results.json"
+    write_results(report, str(path))
+    assert load_results(str(path)) == json.loads(json.dumps(report))
+
+
+def test_packed_is_measured_on_a_packed_text(monkeypatch):
+    seen = {}
+    original = runner.measure
+
+    def recording(algorithm, text, patterns, *args):
+        seen[algorithm] = (type(text), type(patterns[0]))
+        return original(algorithm, text, patterns, *args)
+
+    monkeypatch.setattr(runner, "measure", recording)
+    report = run_benchmark(small_config(algorithms=["KMP", "Packed"]), log=None)
+    assert seen == {"KMP": (str, str), "Packed": (PackedDNA, str)}
+    for m in (4, 16):
+        assert len({r["matches"] for r in report["results"] if r["pattern_length"] == m}) == 1
+
+
+def test_skips_patterns_longer_than_text_and_custom_texts():
+    report = run_benchmark(small_config(pattern_lengths=[4, 5000]), texts={"t": "ñandú ñandú"}, log=None)
+    assert {r["pattern_length"] for r in report["results"]} == {4}
+    assert {r["text"] for r in report["results"]} == {"t"}
+
+
+def test_load_results_rejects_other_files(tmp_path):
+    path = tmp_path / "other.json"
+    path.write_text(json.dumps({"schema": "x"}))
+    with pytest.raises(ValueError):
+        load_results(str(path))
+    path.write_text(json.dumps({"schema": "tarea-teoria-benchmark", "schema_version": 0}))
+    with pytest.raises(ValueError):
+        load_results(str(path))
+
+
+def test_config_and_registry_errors():
+    with pytest.raises(ValueError):
+        BenchmarkConfig(repetitions=0)
+    with pytest.raises(ValueError):
+        BenchmarkConfig(warmup=-1)
+    with pytest.raises(ValueError):
+        get_algorithm("Nope")
+    with pytest.raises(ValueError):
+        register_algorithm("KMP", None, None)
+
+
+def test_register_algorithm():
+    register_algorithm("Naive", lambda pattern: None, lambda text, pattern, pre: find_all(text, pattern))
+    try:
+        assert "Naive" in available_algorithms()
+        assert measure("Naive", "AAAA", ["AA"], repetitions=1, warmup=0)["matches"] == 3
+    finally:
+        del ALGORITHMS["Naive"]
+
+
+def test_command_line(tmp_path, capsys):
+    path = tmp_path / "out.json"
+    main(["--algorithms", "KMP", "--text-lengths", "500", "--pattern-lengths", "8",
+          "--repetitions", "1", "--no-memory", "--generator", "periodic", "--output", str(path)])
+    report = load_results(str(path))
+    assert [r["algorithm"] for r in report["results"]] == ["KMP"]
+    assert report["results"][0]["peak_memory_bytes"] is None
+    assert report["config"]["generator"] == "periodic"
@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from algorithms.bndm import bndm, bndm_masks
+from algorithms.shift_or import shift_or, shift_or_masks
+from tests.helpers import cases, find_all, mmap_of, periodic_text, random_text
+
+
+def test_bndm_matches_oracle():
+    for text, pattern in cases(seed=13):
+        expected = [p + 1 for p in find_all(text, pattern)]
+        assert bndm(text, pattern) == expected
+        assert bndm(text.encode(), pattern) == expected
+    assert bndm("ACG", "") == [1, 2, 3, 4]
+
+
+def test_shift_or_matches_oracle():
+    for text, pattern in cases(seed=13):
+        assert shift_or(text, pattern) == find_all(text, pattern)
+        assert shift_or(text.encode(), pattern) == find_all(text, pattern)
+    assert shift_or("ACG", "") == []
+
+
+def test_patterns_longer_than_a_machine_word():
+    rng = random.Random(64)
+    for text in [random_text(rng, 3000, "AB"), periodic_text(3000, "AAC")]:
+        for m in (63, 64, 65, 130):
+            pattern = text[1000:1000 + m]
+            expected = find_all(text, pattern)
+            assert shift_or(text, pattern) == expected
+            assert bndm(text, pattern) == [p + 1 for p in expected]
+
+
+def test_non_ascii_and_precomputed_masks():
+    text = "ñandú ñandú-ñu ÑAÑA ñ"
+    for pattern in ["ñ", "ñu", "ñandú", "AÑA", "and", "€"]:
+        expected = find_all(text, pattern)
+        assert shift_or(text, pattern) == expected
+        assert bndm(text, pattern) == [p + 1 for p in expected]
+    # Máscaras de bytes con un texto Unicode
+    assert shift_or(text, "and", masks=shift_or_masks("and")) == find_all(text, "and")
+    assert bndm(text, "and", masks=bndm_masks("and")) == [p + 1 for p in find_all(text, "and")]
+    assert isinstance(shift_or_masks("ñu"), dict) and isinstance(bndm_masks("ñu"), dict)
+
+
+def test_mmap_and_modes(tmp_path):
+    data = b"ACGTACGTAC"
+    mm = mmap_of(tmp_path / "text", data)
+    try:
+        assert shift_or(mm, "AC") == [0, 4, 8]
+        assert bndm(mm, "AC") == [1, 5, 9]
+    finally:
+        mm.close()
+    assert shift_or(data, "AC", mode="count") == bndm(data, "AC", mode="count") == 3
+    assert shift_or(data, "TT", mode="exists") is False
+    assert bndm(data, "AC", mode="first_k", k=2) == [1, 5]
+    with pytest.raises(ValueError):
+        bndm(data, "AC", mode="nope")
@@ -0,0 +1,57 @@
+import pytest
+
+from algorithms.boyer_moore import VARIANTS, BoyerMooreTables, ShiftMap, boyer_moore
+from tests.helpers import cases, find_all, mmap_of
+
+
+def expected(text, pattern):
+    # boyer_moore no reporta nada para el patrón vacío
+    return find_all(text, pattern) if pattern else []
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_matches_oracle(variant):
+    for text, pattern in cases(seed=12):
+        assert boyer_moore(text, pattern, variant=variant) == expected(text, pattern)
+        assert boyer_moore(text.encode(), pattern, variant=variant) == expected(text, pattern)
+    assert boyer_moore("ACGT", "", variant=variant) == []
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_non_ascii_text_and_pattern(variant):
+    text = "ñandú ñandú-ñu ÑAÑA ñ" * 3
+    for pattern in ["ñ", "ñu", "ñandú", "AÑA", "and", "ú-", "€"]:
+        assert boyer_moore(text, pattern, variant=variant) == expected(text, pattern)
+    assert boyer_moore("🧬A🧬A", "🧬A", variant=variant) == [0, 2]
+    encoded = text.encode()
+    assert boyer_moore(encoded, "ñu", variant=variant) == expected(encoded, "ñu".encode())
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_wide_tables_are_sparse_and_reused(variant):
+    tables = BoyerMooreTables("ñandú", variant)
+    for table in (tables.bad_char, tables.shift):
+        assert table is None or (isinstance(table, ShiftMap) and len(table) <= 5)
+    # Tablas de un patrón ASCII: un texto Unicode las ensancha una sola vez
+    ascii_tables = BoyerMooreTables("and", variant)
+    text = "ñandú and ñandú"
+    assert boyer_moore(text, "and", tables=ascii_tables) == [1, 6, 11]
+    widened = ascii_tables.widened()
+    assert boyer_moore(text, "and", tables=ascii_tables) == [1, 6, 11]
+    assert ascii_tables.widened() is widened
+    assert widened.widened() is widened
+    assert boyer_moore("band", "and", tables=ascii_tables) == [1]
+
+
+def test_mmap_and_modes(tmp_path):
+    data = b"ACGTACGTAC"
+    mm = mmap_of(tmp_path / "text", data)
+    try:
+        assert boyer_moore(mm, "AC", variant="full") == [0, 4, 8]
+    finally:
+        mm.close()
+    assert boyer_moore(data, "AC", mode="count") == 3
+    assert boyer_moore(data, "TT", mode="exists") is False
+    assert boyer_moore(data, "AC", mode="first_k", k=2) == [0, 4]
+    with pytest.raises(ValueError):
+        BoyerMooreTables("AC", "nope")
@@ -0,0 +1,103 @@
+import pytest
+
+from algorithms.aho_corasick import aho_corasick
+from algorithms.backwards_dawg_matching import backwards_dawg_matching
+from algorithms.bndm import bndm
+from algorithms.boyer_moore import boyer_moore
+from algorithms.knuth_morris_pratt import kmp_search
+from algorithms import symbols
+from algorithms.search_file import search_file
+from algorithms.set_backwards_dawg_matching import set_backwards_dawg_matching
+from algorithms.shift_or import shift_or
+from algorithms.symbols import as_symbols, symbol_codes, symbol_iter
+from algorithms.vectorized import numpy_available, vectorized_search
+from data.packed_dna import PackedDNA
+from tests.helpers import cases, find_all, mmap_of
+
+# Cada matcher con posiciones base 0
+MATCHERS = {
+    "KMP": kmp_search,
+    "BM": boyer_moore,
+    "BDM": lambda text, pattern: [p - 1 for p in backwards_dawg_matching(pattern, text)],
+    "BNDM": lambda text, pattern: [p - 1 for p in bndm(text, pattern)],
+    "ShiftOr": shift_or,
+    "AhoCorasick": lambda text, pattern: [p for _, p in aho_corasick(text, [pattern])],
+    "SetBDM": lambda text, pattern: [p for _, p in set_backwards_dawg_matching([pattern], text)],
+}
+if numpy_available():
+    MATCHERS["Vectorized"] = vectorized_search
+
+WRAPPERS = {
+    "bytes": bytes,
+    "bytearray": bytearray,
+    "memoryview": memoryview,
+}
+
+
+@pytest.mark.parametrize("name", list(MATCHERS))
+@pytest.mark.parametrize("wrapper", list(WRAPPERS))
+def test_bytes_like_texts_match_oracle(name, wrapper):
+    search = MATCHERS[name]
+    for text, pattern in cases(seed=8, count=30):
+        data = text.encode()
+        expected = find_all(data, pattern.encode())
+        assert search(WRAPPERS[wrapper](data), pattern) == expected
+        assert search(WRAPPERS[wrapper](data), pattern.encode()) == expected
+
+
+@pytest.mark.parametrize("name", list(MATCHERS))
+def test_mmap_and_non_ascii_texts(name, tmp_path):
+    search = MATCHERS[name]
+    text = "ñAñAAñ" * 20
+    data = text.encode()
+    mm = mmap_of(tmp_path / "text", data)
+    try:
+        assert search(mm, "ñA") == find_all(data, "ñA".encode())
+    finally:
+        mm.close()
+    if name == "Vectorized":
+        # Con un str no ASCII las posiciones en bytes no son las del str
+        with pytest.raises(ValueError):
+            search(text, "ñA")
+    else:
+        assert search(text, "ñA") == find_all(text, "ñA")
+    # Un memoryview de otro formato se lee como bytes
+    view = memoryview(b"ACACGT").cast("H")
+    assert search(view, "AC") == [0, 2]
+
+
+def test_search_file_with_every_mode(tmp_path):
+    path = tmp_path / "text"
+    path.write_bytes(b"ACGTACGTAC")
+    assert search_file(str(path), "GTA", "BM") == [2, 6]
+    assert search_file(str(path), "GTA", "KMP", mode="count") == 2
+    assert list(search_file(str(path), "AC", "KMP", mode="iter")) == [0, 4, 8]
+    empty = tmp_path / "empty"
+    empty.write_bytes(b"")
+    assert search_file(str(empty), "A") == []
+
+
+def test_symbol_normalization():
+    assert as_symbols(b"AC", "A") == (b"AC", b"A")
+    assert as_symbols("AC", b"A") == ("AC", "A")
+    codes, size = symbol_codes("ñA")
+    assert list(codes) == [ord("ñ"), ord("A")] and size == 0x110000
+    assert symbol_codes("AC") == (b"AC", 256)
+
+
+def test_symbol_iter_reads_the_codes_without_copying(tmp_path, monkeypatch):
+    # Bloques chicos para que los str se codifiquen en varias partes
+    monkeypatch.setattr(symbols, "ITER_BLOCK", 2)
+    for text, wide in (("ACGTA", False), ("ACGñT", False), ("ACGT", True), (b"ACGT", False),
+                       (memoryview(b"ACACGT").cast("H"), False), (PackedDNA.from_str("ACGTTG"), False)):
+        codes, size = symbol_codes(text, wide=wide)
+        n = len(codes)
+        assert symbol_iter(text, wide=wide)[1] == size
+        assert list(symbol_iter(text, wide=wide)[0]) == [codes[i] for i in range(n)]
+        assert list(symbol_iter(text, wide, 1, n - 1)[0]) == [codes[i] for i in range(1, n - 1)]
+    mm = mmap_of(tmp_path / "text", b"ACGT")
+    try:
+        assert list(symbol_iter(mm)[0]) == list(b"ACGT")
+        assert list(symbol_iter(mm, start=1, end=3)[0]) == list(b"CG")
+    finally:
+        mm.close()
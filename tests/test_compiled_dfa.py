@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+from algorithms.backwards_dawg_matching import backwards_dawg_matching, reversed_dawg
+from automata.automata import Automata
+from automata.compiled_dfa import CompiledDFA
+from tests.helpers import cases, find_all, mmap_of
+
+
+def random_dfa(rng: random.Random, n: int, alphabet: str) -> Automata:
+    names = [f"q{i}" for i in range(n)]
+    edges = [(name, c, rng.choice(names)) for name in names for c in alphabet if rng.random() < 0.8]
+    finals = [name for name in names if rng.random() < 0.3]
+    return Automata.from_edges(names, edges, names[0], finals, alphabet=list(alphabet))
+
+
+def test_compile_agrees_with_automata_test():
+    rng = random.Random(1)
+    for _ in range(30):
+        dfa = random_dfa(rng, rng.randint(1, 8), "ab")
+        compiled = dfa.compile()
+        for _ in range(30):
+            word = "".join(rng.choice("abc") for _ in range(rng.randint(0, 8)))
+            assert compiled.test(word) == dfa.test(word)
+
+
+def test_accepting_flags_are_bytes():
+    dfa = Automata.from_edges(["p", "q"], [("p", "a", "q"), ("q", "a", "p")], "p", ["q"])
+    compiled = dfa.compile()
+    assert compiled.accepting == b"\x00\x01"
+    assert compiled.is_accepting(1) and not compiled.is_accepting(0) and not compiled.is_accepting(-1)
+    assert compiled.delta(0, "a") == 1 and compiled.delta(0, "z") == -1
+
+
+def test_constructor_validates_sizes():
+    from array import array
+    with pytest.raises(ValueError):
+        CompiledDFA(["p"], ["a"], array("i", [0, 0]), b"\x00")
+    with pytest.raises(ValueError):
+        CompiledDFA(["p"], ["a"], array("i", [0]), b"\x00\x00")
+    with pytest.raises(ValueError):
+        CompiledDFA(["p"], ["a"], [0], b"\x00")
+
+
+def bdm(text, pattern, **kwargs):
+    """BDM con posiciones base 0, para comparar con el oráculo."""
+    return [p - 1 for p in backwards_dawg_matching(pattern, text, **kwargs)]
+
+
+def test_bdm_matches_oracle():
+    for text, pattern in cases(seed=1):
+        expected = find_all(text, pattern)
+        assert bdm(text, pattern) == expected
+        assert bdm(text, pattern, dawg_pr=reversed_dawg(pattern)) == expected
+        assert bdm(text.encode(), pattern.encode()) == expected
+
+
+def test_bdm_edge_inputs(tmp_path):
+    assert bdm("ACG", "") == [0, 1, 2, 3]
+    assert bdm("", "A") == []
+    assert bdm("AC", "ACG") == []
+    assert bdm("ñAñAA", "ñA") == find_all("ñAñAA", "ñA")
+    mm = mmap_of(tmp_path / "text", b"ACGTACGTAC")
+    try:
+        assert bdm(mm, b"GTA") == [2, 6]
+    finally:
+        mm.close()
@@ -0,0 +1,69 @@
+import random
+
+from algorithms.dawg import dawg, dawg_set
+from tests.helpers import random_text
+
+
+def suffixes(word):
+    return {word[i:] for i in range(len(word) + 1)}
+
+
+def substrings(word):
+    return {word[i:j] for i in range(len(word) + 1) for j in range(i, len(word) + 1)}
+
+
+def all_words(alphabet, max_length):
+    words = [""]
+    frontier = [""]
+    for _ in range(max_length):
+        frontier = [w + c for w in frontier for c in alphabet]
+        words.extend(frontier)
+    return words
+
+
+def test_online_dawg_recognizes_exactly_the_suffixes():
+    rng = random.Random(2)
+    for _ in range(40):
+        pattern = random_text(rng, rng.randint(0, 7), "ab")
+        automata = dawg(pattern)
+        compiled = automata.compile()
+        expected = suffixes(pattern)
+        for word in all_words("ab", len(pattern) + 1):
+            assert automata.test(word) == (word in expected)
+            assert compiled.test(word) == (word in expected)
+
+
+def test_online_dawg_is_minimal_and_linear():
+    rng = random.Random(3)
+    for _ in range(30):
+        pattern = random_text(rng, rng.randint(1, 40), "ACGT")
+        online = dawg(pattern)
+        # El autómata de sufijos tiene a lo más 2m - 1 estados y coincide con el minimizado
+        assert len(online.states) <= max(2 * len(pattern) - 1, 2)
+        assert len(online.states) == len(dawg(pattern, method="subset").minimize().states)
+
+
+def test_online_and_subset_constructions_agree():
+    rng = random.Random(4)
+    for _ in range(20):
+        pattern = random_text(rng, rng.randint(1, 8), "abc")
+        online, subset = dawg(pattern).compile(), dawg(pattern, method="subset").compile()
+        for word in substrings(pattern) | {"cc", "abca", "ba"}:
+            assert online.test(word) == subset.test(word)
+
+
+def test_dawg_set_recognizes_suffixes_of_every_pattern():
+    rng = random.Random(5)
+    for _ in range(20):
+        patterns = [random_text(rng, rng.randint(1, 6), "ab") for _ in range(rng.randint(1, 4))]
+        compiled = dawg_set(patterns).compile()
+        expected = set().union(*(suffixes(p) for p in patterns))
+        for word in all_words("ab", 6):
+            assert compiled.test(word) == (word in expected)
+
+
+def test_non_ascii_and_bytes_patterns():
+    assert dawg("ñañ").compile().test("añ")
+    assert not dawg("ñañ").compile().test("ña")
+    compiled = dawg(b"GATTACA").compile()
+    assert compiled.test(b"TACA") and not compiled.test(b"TAC")
@@ -0,0 +1,74 @@
+import random
+import struct
+
+import pytest
+
+from algorithms.backwards_dawg_matching import backwards_dawg_matching, reversed_dawg
+from automata.automata import Automata
+from automata.compiled_dfa import FORMAT_VERSION, HEADER_SIZE, CompiledDFA
+from tests.helpers import cases, find_all
+
+
+def assert_same_dfa(loaded: CompiledDFA, original: CompiledDFA):
+    assert loaded.num_states == original.num_states
+    assert loaded.symbols == original.symbols
+    assert list(loaded.table) == list(original.table)
+    assert bytes(loaded.accepting) == bytes(original.accepting)
+    assert list(loaded.state_names) == list(original.state_names)
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_round_trip_of_pattern_dawgs(tmp_path, use_mmap):
+    for i, (text, pattern) in enumerate(cases(seed=24, count=30)):
+        for source in (pattern, pattern.encode()):
+            dawg = reversed_dawg(source)
+            path = tmp_path / f"dawg{i}.cdfa"
+            dawg.save(str(path))
+            loaded = CompiledDFA.load(str(path), use_mmap=use_mmap)
+            assert_same_dfa(loaded, dawg)
+            expected = [p + 1 for p in find_all(text, pattern)]
+            assert backwards_dawg_matching(source, text if isinstance(source, str) else text.encode(),
+                                           dawg_pr=loaded) == expected
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_round_trip_of_automata(tmp_path, use_mmap):
+    rng = random.Random(24)
+    names = ["inicio", "ñ-estado", "q2"]
+    edges = [(a, c, rng.choice(names)) for a in names for c in ["a", "ñ", "€"]]
+    dfa = Automata.from_edges(names, edges, "inicio", ["q2"], alphabet=["a", "ñ", "€"])
+    path = tmp_path / "dfa.cdfa"
+    dfa.save(str(path))
+    loaded = CompiledDFA.load(str(path), use_mmap=use_mmap)
+    assert_same_dfa(loaded, dfa.compile())
+    assert loaded.state_names[1] == "ñ-estado" and loaded.state_names[-1] == "q2"
+    for _ in range(50):
+        word = "".join(rng.choice("añ€") for _ in range(rng.randint(0, 6)))
+        assert loaded.test(word) == dfa.test(word)
+    assert "CompiledDFA(states=3" in repr(loaded)
+
+
+def test_rejects_corrupt_files(tmp_path):
+    path = tmp_path / "dfa.cdfa"
+    reversed_dawg("ACGT").save(str(path))
+    data = path.read_bytes()
+    bad = {
+        "empty": b"",
+        "short": data[:HEADER_SIZE - 1],
+        "magic": b"XXXX" + data[4:],
+        "version": data[:4] + struct.pack("<H", FORMAT_VERSION + 1) + data[6:],
+        "truncated": data[:-1],
+        "longer": data + b"\0",
+    }
+    for name, content in bad.items():
+        corrupt = tmp_path / f"{name}.cdfa"
+        corrupt.write_bytes(content)
+        for use_mmap in (True, False):
+            with pytest.raises(ValueError):
+                CompiledDFA.load(str(corrupt), use_mmap=use_mmap)
+
+
+def test_unsupported_symbols(tmp_path):
+    dfa = Automata.from_edges(["p"], [("p", ("a", 1), "p")], "p", ["p"])
+    with pytest.raises(ValueError):
+        dfa.save(str(tmp_path / "dfa.cdfa"))
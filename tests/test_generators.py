@@ -0,0 +1,70 @@
+import random
+
+import pytest
+
+from data import generators
+from data.generators import GENERATORS, generate, iter_fibonacci, write_corpus
+
+
+def fibonacci_word(n: int) -> bytes:
+    previous, word = b"a", b"ab"
+    while len(word) < n:
+        previous, word = word, word + previous
+    return word[:n]
+
+
+@pytest.mark.parametrize("block_size", [1, 5, 64, 2**20])
+def test_fibonacci_blocks_match_the_word(monkeypatch, block_size):
+    monkeypatch.setattr(generators, "BLOCK_SIZE", block_size)
+    for n in (0, 1, 2, 3, 8, 100, 1000):
+        blocks = list(iter_fibonacci(n))
+        assert b"".join(blocks) == fibonacci_word(n)
+        assert all(len(block) == block_size for block in blocks[:-1])
+    assert generate("fibonacci", 10, letters="xy") == b"xyxxyxyxxy"
+
+
+def test_markov_walk_is_the_same_with_and_without_numpy():
+    pytest.importorskip("numpy")
+    rng = random.Random(19)
+    rows = [bytes(rng.randrange(4) for _ in range(256)) for _ in range(4)]
+    walk = generators._markov_walker_numpy(rows)
+    for size in (1, 255, 256, 257, 5000):
+        randoms = rng.randbytes(size)
+        for state in range(4):
+            assert walk(randoms, state) == generators._markov_walk(rows, randoms, state)
+
+
+def test_markov_follows_the_transitions():
+    # Sin CG ni bases repetidas: ninguna base va seguida de sí misma ni C de G
+    transitions = [(0, 1, 1, 1), (1, 0, 0, 1), (1, 1, 0, 1), (1, 1, 1, 0)]
+    text = generate("markov_dna", 20000, seed=1, transitions=transitions)
+    assert set(text) <= set(b"ACGT")
+    for pair in (b"AA", b"CC", b"GG", b"TT", b"CG"):
+        assert pair not in text
+    with pytest.raises(ValueError):
+        generate("markov_dna", 10, transitions=[(1, 0, 0, 0)])
+
+
+@pytest.mark.parametrize("name", GENERATORS)
+def test_reproducible_and_prefix_consistent(monkeypatch, name, tmp_path):
+    monkeypatch.setattr(generators, "BLOCK_SIZE", 1000)
+    monkeypatch.setattr(generators, "MARKOV_SCAN_MIN", 100)
+    long = generate(name, 5500, seed=7)
+    assert len(long) == 5500 and long.isascii()
+    assert generate(name, 5500, seed=7) == long
+    for n in (0, 1, 999, 1000, 1001, 2500):
+        assert generate(name, n, seed=7) == long[:n]
+    path = tmp_path / "corpus.txt"
+    assert write_corpus(str(path), name, 5500, seed=7) == 5500
+    assert path.read_bytes() == long
+
+
+def test_errors():
+    with pytest.raises(ValueError):
+        generate("nope", 10)
+    with pytest.raises(ValueError):
+        generate("uniform", -1)
+    with pytest.raises(ValueError):
+        generate("uniform", 10, alphabet="ñ")
+    with pytest.raises(ValueError):
+        generate("periodic", 10, period="")
@@ -0,0 +1,69 @@
+import pytest
+
+from algorithms.backwards_dawg_matching import backwards_dawg_matching
+from algorithms.boyer_moore import VARIANTS, boyer_moore
+from algorithms.instrumented import (automata_test_instrumented, backwards_dawg_matching_instrumented,
+                                     boyer_moore_instrumented, count_operations,
+                                     kmp_search_instrumented)
+from algorithms.knuth_morris_pratt import kmp_search
+from automata.automata import Automata
+from tests.helpers import cases
+
+
+def test_kmp_matches_production():
+    for text, pattern in cases(seed=18):
+        result, counters = kmp_search_instrumented(text, pattern)
+        assert result == kmp_search(text, pattern)
+        assert counters.matches == len(result)
+        # Cada inspección avanza el texto o desplaza el patrón: a lo más 2n
+        assert counters.inspections <= 2 * len(text)
+
+
+@pytest.mark.parametrize("variant", VARIANTS)
+def test_boyer_moore_matches_production(variant):
+    for text, pattern in cases(seed=18):
+        result, counters = boyer_moore_instrumented(text, pattern, variant)
+        assert result == boyer_moore(text, pattern, variant=variant)
+        assert counters.matches == len(result)
+        # Una ventana por desplazamiento (Sunday no desplaza tras la última)
+        if variant in ("bad_character", "full"):
+            assert counters.verifications == counters.total_shifts
+        elif variant == "sunday":
+            assert counters.total_shifts <= counters.verifications <= counters.total_shifts + 1
+        else:
+            assert counters.matches <= counters.verifications <= counters.total_shifts
+    result, _ = boyer_moore_instrumented("ñandú ñandú", "ñandú", variant)
+    assert result == boyer_moore("ñandú ñandú", "ñandú", variant=variant) == [0, 6]
+
+
+def test_bdm_matches_production():
+    for text, pattern in cases(seed=18):
+        result, counters = backwards_dawg_matching_instrumented(pattern, text)
+        assert result == backwards_dawg_matching(pattern, text)
+        assert result == backwards_dawg_matching_instrumented(pattern, text.encode())[0]
+        if pattern and len(pattern) <= len(text):
+            # Las ventanas recorren todo el texto
+            assert sum(k * v for k, v in counters.shifts.items()) >= len(text) - len(pattern) + 1
+            # Toda ocurrencia se lee completa, y a lo más una vez por ventana
+            assert counters.matches <= counters.verifications <= counters.total_shifts
+    _, counters = backwards_dawg_matching_instrumented("AAA", "AAAAA")
+    assert counters.verifications == 3
+
+
+def test_counters_accumulate_and_export():
+    counters = count_operations("KMP", "AAAA", "AA")
+    assert counters.matches == 3 and counters.total_shifts == 3
+    data = counters.to_dict()
+    assert data["matches"] == 3 and data["shifts"] == 3 and data["shift_histogram"] == {"1": 3}
+    kmp_search_instrumented("AAAA", "AA", counters)
+    assert counters.matches == 6
+    with pytest.raises(ValueError):
+        count_operations("Nope", "A", "A")
+
+
+def test_automata_test_matches_production():
+    automata = Automata.from_edges(["s", "t"], [("s", "a", "t"), ("t", "b", "s")], "s", ["s"])
+    for string in ["", "ab", "aba", "abab", "b"]:
+        accepted, counters = automata_test_instrumented(automata, string)
+        assert accepted == automata.test(string)
+        assert counters.inspections <= len(string)
@@ -0,0 +1,83 @@
+import pytest
+
+from automata.automata import Automata
+from automata.lazy_dfa import LazyDFA
+from tests.helpers import cases, find_all
+
+
+def literal_nfa(pattern: str, alphabet: str) -> Automata:
+    """NFA (with an epsilon edge) for exactly 'pattern'."""
+    states = [f"q{i}" for i in range(len(pattern) + 2)]
+    edges = [(f"q{i}", c, f"q{i + 1}") for i, c in enumerate(pattern)]
+    edges.append((f"q{len(pattern)}", "ε", f"q{len(pattern) + 1}"))
+    return Automata.from_edges(states, edges, "q0", [states[-1]], alphabet=sorted(set(alphabet)))
+
+
+def test_search_matches_oracle():
+    for text, pattern in cases(seed=22):
+        lazy = LazyDFA(literal_nfa(pattern, "ABCGTNXYZ"))
+        m = len(pattern)
+        assert lazy.search(text) == [p + m - 1 for p in find_all(text, pattern)]
+
+
+def test_search_bytes_and_non_ascii():
+    lazy = LazyDFA(literal_nfa("ñA", "ñA"))
+    assert lazy.search("AñAñA") == [2, 4]
+    lazy = LazyDFA(literal_nfa("AC", "ACGT"))
+    assert lazy.search(b"ACGACAC") == [1, 4, 6]
+    assert lazy.search(memoryview(b"ACGACAC")) == [1, 4, 6]
+
+
+def test_bytes_are_not_read_as_latin_1():
+    lazy = LazyDFA(literal_nfa("ñA", "ñA"))
+    assert lazy.search(b"\xf1A\xf1A") == []
+    assert lazy.search("ñA".encode("latin-1")) == []
+
+
+@pytest.mark.parametrize("first", ["test", "search"])
+def test_test_and_search_share_the_cache(first):
+    # Los estados anclados y no anclados no deben compartir transiciones del caché
+    lazy = LazyDFA(literal_nfa("ab", "ab"))
+    calls = {"test": lambda: lazy.test("aab"), "search": lambda: lazy.search("aab")}
+    expected = {"test": False, "search": [2]}
+    second = "search" if first == "test" else "test"
+    assert calls[first]() == expected[first]
+    assert calls[second]() == expected[second]
+    assert calls[first]() == expected[first]
+
+
+def test_nullable_nfa_reports_only_non_empty_matches():
+    # (ab)*: acepta la cadena vacía, pero solo se reportan ocurrencias no vacías
+    nfa = Automata.from_edges(["s", "t"], [("s", "a", "t"), ("t", "b", "s")], "s", ["s"])
+    lazy = LazyDFA(nfa)
+    assert lazy.search("aabab") == [2, 4]
+    assert lazy.test("") and lazy.test("abab") and not lazy.test("aba")
+
+
+def test_small_cache_falls_back_to_nfa():
+    # (a|b)*a(a|b)^8: el DFA completo tiene 2^9 estados
+    k = 8
+    states = ["s"] + [f"q{i}" for i in range(k + 1)]
+    edges = [("s", "a", "s"), ("s", "b", "s"), ("s", "a", "q0")]
+    edges += [(f"q{i}", c, f"q{i + 1}") for i in range(k) for c in "ab"]
+    nfa = Automata.from_edges(states, edges, "s", [f"q{k}"])
+    text = "abbabaaabbbabaabbbaababbbaaab" * 20
+    expected = [i for i in range(k, len(text)) if text[i - k] == "a"]
+    lazy = LazyDFA(nfa, max_states=4, min_symbols_per_state=10)
+    assert lazy.search(text) == expected
+    assert lazy.stats()["fallbacks"] >= 1
+    assert lazy.stats()["states"] <= 4
+
+
+def test_result_modes():
+    lazy = LazyDFA(literal_nfa("A", "AC"))
+    assert lazy.search("ACAA", mode="count") == 3
+    assert lazy.search("CCC", mode="exists") is False
+    assert lazy.search("ACAA", mode="first_k", k=2) == [0, 2]
+
+
+def test_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        LazyDFA(Automata(states=[], alphabet=["a"]))
+    with pytest.raises(ValueError):
+        LazyDFA(literal_nfa("a", "a"), max_states=1)
@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+from automata.automata import Automata
+from tests.helpers import random_text
+
+
+def random_dfa(rng: random.Random, n: int, alphabet: str) -> Automata:
+    names = [f"q{i}" for i in range(n)]
+    edges = [(name, c, rng.choice(names)) for name in names for c in alphabet if rng.random() < 0.85]
+    finals = [name for name in names if rng.random() < 0.4]
+    return Automata.from_edges(names, edges, names[0], finals, alphabet=list(alphabet))
+
+
+def moore_classes(dfa: Automata) -> int:
+    """Clases de Myhill-Nerode no muertas, por refinamiento de Moore (oráculo cuadrático)."""
+    symbols = list(dfa.alphabet)
+    reachable = [dfa.initial_state]
+    seen = {dfa.initial_state.name}
+    for state in reachable:
+        for target in state.transitions.values():
+            if target.name not in seen:
+                seen.add(target.name)
+                reachable.append(target)
+    sink = None
+    def step(state, symbol):
+        target = state.transitions.get(symbol) if state is not None else None
+        return target.name if target is not None else sink
+    names = [s.name for s in reachable] + [sink]
+    by_name = {s.name: s for s in reachable}
+    block = {name: (by_name[name].is_accepting if name is not None else False) for name in names}
+    while True:
+        signature = {name: (block[name],) + tuple(block[step(by_name.get(name), c)] for c in symbols)
+                     for name in names}
+        ids = {}
+        refined = {name: ids.setdefault(signature[name], len(ids)) for name in names}
+        if len(ids) == len(set(block.values())):
+            break
+        block = refined
+    # La clase del sumidero agrupa a los estados muertos, que minimize() descarta
+    return len(set(block.values())) - 1
+
+
+def test_minimize_preserves_the_language_and_is_minimal():
+    rng = random.Random(5)
+    for _ in range(60):
+        dfa = random_dfa(rng, rng.randint(1, 9), "ab")
+        minimal = dfa.minimize()
+        for _ in range(30):
+            word = random_text(rng, rng.randint(0, 10), "ab")
+            assert minimal.test(word) == dfa.test(word)
+        expected = moore_classes(dfa)
+        # Un lenguaje vacío deja igual el estado inicial
+        assert len(minimal.states) == max(expected, 1)
+        assert len(minimal.minimize().states) == len(minimal.states)
+
+
+def test_report_counts_removed_states():
+    dfa = Automata.from_edges(["p", "q", "r", "u"], [("p", "a", "q"), ("q", "a", "r"), ("r", "a", "q"),
+                                                    ("u", "a", "p")],
+                              "p", ["q", "r"])
+    minimal, report = dfa.minimize(report=True)
+    assert report["states_before"] == 4
+    assert report["unreachable_removed"] == 1
+    assert report["states_after"] == len(minimal.states) == 2
+
+
+def test_minimize_needs_an_initial_state():
+    with pytest.raises(ValueError):
+        Automata(states=[], alphabet=["a"]).minimize()
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from algorithms.boyer_moore import boyer_moore
+from algorithms.packed_search import PackedPattern, packed_search
+from data.packed_dna import PackedDNA
+from tests.helpers import DNA, cases, find_all, periodic_text, random_text
+
+
+def test_round_trip_indexing_and_kmers():
+    rng = random.Random(15)
+    for n in (0, 1, 3, 4, 5, 31, 32, 33, 100):
+        text = random_text(rng, n)
+        packed = PackedDNA.from_str(text)
+        assert len(packed) == n and packed.to_str() == text and packed == text
+        assert PackedDNA.from_str(text.encode()) == packed
+        assert "".join(packed) == text
+        assert [packed[i] for i in range(-n, n)] == list(text * 2)
+        for i, k in [(0, min(n, 4)), (n // 3, min(n - n // 3, 32))]:
+            assert packed[i:i + k] == text[i:i + k]
+            assert packed.kmer(i, k) == PackedDNA.encode_kmer(text[i:i + k])
+        assert packed[::2] == text[::2]
+        assert bytes(packed.ascii_codes()[0:n]) == text.encode()
+    with pytest.raises(ValueError):
+        PackedDNA.from_str("ACGN")
+    with pytest.raises(ValueError):
+        PackedDNA.from_str("ACñ")
+    with pytest.raises(IndexError):
+        PackedDNA.from_str("AC")[2]
+
+
+def test_packed_search_matches_oracle():
+    for text, pattern in cases(seed=15, alphabets=(DNA,)):
+        packed = PackedDNA.from_str(text)
+        assert packed_search(packed, pattern) == find_all(text, pattern)
+        assert packed_search(packed, PackedDNA.from_str(pattern)) == find_all(text, pattern)
+        assert boyer_moore(packed, pattern) == find_all(text, pattern)
+
+
+def test_long_and_periodic_patterns():
+    rng = random.Random(16)
+    for text in [random_text(rng, 3000), periodic_text(3000, "AAC")]:
+        packed = PackedDNA.from_str(text)
+        for m in (1, 4, 5, 31, 32, 33, 100):
+            pattern = text[1000:1000 + m]
+            assert packed_search(packed, pattern, PackedPattern(pattern)) == find_all(text, pattern)
+
+
+def test_str_text_modes_and_empty():
+    assert packed_search("ACGTACGT", "GTA") == [2]
+    assert packed_search(PackedDNA.from_str("ACAC"), "AC", mode="count") == 2
+    assert packed_search(PackedDNA.from_str("ACAC"), "GG", mode="exists") is False
+    assert packed_search(PackedDNA.from_str("ACACAC"), "AC", mode="first_k", k=2) == [0, 2]
+    assert packed_search(PackedDNA(), "A") == []
+    assert packed_search(PackedDNA.from_str("AC"), "ACGT") == []
+    assert packed_search(PackedDNA.from_str("AC"), "") == []
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from algorithms.parallel_search import parallel_search, shard_bounds
+from tests.helpers import find_all, periodic_text, random_text
+
+BASE = {"KMP": 0, "BM": 0, "BDM": 1}
+
+
+def test_shard_bounds_cover_every_occurrence_once():
+    for n, m, shards in [(10, 3, 3), (100, 1, 7), (17, 5, 4), (5, 2, 8)]:
+        bounds = shard_bounds(n, m, shards)
+        assert bounds[0][0] == 0 and bounds[-1][1] == n
+        starts = [s for start, end in bounds for s in range(start, end - m + 1)]
+        assert sorted(starts) == list(range(n - m + 1))
+
+
+@pytest.mark.parametrize("algorithm", list(BASE))
+def test_matches_oracle_across_shard_boundaries(algorithm):
+    rng = random.Random(11)
+    texts = [random_text(rng, 5000, "AB"), periodic_text(4000, "AAC")]
+    for text in texts:
+        for pattern in ["ABA", "AACA", "A" * 7, text[2495:2510]]:
+            expected = [p + BASE[algorithm] for p in find_all(text, pattern)]
+            assert parallel_search(text, pattern, algorithm, workers=3) == expected
+
+
+def test_result_modes():
+    text = b"ACGT" * 1000
+    assert parallel_search(text, "GTAC", "KMP", workers=2, mode="count") == 999
+    assert parallel_search(text, "GTAC", "KMP", workers=2, mode="exists") is True
+    assert parallel_search(text, "TTTT", "KMP", workers=2, mode="exists") is False
+    assert parallel_search(text, "GTAC", "BM", workers=2, mode="first_k", k=3) == [2, 6, 10]
+    assert list(parallel_search(text, "GTAC", "BM", workers=2, mode="array")) == find_all(text, b"GTAC")
+
+
+def test_inputs():
+    data = b"ACGTACGT" * 50
+    assert parallel_search(memoryview(data), b"TACG", "KMP", workers=2) == find_all(data, b"TACG")
+    assert parallel_search(bytearray(data), "TACG", "KMP", workers=2) == find_all(data, b"TACG")
+    # Texto corto o patrón vacío: no se reparte
+    assert parallel_search("AC", "ACGT", "KMP", workers=2) == []
+    assert parallel_search("", "A", "KMP", workers=2) == []
+    with pytest.raises(ValueError):
+        parallel_search("ñACGT", "AC", "KMP", workers=2)
+    with pytest.raises(ValueError):
+        parallel_search("ACGT", "AC", "Nope")
+    with pytest.raises(TypeError):
+        parallel_search(["A"], "A", "KMP")
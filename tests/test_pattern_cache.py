@@ -0,0 +1,70 @@
+import pytest
+
+from algorithms.pattern_cache import ALGORITHMS, CompiledPattern, PatternCache, compile_pattern, pattern_cache
+from benchmark.registry import available_algorithms
+from tests.helpers import cases, find_all
+
+ONE_BASED = {"BDM", "BNDM"}
+
+
+def zero_based(algorithm: str, positions) -> list[int]:
+    shift = 1 if algorithm in ONE_BASED else 0
+    return [p - shift for p in positions]
+
+
+@pytest.mark.parametrize("algorithm", available_algorithms())
+def test_compiled_patterns_match_oracle(algorithm):
+    # Packed solo sirve para ADN
+    alphabets = (("ACGT",) if algorithm == "Packed" else ("AB", "ACGT", "ACGTNXYZ"))
+    for text, pattern in cases(seed=6, alphabets=alphabets):
+        if algorithm == "Packed" and not set(text + pattern) <= set("ACGT"):
+            continue
+        compiled = compile_pattern(pattern, algorithm)
+        assert zero_based(algorithm, compiled.search(text)) == find_all(text, pattern)
+        assert compiled.search(text, mode="count") == len(find_all(text, pattern))
+
+
+def test_cache_hits_and_misses():
+    cache = PatternCache()
+    first = cache.get("ACGT", "KMP")
+    assert cache.get("ACGT", "KMP") is first
+    assert cache.get("ACGT", "BM") is not first
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+    assert ("KMP", "ACGT") in cache and len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0 and cache.stats()["bytes"] == 0
+
+
+def test_cache_is_bounded_by_bytes_and_evicts_lru():
+    size = CompiledPattern("A" * 100, "KMP").nbytes
+    cache = PatternCache(max_bytes=2 * size)
+    cache.get("A" * 100, "KMP")
+    cache.get("C" * 100, "KMP")
+    cache.get("A" * 100, "KMP")  # A pasa a ser el más reciente
+    cache.get("G" * 100, "KMP")
+    assert ("KMP", "A" * 100) in cache and ("KMP", "G" * 100) in cache
+    assert ("KMP", "C" * 100) not in cache
+    assert cache.stats()["evictions"] == 1
+    assert cache.current_bytes <= cache.max_bytes
+
+
+def test_pattern_larger_than_the_budget_is_not_cached():
+    cache = PatternCache(max_bytes=10)
+    compiled = cache.get("ACGT" * 100, "BM")
+    assert compiled.search("ACGT" * 200, mode="count") == 101
+    assert len(cache) == 0
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        PatternCache(max_bytes=-1)
+    with pytest.raises(ValueError):
+        compile_pattern("ACGT", "Unknown", use_cache=False)
+
+
+def test_bytes_like_patterns_share_one_entry():
+    compiled = compile_pattern(bytearray(b"GAT"), "KMP")
+    assert compiled is compile_pattern(b"GAT", "KMP")
+    assert compiled.search(b"GATTAGAT") == [0, 5]
+    assert set(ALGORITHMS) >= set(available_algorithms())
+    assert pattern_cache.stats()["entries"] >= 1
@@ -0,0 +1,107 @@
+import random
+import re
+
+import pytest
+
+from algorithms.regex import (IUPAC_CODES, Regex, compile_regex, match_length_bounds, parse_regex,
+                              regex_search, required_factor)
+from tests.helpers import mmap_of, random_text
+
+
+def oracle(text, pattern: str) -> list[int]:
+    """Ends of the non-empty matches, trying every substring with re.fullmatch."""
+    compiled = re.compile(pattern)
+    return [j for j in range(len(text))
+            if any(compiled.fullmatch(text, i, j + 1) for i in range(j + 1))]
+
+
+def random_regex(rng: random.Random, alphabet: str, depth: int = 0) -> str:
+    choice = rng.random()
+    if depth >= 2 or choice < 0.35:
+        return "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 3)))
+    if choice < 0.5:
+        return "[" + "".join(rng.sample(alphabet, 2)) + "]"
+    if choice < 0.7:
+        return random_regex(rng, alphabet, depth + 1) + random_regex(rng, alphabet, depth + 1)
+    if choice < 0.85:
+        return f"({random_regex(rng, alphabet, depth + 1)}|{random_regex(rng, alphabet, depth + 1)})"
+    return f"({random_regex(rng, alphabet, depth + 1)}){rng.choice('*+?')}"
+
+
+def test_matches_re_with_and_without_prefilter():
+    rng = random.Random(23)
+    for _ in range(150):
+        alphabet = rng.choice(["AB", "ACGT"])
+        pattern = random_regex(rng, alphabet)
+        text = random_text(rng, rng.randint(0, 40), alphabet)
+        regex = Regex(pattern, alphabet=list(alphabet))
+        expected = oracle(text, pattern)
+        assert regex.search(text) == expected, pattern
+        assert regex.search(text, prefilter=False) == expected, pattern
+        assert regex.search(text.encode()) == expected, pattern
+        # Toda ocurrencia contiene el factor obligatorio
+        for j in expected:
+            assert any(regex.factor in text[i:j + 1] for i in range(j + 1)
+                       if re.fullmatch(pattern, text[i:j + 1]))
+
+
+def test_syntax():
+    text = "ACGTTGCA.A"
+    for pattern in ["G[CT]+", "A.", "[^T]A", "T*G", "(AC|TG)C?", "\\.A", "A(C|G)*T?"]:
+        regex = Regex(pattern, alphabet=list("ACGT."))
+        assert regex.search(text) == oracle(text, pattern), pattern
+    assert Regex("AC").matches("AC") and not Regex("AC").matches("ACA")
+    assert len(compile_regex("A|B").states) >= 2
+
+
+def iupac_to_re(pattern: str) -> str:
+    out = []
+    in_class = False
+    for c in pattern:
+        if c in "[]":
+            in_class = c == "["
+            out.append(c)
+        elif c in IUPAC_CODES:
+            out.append(IUPAC_CODES[c] if in_class else f"[{IUPAC_CODES[c]}]")
+        else:
+            out.append(c)
+    return "".join(out)
+
+
+def test_iupac():
+    rng = random.Random(24)
+    for pattern in ["RYN", "AC(GN)+T", "[RY]W", "SSS|KM"]:
+        as_re = iupac_to_re(pattern)
+        for _ in range(10):
+            text = random_text(rng, 60)
+            assert regex_search(text, pattern, iupac=True) == oracle(text, as_re)
+            assert Regex(pattern, iupac=True).search(text, prefilter=False) == oracle(text, as_re)
+
+
+def test_non_ascii_mmap_and_modes(tmp_path):
+    assert regex_search("ñandú ñu", "ñ[au]", alphabet=list("ñandú u")) == [1, 7]
+    data = b"ACGTACGTAC"
+    mm = mmap_of(tmp_path / "text", data)
+    try:
+        assert Regex("GT(AC)?").search(mm) == oracle(data.decode(), "GT(AC)?")
+    finally:
+        mm.close()
+    assert regex_search(data, "AC", mode="count") == 3
+    assert regex_search(data, "TT", mode="exists") is False
+    assert regex_search(data, "AC", mode="first_k", k=2) == [1, 5]
+
+
+def test_prefilter_helpers():
+    assert required_factor("ACGT(A|C)*TTG") == "ACGT"
+    assert required_factor("(ACGA|ACGT)") == "ACG"
+    assert required_factor("A*") == ""
+    assert match_length_bounds(parse_regex("A(CG)?T+")) == (2, float("inf"))
+    assert match_length_bounds(parse_regex("A(CG)?T")) == (2, 4)
+
+
+def test_errors():
+    for pattern in ["(AC", "AC)", "[AC", "*A", "A\\"]:
+        with pytest.raises(ValueError):
+            Regex(pattern, alphabet=list("ACGT"))
+    with pytest.raises(ValueError):
+        Regex("AX", alphabet=list("ACGT"))
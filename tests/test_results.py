@@ -0,0 +1,80 @@
+from array import array
+
+import pytest
+
+from algorithms.aho_corasick import aho_corasick
+from algorithms.pattern_cache import compile_pattern
+from algorithms.results import RESULT_MODES, check_mode, collect, collect_chunks
+from benchmark.registry import available_algorithms
+from tests.helpers import DNA, cases
+
+
+def counting(values, consumed: list):
+    for value in values:
+        consumed.append(value)
+        yield value
+
+
+def test_collect_modes():
+    assert collect(iter([1, 2, 3])) == [1, 2, 3]
+    assert collect(iter([1, 2, 3]), "array") == array("q", [1, 2, 3])
+    assert list(collect(iter([1, 2]), "iter")) == [1, 2]
+    assert collect(iter([1, 2, 3]), "count") == 3
+    assert collect(iter([]), "exists") is False
+    assert collect(iter([1, 2, 3]), "first_k", 2) == [1, 2]
+    assert collect(iter([1]), "first_k", 0) == []
+
+
+def test_exists_first_k_and_iter_are_lazy():
+    consumed = []
+    assert collect(counting(range(100), consumed), "exists") is True
+    assert consumed == [0]
+    consumed = []
+    assert collect(counting(range(100), consumed), "first_k", 3) == [0, 1, 2]
+    assert consumed == [0, 1, 2]
+    consumed = []
+    result = collect(counting(range(100), consumed), "iter")
+    assert consumed == [] and next(result) == 0
+
+
+def test_collect_chunks():
+    chunks = [[0, 1], [], [5]]
+    assert collect_chunks(iter(chunks)) == [0, 1, 5]
+    assert collect_chunks(iter(chunks), "count") == 3
+    assert collect_chunks(iter([[], []]), "exists") is False
+    assert collect_chunks(iter(chunks), "first_k", 2) == [0, 1]
+    assert collect_chunks(iter(chunks), "array") == array("q", [0, 1, 5])
+
+
+def test_check_mode():
+    for mode in RESULT_MODES:
+        check_mode(mode, 1)
+    with pytest.raises(ValueError):
+        check_mode("nope")
+    with pytest.raises(ValueError):
+        check_mode("first_k")
+    with pytest.raises(ValueError):
+        check_mode("first_k", -1)
+    with pytest.raises(ValueError):
+        check_mode("array", pairs=True)
+
+
+@pytest.mark.parametrize("algorithm", available_algorithms())
+def test_every_mode_agrees_with_list(algorithm):
+    for text, pattern in cases(seed=20, count=30, alphabets=(DNA,)):
+        compiled = compile_pattern(pattern, algorithm)
+        positions = compiled.search(text)
+        assert list(compiled.search(text, "array")) == positions
+        assert list(compiled.search(text, "iter")) == positions
+        assert compiled.search(text, "count") == len(positions)
+        assert compiled.search(text, "exists") == bool(positions)
+        for k in (0, 1, 3):
+            assert compiled.search(text, "first_k", k) == positions[:k]
+
+
+def test_pair_results():
+    pairs = aho_corasick("ACGTACGT", ["AC", "GT"])
+    assert aho_corasick("ACGTACGT", ["AC", "GT"], mode="count") == len(pairs)
+    assert list(aho_corasick("ACGTACGT", ["AC", "GT"], mode="iter")) == pairs
+    with pytest.raises(ValueError):
+        aho_corasick("ACGT", ["AC"], mode="array")
@@ -0,0 +1,118 @@
+import math
+
+import pytest
+
+from algorithms import selector
+from algorithms.selector import CostModel, estimate_alphabet_size, search, select_algorithm
+from data.packed_dna import PackedDNA
+from tests.helpers import DNA, cases, find_all, periodic_text
+
+# Coeficientes conocidos (en el orden de FEATURES) del reporte sintético
+TRUE_MODELS = {
+    "KMP": {"search": [-16.0, 0.0, 0.0], "preprocess": [-14.0, 1.0, 0.0]},
+    "BM": {"search": [-14.0, -0.5, -0.5], "preprocess": [-13.0, 0.2, 1.0]},
+    "BDM": {"search": [-13.0, -1.5, 0.3], "preprocess": [-16.0, 1.0, 0.0]},
+}
+
+
+def synthetic_report() -> dict:
+    results = []
+    for name, coefficients in TRUE_MODELS.items():
+        for n in (10**4, 10**6):
+            for m in (4, 16, 64, 256):
+                for sigma in (2, 4, 20):
+                    x = [1.0, math.log(m), math.log(sigma)]
+                    search_time = n * math.exp(sum(c * v for c, v in zip(coefficients["search"], x)))
+                    preprocess = math.exp(sum(c * v for c, v in zip(coefficients["preprocess"], x)))
+                    results.append({"algorithm": name, "text_length": n, "pattern_length": m,
+                                    "alphabet_size": sigma, "search": {"median": search_time},
+                                    "preprocess": {"median": preprocess}})
+    return {"config": {"alphabet": list(DNA)}, "created": "synthetic", "results": results}
+
+
+@pytest.fixture
+def model():
+    return CostModel.fit(synthetic_report())
+
+
+def test_fit_recovers_the_known_coefficients(model):
+    for name, coefficients in TRUE_MODELS.items():
+        fitted = model.algorithms[name]
+        for key in ("search", "preprocess"):
+            assert fitted[key] == pytest.approx(coefficients[key], abs=1e-6)
+        assert fitted["ranges"] == {"n": [10**4, 10**6], "m": [4, 256], "sigma": [2, 20]}
+        assert fitted["samples"] == 24
+    preprocess, search_time = model.predict("KMP", 1000, 8, 4)
+    assert search_time == pytest.approx(1000 * math.exp(-16))
+    assert preprocess == pytest.approx(8 * math.exp(-14))
+
+
+def test_constant_features_get_zero_coefficients():
+    report = synthetic_report()
+    report["results"] = [r for r in report["results"] if r["alphabet_size"] == 4]
+    for r in report["results"]:
+        del r["alphabet_size"]
+    fitted = CostModel.fit(report, algorithms=["BM"]).algorithms
+    assert list(fitted) == ["BM"] and fitted["BM"]["search"][2] == 0.0
+    with pytest.raises(ValueError):
+        CostModel.fit({"results": []})
+
+
+def test_selection_follows_the_model(model):
+    selector.pattern_cache.clear()
+    # Con el modelo sintético BDM gana con patrones largos y KMP con patrones cortos
+    text = "ACGT" * 5000
+    long = select_algorithm(text, "ACGT" * 16, model)
+    assert long.algorithm == "BDM" and set(long.estimates) == set(TRUE_MODELS)
+    assert "extrapolated" not in long.reason
+    short = select_algorithm(text, "A", model)
+    assert short.algorithm == "KMP"
+    assert "m=1 not in [4, 256]" in short.reason
+    # n fuera del rango medido también se informa
+    assert "n=10 not in [10000, 1000000]" in select_algorithm("ACGTACGTAC", "ACGT", model).reason
+    assert select_algorithm(text, "ACGT", model, candidates=["BM"]).algorithm == "BM"
+    with pytest.raises(ValueError):
+        select_algorithm(text, "ACGT", model, candidates=["Packed"])
+
+
+def test_search_is_zero_based_whatever_the_engine(model):
+    for text, pattern in cases(seed=25, count=30, alphabets=(DNA,)):
+        for name in TRUE_MODELS:
+            assert search(text, pattern, model=model, candidates=[name]) == find_all(text, pattern)
+    text = periodic_text(3000, "AAC")
+    assert search(text.encode(), "AACAAC", mode="count", model=model) == len(find_all(text, "AACAAC"))
+
+
+def test_vectorized_is_not_offered_for_non_ascii_text(model):
+    vectorized = dict(model.algorithms["BDM"], search=[-30.0, 0.0, 0.0])
+    fast = CostModel(dict(model.algorithms, Vectorized=vectorized))
+    text = "ñandúACGT" * 1000
+    for pattern in ["ACGT", "ñandú", "A" * 64]:
+        selection = select_algorithm(text, pattern, fast)
+        assert selection.algorithm != "Vectorized" and "Vectorized" not in selection.estimates
+        assert search(text, pattern, model=fast) == find_all(text, pattern)
+    assert select_algorithm(text.encode(), "ACGT", fast).algorithm == "Vectorized"
+    assert select_algorithm("ACGT" * 1000, "ACGT", fast).algorithm == "Vectorized"
+    assert "Vectorized" not in select_algorithm(PackedDNA.from_str("ACGT" * 10), "ACGT", fast).estimates
+
+
+def test_save_load_and_default_model(model, tmp_path):
+    path = tmp_path / "model.json"
+    model.save(str(path))
+    loaded = CostModel.load(str(path))
+    assert loaded.algorithms == model.algorithms
+    path.write_text('{"schema": "x"}')
+    with pytest.raises(ValueError):
+        CostModel.load(str(path))
+    try:
+        selector.set_default_model(model)
+        assert select_algorithm("ACGT" * 100, "ACGT" * 16).algorithm == "BDM"
+    finally:
+        selector.set_default_model(None)
+
+
+def test_estimate_alphabet_size():
+    assert estimate_alphabet_size("AACCA", "G") == 3
+    assert estimate_alphabet_size(b"AACCA", "ñ") == 4
+    assert estimate_alphabet_size(PackedDNA.from_str("ACGT"), "A") == 4
+    assert estimate_alphabet_size("", "") == 1
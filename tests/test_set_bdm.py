@@ -0,0 +1,42 @@
+import pytest
+
+from algorithms.set_backwards_dawg_matching import set_backwards_dawg_matching
+from tests.helpers import mmap_of, multi_oracle, pattern_sets
+
+
+def test_matches_oracle():
+    for text, patterns in pattern_sets(10):
+        result = set_backwards_dawg_matching(patterns, text)
+        assert sorted(result) == multi_oracle(text, patterns)
+        assert set_backwards_dawg_matching(patterns, text.encode()) == result
+
+
+def test_shared_prefixes_duplicates_and_non_ascii():
+    patterns = ["ACG", "ACGTA", "ACG", "CG"]
+    text = "TACGTACGTTACG"
+    assert sorted(set_backwards_dawg_matching(patterns, text)) == multi_oracle(text, patterns)
+    patterns = ["ña", "añ", "ñañ"]
+    assert sorted(set_backwards_dawg_matching(patterns, "ñañaña")) == multi_oracle("ñañaña", patterns)
+
+
+def test_patterns_longer_than_text_and_empty_inputs():
+    assert set_backwards_dawg_matching(["ACGT"], "AC") == []
+    assert set_backwards_dawg_matching(["A"], "") == []
+    assert set_backwards_dawg_matching([], "ACGT") == []
+    with pytest.raises(ValueError):
+        set_backwards_dawg_matching(["A", ""], "ACGT")
+
+
+def test_mmap_and_modes(tmp_path):
+    data = b"GATTACAGATTACA"
+    patterns = [b"ATTA", b"ACA", b"GAT"]
+    mm = mmap_of(tmp_path / "text", data)
+    try:
+        assert sorted(set_backwards_dawg_matching(patterns, mm)) == multi_oracle(data, patterns)
+    finally:
+        mm.close()
+    assert set_backwards_dawg_matching(patterns, data, mode="count") == 6
+    assert set_backwards_dawg_matching(patterns, b"TTTT", mode="exists") is False
+    assert len(set_backwards_dawg_matching(patterns, data, mode="first_k", k=2)) == 2
+    with pytest.raises(ValueError):
+        set_backwards_dawg_matching(patterns, data, mode="array")
@@ -0,0 +1,50 @@
+import io
+
+import pytest
+
+from algorithms.streaming import STREAM_ALGORITHMS, iter_chunks, stream_search
+from tests.helpers import cases, find_all
+
+# Posiciones base 1 de cada algoritmo (ver los docstrings)
+BASE = {"KMP": 0, "BM": 0, "BDM": 1}
+
+
+def split(text, size: int) -> list:
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("algorithm", list(STREAM_ALGORITHMS))
+@pytest.mark.parametrize("chunk_size", [1, 3, 7, 64])
+def test_stream_matches_oracle(algorithm, chunk_size):
+    for text, pattern in cases(seed=7, count=30):
+        expected = [p + BASE[algorithm] for p in find_all(text, pattern)]
+        assert list(stream_search(split(text, chunk_size), pattern, algorithm)) == expected
+        source = io.BytesIO(text.encode())
+        assert stream_search(source, pattern, algorithm, chunk_size=chunk_size, mode="list") == expected
+
+
+def test_non_ascii_chunks_and_byte_offsets():
+    text = "ñAñAA" * 3
+    assert list(stream_search(split(text, 2), "ñA")) == find_all(text, "ñA")
+    # Un archivo binario entrega offsets en bytes
+    data = text.encode()
+    assert list(stream_search(io.BytesIO(data), "ñA", chunk_size=3)) == find_all(data, "ñA".encode())
+
+
+def test_empty_pattern_and_empty_source():
+    assert list(stream_search(["ACGT"], "")) == []
+    assert list(stream_search([], "A", "BM")) == []
+    assert list(stream_search(io.BytesIO(b""), "A", "BDM")) == []
+
+
+def test_exists_stops_reading_early():
+    source = io.BytesIO(b"A" * 10 + b"C" * 1000)
+    assert stream_search(source, "AA", "KMP", chunk_size=4, mode="exists")
+    assert source.tell() <= 8
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        stream_search(["ACGT"], "A", "Unknown")
+    with pytest.raises(ValueError):
+        list(iter_chunks(io.BytesIO(b"A"), 0))
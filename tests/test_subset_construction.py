@@ -0,0 +1,60 @@
+import random
+
+import pytest
+
+from automata.automata import Automata
+from tests.helpers import random_text
+
+
+def random_nfa(rng: random.Random, n: int, alphabet: str) -> Automata:
+    names = [f"q{i}" for i in range(n)]
+    edges = [(rng.choice(names), rng.choice(alphabet + "ε"), rng.choice(names)) for _ in range(3 * n)]
+    finals = [name for name in names if rng.random() < 0.3]
+    return Automata.from_edges(names, edges, names[0], finals, alphabet=list(alphabet))
+
+
+def nfa_accepts(nfa: Automata, word: str) -> bool:
+    """Simulación directa del NFA con conjuntos de estados (oráculo)."""
+    current = nfa.epsilon_closure(nfa.initial_state)
+    for symbol in word:
+        moved = set()
+        for state in current:
+            moved |= set(state.get_nfa_transitions(symbol))
+        current = nfa.epsilon_closure(moved) if moved else set()
+    return any(state.is_accepting for state in current)
+
+
+@pytest.mark.parametrize("method", ["subset", "bitset"])
+def test_determinization_preserves_the_language(method):
+    rng = random.Random(4)
+    for _ in range(40):
+        nfa = random_nfa(rng, rng.randint(1, 7), "ab")
+        dfa = nfa.to_deterministic(method)
+        for _ in range(40):
+            word = random_text(rng, rng.randint(0, 8), "ab")
+            assert dfa.test(word) == nfa_accepts(nfa, word)
+
+
+def test_subset_and_bitset_build_the_same_number_of_states():
+    rng = random.Random(5)
+    for _ in range(30):
+        nfa = random_nfa(rng, rng.randint(1, 7), "abc")
+        # "subset" puede agregar un estado sumidero para el conjunto vacío
+        bitset = nfa.to_deterministic("bitset")
+        subset = nfa.to_deterministic("subset")
+        assert len(bitset.minimize().states) == len(subset.minimize().states)
+
+
+def test_exponential_blowup_is_built_exactly():
+    # (a|b)*a(a|b)^k necesita 2^(k+1) estados deterministas
+    k = 6
+    names = ["s"] + [f"q{i}" for i in range(k + 1)]
+    edges = [("s", "a", "s"), ("s", "b", "s"), ("s", "a", "q0")]
+    edges += [(f"q{i}", c, f"q{i + 1}") for i in range(k) for c in "ab"]
+    nfa = Automata.from_edges(names, edges, "s", [f"q{k}"])
+    assert len(nfa.to_deterministic("bitset").states) == 2 ** (k + 1)
+
+
+def test_unknown_method():
+    with pytest.raises(ValueError):
+        random_nfa(random.Random(0), 2, "a").to_deterministic("powerset")
@@ -0,0 +1,75 @@
+import random
+
+import pytest
+
+from algorithms.fm_index import FMIndex
+from algorithms.suffix_array import SuffixArray, suffix_array
+from data.packed_dna import PackedDNA
+from tests.helpers import cases, find_all, mmap_of, periodic_text, random_text
+
+INDEXES = {"SuffixArray": SuffixArray, "FMIndex": lambda text: FMIndex(text, occ_sample=4, sa_sample=3)}
+
+
+def test_suffix_array_is_sorted():
+    rng = random.Random(16)
+    for text in ["", "A", "banana", periodic_text(200), random_text(rng, 300, "AB"), "ñandú ñandú"]:
+        assert list(suffix_array(text)) == sorted(range(len(text)), key=lambda i: text[i:])
+    data = random_text(rng, 100, "AB").encode()
+    assert list(suffix_array(data)) == sorted(range(len(data)), key=lambda i: data[i:])
+
+
+@pytest.mark.parametrize("name", INDEXES)
+def test_count_and_locate_match_oracle(name):
+    texts = {}
+    for text, pattern in cases(seed=16):
+        if text not in texts:
+            texts[text] = INDEXES[name](text)
+        index = texts[text]
+        expected = find_all(text, pattern)
+        assert index.locate(pattern) == expected
+        assert index.count(pattern) == len(expected)
+        assert index.locate(pattern.encode()) == expected
+
+
+@pytest.mark.parametrize("name", INDEXES)
+def test_empty_pattern_count_and_locate_agree(name):
+    for text in ["", "A", "ACGT"]:
+        index = INDEXES[name](text)
+        assert index.locate("") == find_all(text, "")
+        assert index.count("") == len(index.locate("")) == len(text) + 1
+
+
+@pytest.mark.parametrize("name", INDEXES)
+def test_bytes_and_mmap(name, tmp_path):
+    data = b"GATTACAGATTACA"
+    mm = mmap_of(tmp_path / "text", data)
+    try:
+        index = INDEXES[name](mm)
+        assert index.locate(b"TTA") == index.locate("TTA") == find_all(data, b"TTA")
+        assert index.count("A") == data.count(b"A")
+        del index
+    finally:
+        mm.close()
+
+
+@pytest.mark.parametrize("name", INDEXES)
+def test_non_ascii_pattern_in_ascii_text(name):
+    # Los bytes UTF-32 de "Ā" (00 01 00 00) aparecen en el texto, el carácter no
+    index = INDEXES[name]("AB\x00\x01\x00\x00CD")
+    for pattern in ["Ā", "ñ", "Bñ"]:
+        assert index.locate(pattern) == []
+        assert index.count(pattern) == 0
+    assert SuffixArray(PackedDNA.from_str("ACGT")).locate("Cñ") == []
+
+
+def test_non_ascii():
+    text = "ñandú ñandú-ñu"
+    index = SuffixArray(text)
+    for pattern in ["ñ", "ñu", "andú", "€"]:
+        assert index.locate(pattern) == find_all(text, pattern)
+    encoded = text.encode()
+    assert FMIndex(encoded).locate("ñ") == find_all(encoded, "ñ".encode())
+    with pytest.raises(ValueError):
+        FMIndex(text)
+    with pytest.raises(ValueError):
+        FMIndex("ACGT", occ_sample=0)
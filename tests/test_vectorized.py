@@ -0,0 +1,54 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from algorithms import vectorized
+from algorithms.vectorized import as_uint8_array, vectorized_search
+from tests.helpers import cases, find_all, mmap_of, periodic_text, random_text
+
+
+def expected(text, pattern):
+    return find_all(text, pattern) if pattern else []
+
+
+def test_matches_oracle():
+    for text, pattern in cases(seed=14):
+        assert vectorized_search(text, pattern) == expected(text, pattern)
+        assert vectorized_search(text.encode(), pattern, block_size=7) == expected(text, pattern)
+
+
+def test_long_patterns_and_block_edges():
+    rng = random.Random(14)
+    for text in [random_text(rng, 4000, "AB"), periodic_text(4000, "AAC")]:
+        for m in (1, 7, 8, 9, 16, 17, 100, 257):
+            pattern = text[1500:1500 + m]
+            for block_size in (1, 13, 1000, 2**22):
+                assert vectorized_search(text, pattern, block_size=block_size) == find_all(text, pattern)
+
+
+def test_periodic_text_is_verified_in_slices(monkeypatch):
+    # Casi todas las posiciones pasan el filtro: la verificación va por tandas
+    monkeypatch.setattr(vectorized, "VERIFY_ROWS", 100)
+    text = b"A" * 5000
+    assert vectorized_search(text, b"A" * 200, mode="count") == 4801
+    assert vectorized_search(text, b"A" * 199 + b"C") == []
+    assert vectorized_search(text + b"C", b"A" * 30 + b"C") == [4970]
+
+
+def test_inputs_and_modes(tmp_path):
+    data = b"ACGTACGTAC" * 3
+    mm = mmap_of(tmp_path / "text", data)
+    try:
+        assert vectorized_search(mm, "GTACGTACGT") == find_all(data, b"GTACGTACGT")
+    finally:
+        mm.close()
+    assert vectorized_search(data, "AC", pattern_array=as_uint8_array(b"AC")) == find_all(data, b"AC")
+    assert vectorized_search(bytearray(data), b"AC", mode="count") == 9
+    assert vectorized_search(data, "TT", mode="exists") is False
+    assert vectorized_search(data, "AC", mode="first_k", k=2) == [0, 4]
+    assert vectorized_search("ñaña".encode(), "ña") == [0, 3]
+    assert vectorized_search("", "A") == []
+    with pytest.raises(ValueError):
+        vectorized_search("ñaña", "ña")